@@ -1,248 +1,1023 @@
-import pickle
-import tempfile
+import asyncio
+import atexit
+import multiprocessing
+import os
+import threading
 import traceback
-from contextlib import contextmanager
+from collections.abc import AsyncGenerator, Callable, Iterable, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar, Token
 from datetime import datetime
-from io import BytesIO
+from functools import partial
 from typing import IO, Any, Generator
+from weakref import WeakKeyDictionary
 
-import numpy as np
-import pandas as pd
 from loguru import logger
 
-from auto_ml_flow.client.exceptions import ClientServerError
+from auto_ml_flow.active_run import ActiveRun
+from auto_ml_flow.agent import (
+    AgentSystemMetricsMonitor,
+    RelaySession,
+    get_agent_address,
+    start_agent,
+)
+from auto_ml_flow.background import BackgroundLogger
+from auto_ml_flow.client.base import DEFAULT_POOL_SIZE, create_session
+from auto_ml_flow.client.exceptions import ClientError, ClientServerError
+from auto_ml_flow.client.spool import SpoolSession, SpoolUploader, WriteAheadLog
 from auto_ml_flow.client.v1 import AutoMLFlowClient
-from auto_ml_flow.client.v1.consts import Status
+from auto_ml_flow.client.v1.aio import AsyncAutoMLFlowClient
+from auto_ml_flow.client.v1.consts import DatasetFormat, Status
+from auto_ml_flow.client.v1.models.datasets import DatasetModel
 from auto_ml_flow.client.v1.models.experiments import ExperimentModel
-from auto_ml_flow.client.v1.models.predict import MetaAlgoFeatures
+from auto_ml_flow.client.v1.models.run_metrics import (
+    CreateRunMetricPayload,
+    CreateRunParamPayload,
+    CreateRunResultPayload,
+)
 from auto_ml_flow.client.v1.models.runs import RunModel
 from auto_ml_flow.client.v1.models.systems import CreateSystemPayload, SystemInfoModel
-from auto_ml_flow.handlers.dataset import add_dataset_to
+from auto_ml_flow.dataset_upload import DatasetUpload, UploadPolicy
+from auto_ml_flow.fan_in import TOKEN_ENV, Reduce, WorkerFanIn, WorkerLogger
+from auto_ml_flow.handlers import aio as aio_handlers
+from auto_ml_flow.handlers.dataset import (
+    link_existing_dataset,
+    spool_dataset_of,
+    upload_dataset_to,
+)
 from auto_ml_flow.handlers.experiment import get_or_create_experiment
+from auto_ml_flow.handlers.predict import get_training_time_features, predict_training_time
 from auto_ml_flow.handlers.run import run_ended, run_started
-from auto_ml_flow.handlers.run_metric import add_metric_to, add_param_to, add_result_to
+from auto_ml_flow.handlers.run_metric import (
+    add_metric_series_to,
+    add_metric_to,
+    add_metrics_to,
+    add_param_to,
+    add_params_to,
+    add_result_to,
+    add_results_to,
+)
 from auto_ml_flow.handlers.system import create_system
-from auto_ml_flow.metrics.monitor import SystemMetricsMonitor
-from auto_ml_flow.metrics.monitor.cpu import CPUMonitor
-from auto_ml_flow.metrics.monitor.disk import DiskMonitor
-from auto_ml_flow.metrics.monitor.memory import MemoryMonitor
-from auto_ml_flow.metrics.monitor.network import NetworkMonitor
+from auto_ml_flow.metrics.monitor import (
+    AsyncSystemMetricsMonitor,
+    SystemMetricsMonitor,
+    run_monitors,
+)
+from auto_ml_flow.metrics.monitor.process import ProcessMonitor
+from auto_ml_flow.metrics.monitor.shared import SharedMemorySystemMetricsMonitor
 from auto_ml_flow.metrics.system import get_system
+from auto_ml_flow.serializers import get_serializer
+from auto_ml_flow.serializers.hashing import get_hash_cache, hash_dataset
+from auto_ml_flow.sweep import (
+    DatasetSize,
+    Objective,
+    Params,
+    Trial,
+    TrialResult,
+    grid,
+    schedule,
+)
 
 
 class AutoMLFlow:
     _client: AutoMLFlowClient | None = None
-    _latest_run: RunModel | None = None
+    # Async clients by event loop: their connections belong to the loop which opened them
+    _aclients: "WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncAutoMLFlowClient]" = (
+        WeakKeyDictionary()
+    )
     _experiment: ExperimentModel | None = None
-    _monitor: SystemMetricsMonitor | None = None
-    _n_features: int = 0
-    _n_samples: int = 0
-    _system_info: SystemInfoModel | None = None
-    _predicted_time: float | None = None
+    _pending_experiment: Future[ExperimentModel] | None = None
+    _executor: ThreadPoolExecutor | None = None
+    # Arguments of `set_tracking_url`, so worker processes of sweeps track the same way
+    _tracking_config: dict[str, Any] = {}
+    # The run of the current thread or task, so runs in parallel threads, tasks and nested
+    # runs don't mix up
+    _active_run: ContextVar[ActiveRun | None] = ContextVar("auto_ml_flow_run", default=None)
+    # All runs in progress, by id
+    _runs: dict[int, ActiveRun] = {}
+    _runs_lock = threading.Lock()
+    # Tokens of the runs serving workers, and the token environment before the first one.
+    # The environment is process-wide, so it holds a token only while a single run serves.
+    _worker_tokens: list[str] = []
+    _worker_environ: str | None = None
 
     @classmethod
-    def set_tracking_url(cls, url: str) -> None:
-        cls._client = AutoMLFlowClient(base_url=url)
+    def set_tracking_url(
+        cls,
+        url: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        agent: bool = False,
+        spool: bool = False,
+    ) -> None:
+        """
+        Set the URL of the tracking server.
+
+        Args:
+            url (str): The URL of the tracking server.
+            pool_size (int): The maximum number of connections kept open to the server.
+            agent (bool): Send requests through the node-local agent, started unless it is
+                already running. All trackers of the host then share its connections, and
+                host metrics are sampled once for all their runs. Async methods and dataset
+                uploads still connect to the server directly.
+            spool (bool): Append write requests to a write-ahead log on disk instead of sending
+                them, and replay the log in the background. Runs go on while the server is
+                unreachable, and what is left is replayed at exit, or later with
+                `python -m auto_ml_flow.client.spool`. Dataset uploads and predictions are
+                still sent directly.
+        """
+        cls._tracking_config = {"url": url, "pool_size": pool_size, "agent": agent, "spool": spool}
+        relay_session = None
+        if agent:
+            address = get_agent_address(url)
+            start_agent(url, address)
+            relay_session = RelaySession(address, pool_size=pool_size)
+
+        spool_session = None
+        if spool:
+            spool_session = SpoolSession(
+                WriteAheadLog.create(), upstream=relay_session or create_session(pool_size)
+            )
+            uploader = SpoolUploader(spool_session, base_url=url)
+            uploader.start()
+            atexit.register(uploader.close)
+
+        cls._client = AutoMLFlowClient(
+            base_url=url, session=spool_session or relay_session, pool_size=pool_size
+        )
+        cls._aclients = WeakKeyDictionary()
+
+    @classmethod
+    def _get_aclient(cls) -> AsyncAutoMLFlowClient:
+        """The async client of the running event loop, created on first use."""
+        if cls._client is None:
+            raise ValueError("Tracking URL is not set. Use 'set_tracking_url' method to set it.")
+
+        loop = asyncio.get_running_loop()
+        client = cls._aclients.get(loop)
+        if client is None:
+            client = AsyncAutoMLFlowClient(
+                base_url=cls._tracking_config["url"], pool_size=cls._tracking_config["pool_size"]
+            )
+            cls._aclients[loop] = client
+
+        return client
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(thread_name_prefix="auto_ml_flow")
+
+        return cls._executor
 
     @classmethod
     def start_experiment(cls, name: str, description: str | None = None) -> None:
+        """
+        Start the experiment which the next runs belong to.
+
+        The experiment is looked up or created in the background, so this method returns at
+        once. Errors are raised by the next `start_run`.
+
+        Args:
+            name (str): The name of the experiment.
+            description (str | None): The description of the experiment if it is created.
+        """
         if cls._client is None:
             raise ValueError("Tracking URL is not set. Use 'set_tracking_url' method to set it.")
 
-        cls._experiment = get_or_create_experiment(
-            name=name, description=description, client=cls._client
+        cls._pending_experiment = cls._get_executor().submit(
+            get_or_create_experiment, name=name, description=description, client=cls._client
         )
 
+    @classmethod
+    def _get_experiment(cls) -> ExperimentModel | None:
+        # Runs may start in parallel threads, so the future is cleared only once it is resolved
+        pending = cls._pending_experiment
+        if pending is not None:
+            cls._experiment = pending.result()
+            cls._pending_experiment = None
+
+        return cls._experiment
+
     @classmethod
     @contextmanager
-    def start_run(cls, description: str) -> Generator[Any, Any, None]:
+    def start_run(
+        cls,
+        description: str,
+        *,
+        async_logging: bool = False,
+        flush_timeout: float = 10,
+        monitor_interval: float = 0.5,
+        monitor_flush_interval: float | None = 10,
+        monitor_aggregate: bool = False,
+        monitor_process: bool = False,
+        monitor_out_of_process: bool = False,
+        upload_policy: UploadPolicy = "wait",
+    ) -> Generator[Any, Any, None]:
+        """
+        Start a new run of the current experiment.
+
+        Args:
+            description (str): The description of the run.
+            async_logging (bool): Send metrics, params and results from a background thread
+                instead of blocking the caller on every `log_*` call.
+            flush_timeout (float): The maximum time (in seconds) to wait for queued records
+                to be sent when the run ends. Used only with `async_logging`.
+            monitor_interval (float): The interval (in seconds) at which system metrics are
+                sampled.
+            monitor_flush_interval (float | None): The interval (in seconds) at which sampled
+                system metrics are uploaded in one batch. If None, every sample is sent at once.
+            monitor_aggregate (bool): Upload aggregates of system metrics per flush window
+                instead of raw samples. Run averages are then used to predict training time.
+            monitor_process (bool): Also monitor resources used by the training process and
+                its children, not only by the whole host.
+            monitor_out_of_process (bool): Sample system metrics in a separate process, so
+                monitoring doesn't compete with training code for the GIL. Samples are always
+                uploaded as aggregates per flush window then. The process is spawned, and it
+                imports the main module of the calling script again, so the script must guard
+                its entry point with `if __name__ == "__main__":`.
+            upload_policy (UploadPolicy): What is done with dataset uploads still in progress
+                when the run ends: "wait" for them, "cancel" them, or "spool" them, i.e. write
+                them to the offline spool, to be sent by `python -m auto_ml_flow.client.spool`.
+                Errors of the uploads are logged, and don't fail the run.
+        """
         if cls._client is None:
             raise ValueError("Tracking URL is not set. Use 'set_tracking_url' method to set it.")
 
-        if cls._experiment is None:
+        executor = cls._get_executor()
+        # Collecting system info overlaps with the creation of the run
+        system_info = executor.submit(get_system)
+
+        experiment = cls._get_experiment()
+        if experiment is None:
             raise ValueError(
                 "Experiment not started."
                 "Start experiment with 'AutoMLFlow.start_experiment(\"My experiment for test\")'"
             )
 
-        system_info = cls._system_info = (
-            get_system()
-        )  # before run creation because it pretty hard task
-        run = run_started(
-            client=cls._client, experiment_id=cls._experiment.id, description=description
+        run = run_started(client=cls._client, experiment_id=experiment.id, description=description)
+
+        background = BackgroundLogger(client=cls._client) if async_logging else None
+        active = ActiveRun(run, background=background)
+        token = cls._enter_run(active)
+
+        # The training code starts as soon as the run exists, the system record is created and
+        # monitoring is started in the background
+        active.monitor_setup = executor.submit(
+            cls._start_monitor,
+            active,
+            system_info,
+            partial(
+                cls._create_monitor,
+                interval=monitor_interval,
+                flush_interval=monitor_flush_interval,
+                aggregate=monitor_aggregate,
+                process=monitor_process,
+                out_of_process=monitor_out_of_process,
+            ),
         )
 
-        start_time = datetime.now()
-        cls._latest_run = run
-
-        system = create_system(
-            CreateSystemPayload(run=run.id, **system_info.model_dump()), cls._client
-        )
-        cls._monitor = SystemMetricsMonitor(system=system.id, client=cls._client, interval=0.5)
-        cls._monitor.start()
+        if background is not None:
+            background.start()
 
         try:
             yield run
-            end_time = datetime.now()
-            duration = end_time - start_time
-            run_ended(
-                client=cls._client,
-                run_id=run.id,
-                status=Status.DONE,
-                duration=duration.total_seconds(),
-                predicted_time=cls._predicted_time,
-            )
+            cls._end_run(active, Status.DONE, flush_timeout, upload_policy)
         except Exception:
-            end_time = datetime.now()
-
-            duration = end_time - start_time
-
-            error_trace = traceback.format_exc()
-            run_ended(
-                client=cls._client,
-                run_id=run.id,
-                status=Status.FAILED,
-                duration=duration.total_seconds(),
-                traceback=error_trace,
-                predicted_time=cls._predicted_time,
+            cls._end_run(
+                active,
+                Status.FAILED,
+                flush_timeout,
+                upload_policy,
+                traceback=traceback.format_exc(),
             )
 
             raise
         finally:
-            cls._monitor.finish()
+            active.finish_uploads("cancel")
+            active.finish_monitor()
+            active.finish_background(flush_timeout)
+            cls._exit_run(active, token)
 
     @classmethod
-    def log_metric(cls, key: str, value: float) -> None:
-        if cls._client is None:
-            raise ValueError("Tracking URL is not set. Use 'set_tracking_url' method to set it.")
+    def _enter_run(cls, active: ActiveRun) -> Token[ActiveRun | None]:
+        with cls._runs_lock:
+            cls._runs[active.id] = active
+
+        return cls._active_run.set(active)
+
+    @classmethod
+    def _exit_run(cls, active: ActiveRun, token: Token[ActiveRun | None]) -> None:
+        cls._active_run.reset(token)
+        with cls._runs_lock:
+            cls._runs.pop(active.id, None)
+
+    @classmethod
+    @contextmanager
+    def serve_workers(
+        cls, reduce: Reduce | None = None, world_size: int | None = None
+    ) -> Generator[str, None, None]:
+        """
+        Let worker processes log to the current run.
+
+        Workers, e.g. of joblib, `multiprocessing` or distributed training, log through
+        `AutoMLFlow.attach_worker()`. Their records are sent to this process over a local
+        socket and uploaded in batches through its client, so the server sees one run.
+        Processes started inside the context find the run through environment, others need
+        the returned token. So do all workers while another run of this process serves
+        workers too, e.g. in a parallel thread: the environment is shared by both runs.
+
+        Args:
+            reduce (Reduce | None): If set, values of a metric logged by all workers at the
+                same step are merged into their mean or sum.
+            world_size (int | None): The number of workers values are reduced over. Defaults
+                to the workers connected at the time.
+
+        Returns:
+            str: The run token, passed to `attach_worker` of processes which don't inherit
+                the environment of this process.
+        """
+        client, active = cls._get_run()
+        fan_in = WorkerFanIn(active.id, client, reduce=reduce, world_size=world_size)
+        token = fan_in.start().encode()
+        with cls._runs_lock:
+            if not cls._worker_tokens:
+                cls._worker_environ = os.environ.get(TOKEN_ENV)
+            cls._worker_tokens.append(token)
+            cls._set_worker_environ()
+            if len(cls._worker_tokens) > 1:
+                logger.warning(
+                    "Several runs serve workers, their workers need the token to attach."
+                )
+        try:
+            yield token
+        finally:
+            with cls._runs_lock:
+                cls._worker_tokens.remove(token)
+                cls._set_worker_environ()
+
+            fan_in.close()
+
+    @classmethod
+    def _set_worker_environ(cls) -> None:
+        if len(cls._worker_tokens) == 1:
+            os.environ[TOKEN_ENV] = cls._worker_tokens[0]
+        elif cls._worker_tokens or cls._worker_environ is None:
+            # With several runs, workers would attach to whichever run was served last
+            os.environ.pop(TOKEN_ENV, None)
+        else:
+            os.environ[TOKEN_ENV] = cls._worker_environ
+
+    @staticmethod
+    def attach_worker(token: str | None = None) -> WorkerLogger:
+        """
+        Connect a worker process to the run served by `serve_workers` of its parent.
 
-        if not cls._latest_run:
+        Args:
+            token (str | None): The run token. Defaults to the token inherited through
+                environment.
+        """
+        return WorkerLogger(token)
+
+    @classmethod
+    def _get_active_run(cls) -> ActiveRun:
+        active = cls._active_run.get()
+        if active is None:
+            # Threads don't inherit the context of the thread which started them. With a
+            # single run in progress it is still clear which run they log to.
+            with cls._runs_lock:
+                if len(cls._runs) == 1:
+                    active = next(iter(cls._runs.values()))
+
+        if active is None:
             raise ValueError(
-                "Not found current run. "
-                "First need to call 'with AutoMLFlow.run_manager(experiment)'"
+                "Not found current run. First need to call 'with AutoMLFlow.start_run()'"
             )
 
-        add_metric_to(cls._latest_run, key, value, cls._client)
+        return active
 
     @classmethod
-    def log_param(cls, key: str, value: str) -> None:
+    def _get_run(cls) -> tuple[AutoMLFlowClient, ActiveRun]:
         if cls._client is None:
             raise ValueError("Tracking URL is not set. Use 'set_tracking_url' method to set it.")
 
-        if not cls._latest_run:
-            raise ValueError(
-                "Not found current run. "
-                "First need to call 'with AutoMLFlow.run_manager(experiment)'"
+        return cls._client, cls._get_active_run()
+
+    @classmethod
+    def current_run(cls) -> RunModel | None:
+        """The run which `log_*` methods log to in the current thread or task, if any."""
+        try:
+            return cls._get_active_run().run
+        except ValueError:
+            return None
+
+    @classmethod
+    def _create_monitor(
+        cls,
+        system: int,
+        *,
+        interval: float,
+        flush_interval: float | None,
+        aggregate: bool,
+        process: bool,
+        out_of_process: bool,
+    ) -> SystemMetricsMonitor:
+        if cls._client is None:
+            raise ValueError("Tracking URL is not set. Use 'set_tracking_url' method to set it.")
+
+        process_pid = os.getpid() if process else None
+        session = cls._client.session
+        if isinstance(session, RelaySession) and not out_of_process:
+            # Host metrics are sampled by the agent, only the training process is sampled here
+            return AgentSystemMetricsMonitor(
+                system=system,
+                client=cls._client,
+                session=session,
+                interval=interval,
+                flush_interval=flush_interval,
+                aggregate=aggregate,
+                monitors=[ProcessMonitor()] if process else [],
             )
 
-        add_param_to(cls._latest_run, key, value, cls._client)
+        if out_of_process:
+            return SharedMemorySystemMetricsMonitor(
+                system=system,
+                client=cls._client,
+                interval=interval,
+                flush_interval=flush_interval,
+                monitors=partial(run_monitors, process_pid=process_pid),
+            )
+
+        return SystemMetricsMonitor(
+            system=system,
+            client=cls._client,
+            interval=interval,
+            flush_interval=flush_interval,
+            aggregate=aggregate,
+            monitors=run_monitors(process_pid=process_pid),
+        )
 
     @classmethod
-    def log_result(cls, key: str, value: float) -> None:
+    def _start_monitor(
+        cls,
+        active: ActiveRun,
+        system_info: Future[SystemInfoModel],
+        create_monitor: Callable[[int], SystemMetricsMonitor],
+    ) -> SystemMetricsMonitor:
         if cls._client is None:
             raise ValueError("Tracking URL is not set. Use 'set_tracking_url' method to set it.")
 
-        if not cls._latest_run:
-            raise ValueError(
-                "Not found current run. "
-                "First need to call 'with AutoMLFlow.run_manager(experiment)'"
+        try:
+            active.system_info = system_info.result()
+            system = create_system(
+                CreateSystemPayload(run=active.id, **active.system_info.model_dump()),
+                cls._client,
             )
+            monitor = active.monitor = create_monitor(system.id)
+            monitor.start()
+        except Exception as e:
+            logger.error(f"Failed to start system metrics monitoring: {e!r}")
+            raise
 
-        add_result_to(cls._latest_run, key, value, cls._client)
+        return monitor
 
     @classmethod
-    def predict_training_time(cls) -> None:
+    def _end_run(
+        cls,
+        active: ActiveRun,
+        status: Status,
+        flush_timeout: float,
+        upload_policy: UploadPolicy = "wait",
+        traceback: str | None = None,
+    ) -> None:
         if cls._client is None:
             raise ValueError("Tracking URL is not set. Use 'set_tracking_url' method to set it.")
 
-        if not cls._latest_run:
+        # The last upload of system metrics overlaps with the end of the run
+        monitor_finished = cls._get_executor().submit(active.finish_monitor)
+        # Measured before waiting for dataset uploads, which the training didn't wait for
+        duration = datetime.now() - active.start_time
+        # Before the background logger is finished, as uploads report progress through it
+        active.finish_uploads(upload_policy)
+        active.finish_background(flush_timeout)
+        run_ended(
+            client=cls._client,
+            run_id=active.id,
+            status=status,
+            duration=duration.total_seconds(),
+            traceback=traceback,
+            predicted_time=active.predicted_time,
+        )
+        monitor_finished.result()
+
+    @classmethod
+    def log_metric(cls, key: str, value: float, step: int | None = None) -> None:
+        client, active = cls._get_run()
+        if active.background is not None:
+            payload = CreateRunMetricPayload(key=key, value=value, run=active.id, step=step)
+            active.background.log(payload)
+            return
+
+        add_metric_to(active.run, key, value, client, step=step)
+
+    @classmethod
+    def log_param(cls, key: str, value: str) -> None:
+        client, active = cls._get_run()
+        if active.background is not None:
+            payload = CreateRunParamPayload(key=key, value=value, run=active.id)
+            active.background.log(payload)
+            return
+
+        add_param_to(active.run, key, value, client)
+
+    @classmethod
+    def log_result(cls, key: str, value: float) -> None:
+        client, active = cls._get_run()
+        if active.background is not None:
+            payload = CreateRunResultPayload(key=key, value=value, run=active.id)
+            active.background.log(payload)
+            return
+
+        add_result_to(active.run, key, value, client)
+
+    @classmethod
+    def log_metrics(cls, metrics: dict[str, float], step: int | None = None) -> None:
+        client, active = cls._get_run()
+        cls._log_metrics_of(client, active, metrics, step=step)
+
+    @classmethod
+    def _log_metrics_of(
+        cls,
+        client: AutoMLFlowClient,
+        active: ActiveRun,
+        metrics: dict[str, float],
+        step: int | None = None,
+    ) -> None:
+        if active.background is not None:
+            for key, value in metrics.items():
+                payload = CreateRunMetricPayload(key=key, value=value, run=active.id, step=step)
+                active.background.log(payload)
+            return
+
+        add_metrics_to(active.run, metrics, client, step=step)
+
+    @classmethod
+    def log_metric_series(
+        cls, key: str, values: Sequence[float], steps: Sequence[int] | None = None
+    ) -> None:
+        client, active = cls._get_run()
+        if active.background is not None:
+            if steps is None:
+                steps = range(len(values))
+
+            for value, step in zip(values, steps, strict=True):
+                payload = CreateRunMetricPayload(key=key, value=value, run=active.id, step=step)
+                active.background.log(payload)
+            return
+
+        add_metric_series_to(active.run, key, values, client, steps=steps)
+
+    @classmethod
+    def log_params(cls, params: dict[str, str | float]) -> None:
+        client, active = cls._get_run()
+        if active.background is not None:
+            for key, value in params.items():
+                payload = CreateRunParamPayload(key=key, value=value, run=active.id)
+                active.background.log(payload)
+            return
+
+        add_params_to(active.run, params, client)
+
+    @classmethod
+    def log_results(cls, results: dict[str, float]) -> None:
+        client, active = cls._get_run()
+        if active.background is not None:
+            for key, value in results.items():
+                payload = CreateRunResultPayload(key=key, value=value, run=active.id)
+                active.background.log(payload)
+            return
+
+        add_results_to(active.run, results, client)
+
+    @classmethod
+    async def astart_experiment(cls, name: str, description: str | None = None) -> None:
+        client = cls._get_aclient()
+        cls._pending_experiment = None
+        cls._experiment = await aio_handlers.get_or_create_experiment(
+            name=name, description=description, client=client
+        )
+
+    @classmethod
+    async def _aget_experiment(cls) -> ExperimentModel | None:
+        # The experiment started by `start_experiment` is awaited without blocking the loop
+        pending = cls._pending_experiment
+        if pending is not None:
+            cls._experiment = await asyncio.wrap_future(pending)
+            cls._pending_experiment = None
+
+        return cls._experiment
+
+    @classmethod
+    @asynccontextmanager
+    async def astart_run(
+        cls,
+        description: str,
+        monitor_interval: float = 0.5,
+        monitor_flush_interval: float | None = 10,
+        monitor_aggregate: bool = False,
+    ) -> AsyncGenerator[RunModel, None]:
+        """
+        Start a new run of the current experiment without blocking the event loop.
+
+        Metrics of the run are logged with `alog_*` methods. Every task started inside the
+        context logs to this run, so many runs can be tracked from one event loop.
+
+        Args:
+            description (str): The description of the run.
+            monitor_interval (float): The interval (in seconds) at which system metrics are
+                sampled, in a background thread.
+            monitor_flush_interval (float | None): The interval (in seconds) at which sampled
+                system metrics are uploaded in one batch. If None, every sample is sent at once.
+            monitor_aggregate (bool): Upload aggregates of system metrics per flush window
+                instead of raw samples.
+        """
+        client = cls._get_aclient()
+        experiment = await cls._aget_experiment()
+        if experiment is None:
+            raise ValueError(
+                "Experiment not started."
+                "Start experiment with 'AutoMLFlow.start_experiment(\"My experiment for test\")'"
+            )
+
+        system_info, run = await asyncio.gather(
+            asyncio.to_thread(get_system),
+            aio_handlers.run_started(
+                client=client, experiment_id=experiment.id, description=description
+            ),
+        )
+
+        active = ActiveRun(run)
+        token = cls._enter_run(active)
+
+        # The run's code starts at once, while the system record is created
+        monitor_setup = asyncio.create_task(
+            cls._astart_monitor(
+                run,
+                system_info,
+                interval=monitor_interval,
+                flush_interval=monitor_flush_interval,
+                aggregate=monitor_aggregate,
+            )
+        )
+
+        try:
+            yield run
+            duration = datetime.now() - active.start_time
+            await aio_handlers.run_ended(
+                client=client,
+                run_id=run.id,
+                status=Status.DONE,
+                duration=duration.total_seconds(),
+            )
+        except Exception:
+            duration = datetime.now() - active.start_time
+            await aio_handlers.run_ended(
+                client=client,
+                run_id=run.id,
+                status=Status.FAILED,
+                duration=duration.total_seconds(),
+                traceback=traceback.format_exc(),
+            )
+
+            raise
+        finally:
+            try:
+                monitor = await monitor_setup
+                if monitor is not None:
+                    await monitor.finish()
+            finally:
+                # Later calls must not log to this run, even if monitoring failed
+                cls._exit_run(active, token)
+
+    @classmethod
+    async def _astart_monitor(
+        cls,
+        run: RunModel,
+        system_info: SystemInfoModel,
+        *,
+        interval: float,
+        flush_interval: float | None,
+        aggregate: bool,
+    ) -> AsyncSystemMetricsMonitor | None:
+        client = cls._get_aclient()
+        try:
+            system = await aio_handlers.create_system(
+                CreateSystemPayload(run=run.id, **system_info.model_dump()), client
+            )
+        except ClientError as e:
+            logger.error(f"Failed to start system metrics monitoring: {e!r}")
+            return None
+
+        monitor = AsyncSystemMetricsMonitor(
+            system=system.id,
+            client=client,
+            interval=interval,
+            flush_interval=flush_interval,
+            aggregate=aggregate,
+            monitors=run_monitors(),
+        )
+        monitor.start()
+
+        return monitor
+
+    @classmethod
+    def _get_arun(cls) -> tuple[AsyncAutoMLFlowClient, RunModel]:
+        client = cls._get_aclient()
+        active = cls._active_run.get()
+        if active is None:
             raise ValueError(
-                "Not found current run. "
-                "First need to call 'with AutoMLFlow.run_manager(experiment)'"
+                "Not found current run. First need to call 'async with AutoMLFlow.astart_run()'"
             )
 
-        if not cls._n_samples or not cls._n_features:
+        return client, active.run
+
+    @classmethod
+    async def alog_metric(cls, key: str, value: float, step: int | None = None) -> None:
+        client, run = cls._get_arun()
+        await aio_handlers.add_metric_to(run, key, value, client, step=step)
+
+    @classmethod
+    async def alog_metrics(cls, metrics: dict[str, float], step: int | None = None) -> None:
+        client, run = cls._get_arun()
+        await aio_handlers.add_metrics_to(run, metrics, client, step=step)
+
+    @classmethod
+    async def alog_metric_series(
+        cls, key: str, values: Sequence[float], steps: Sequence[int] | None = None
+    ) -> None:
+        client, run = cls._get_arun()
+        await aio_handlers.add_metric_series_to(run, key, values, client, steps=steps)
+
+    @classmethod
+    async def alog_param(cls, key: str, value: str) -> None:
+        client, run = cls._get_arun()
+        await aio_handlers.add_param_to(run, key, value, client)
+
+    @classmethod
+    async def alog_params(cls, params: dict[str, str | float]) -> None:
+        client, run = cls._get_arun()
+        await aio_handlers.add_params_to(run, params, client)
+
+    @classmethod
+    async def alog_result(cls, key: str, value: float) -> None:
+        client, run = cls._get_arun()
+        await aio_handlers.add_result_to(run, key, value, client)
+
+    @classmethod
+    async def alog_results(cls, results: dict[str, float]) -> None:
+        client, run = cls._get_arun()
+        await aio_handlers.add_results_to(run, results, client)
+
+    @classmethod
+    def predict_training_time(cls) -> None:
+        client, active = cls._get_run()
+        if not active.n_samples or not active.n_features:
             raise ValueError(
                 "Before predict training time "
                 "Need to log dataset 'with AutoMLFlow.log_dataset(n_features, n_samples, X)'"
             )
 
-        if not cls._system_info:
+        active.wait_monitor_setup()
+        if not active.system_info:
             raise ValueError("Some error happens. Failed to empty system info!")
-        # TODO: add handler
-
-        metrics = {}
-
-        monitors = [CPUMonitor(), DiskMonitor(), NetworkMonitor(), MemoryMonitor()]
-        for monitor in monitors:
-            monitor.collect_metrics()
-            metrics.update(monitor.metrics)
-
-        metrics.update(cls._system_info.model_dump())
-        features = MetaAlgoFeatures(
-            system_ram=metrics["ram"],
-            system_swap=metrics["swap"],
-            system_swap_available=metrics["swap_available"],
-            system_load_avg_last_min=metrics["load_avg_last_min"],
-            system_load_avg_last_5_min=metrics["load_avg_last_5_min"],
-            system_load_avg_last_15_min=metrics["load_avg_last_15_min"],
-            avg_memory_usage_megabytes=metrics["system_memory_usage_megabytes"],
-            avg_memory_usage_percentage=metrics["system_memory_usage_percentage"],
-            avg_cpu_utilization=metrics["cpu_utilization_percentage"],
-            avg_disk_usage_percentage=metrics["disk_usage_percentage"],
-            avg_disk_usage_megabytes=metrics["disk_usage_megabytes"],
-            avg_disk_available=metrics["disk_available_megabytes"],
-            sum_network_receive_megabytes=metrics["network_receive_megabytes"],
-            sum_network_transmit_megabytes=metrics["network_transmit_megabytes"],
-            dataset_n_samples=cls._n_samples,
-            dataset_n_features=cls._n_features,
+
+        aggregator = active.monitor.aggregator if active.monitor is not None else None
+        monitors = active.monitor.monitors if active.monitor is not None else None
+        features = get_training_time_features(
+            active.system_info, active.n_features, active.n_samples, aggregator, monitors
         )
         try:
-            cls._predicted_time = cls._client.meta_algos.predict(features)
+            active.predicted_time = predict_training_time(features, client)
         except ClientServerError:
             logger.warning("To less data for predict training time!")
         else:
-            logger.info(f"The current launch will be pre-completed after: {cls._predicted_time}")
+            logger.info(f"The current launch will be pre-completed after: {active.predicted_time}")
 
     @classmethod
-    def log_dataset(cls, n_features: int, n_samples: int, file: Any) -> None:
+    def log_dataset(
+        cls,
+        n_features: int,
+        n_samples: int,
+        file: Any,  # noqa: ANN401
+        dataset_format: DatasetFormat | str | None = None,
+        dedup: bool = True,
+        *,
+        background: bool = True,
+    ) -> DatasetUpload:
+        """
+        Upload the dataset of the current run.
+
+        The upload runs in the background, so the training, and `predict_training_time`,
+        which needs only the size of the dataset, start at once. Its progress and throughput
+        are logged as metrics of the run, and the run waits for it when it ends, according to
+        the `upload_policy` of `start_run`.
+
+        The content of the dataset is hashed first, and if the server already has a dataset
+        with the same content in the same format, e.g. logged by another trial of a sweep,
+        the run is linked to it instead. Digests of files are cached by path, modification
+        time and size.
+
+        Args:
+            n_features (int): The number of features of the dataset.
+            n_samples (int): The number of samples of the dataset.
+            file (Any): The dataset: a DataFrame, an array, or CSV content or path. It must
+                not change until the upload is done.
+            dataset_format (DatasetFormat | str | None): The format the dataset is uploaded
+                in. Defaults to `.npy` for arrays, Arrow IPC for DataFrames if pyarrow is
+                installed, and pickle otherwise. Use pickle for servers which don't read the
+                other formats.
+            dedup (bool): Look up the dataset by the hash of its content before uploading it.
+            background (bool): Upload the dataset in the background. If False, this method
+                returns once the dataset is uploaded, and raises its errors.
+
+        Returns:
+            DatasetUpload: The handle of the upload, whose `result()` is the dataset.
+        """
+        client, active = cls._get_run()
+
+        active.n_features = n_features
+        active.n_samples = n_samples
+
+        serializer = get_serializer(file, dataset_format)
+        hash_: str | None = None
+
+        def upload_dataset() -> DatasetModel:
+            nonlocal hash_
+            if dedup:
+                hash_ = hash_dataset(file, get_hash_cache(), cancelled=upload.cancel_requested)
+                upload.raise_if_cancelled()
+                linked = link_existing_dataset(active.run, hash_, client, serializer=serializer)
+                if linked is not None:
+                    return linked
+
+                upload.raise_if_cancelled()
+
+            return upload_dataset_to(
+                active.run,
+                n_features,
+                n_samples,
+                file,
+                client,
+                serializer=serializer,
+                hash_=hash_,
+                track=upload.track,
+            )
+
+        upload = DatasetUpload(
+            report=partial(cls._log_metrics_of, client, active),
+            steps=active.upload_steps,
+            spool=lambda: spool_dataset_of(
+                active.run, n_features, n_samples, file, serializer=serializer, hash_=hash_
+            ),
+        )
+        if not background:
+            upload.run(upload_dataset)
+            upload.result()
+
+            return upload
+
+        active.uploads.append(upload)
+        cls._get_executor().submit(upload.run, upload_dataset)
+
+        return upload
+
+    @classmethod
+    def sweep(
+        cls,
+        objective: Objective,
+        search_space: Mapping[str, Sequence[Any]] | Iterable[Params],
+        *,
+        n_jobs: int | None = None,
+        description: str = "Trial",
+        dataset_size: DatasetSize | None = None,
+        flush_timeout: float = 10,
+    ) -> list[TrialResult]:
+        """
+        Run every trial of the search space as a run of the current experiment.
+
+        Trials run in a pool of processes, so they don't share the GIL. The objective is
+        called with the params of the trial, logs its metrics with `log_*` methods like any
+        run, and returns its result. Results of all trials are uploaded from the calling
+        process through one background logger, so they are sent in batches.
+
+        The objective is passed to other processes, so it must be picklable, e.g. a function
+        of a module, and the calling script must guard its entry point with
+        `if __name__ == "__main__":`.
+
+        Args:
+            objective (Objective): The function training the model with the params of a
+                trial. It returns the value of the objective, logged as the "objective"
+                result, or a dict of results.
+            search_space (Mapping[str, Sequence[Any]] | Iterable[Params]): The values of every
+                param, all combinations of which are tried, or the params of every trial.
+            n_jobs (int | None): The number of trials run at once. Defaults to the number of
+                CPUs.
+            description (str): The description of the runs, followed by the trial number.
+            dataset_size (DatasetSize | None): The function returning the number of features
+                and samples a trial trains on. If set, the training time of every trial is
+                predicted, and the longest trials are started first.
+            flush_timeout (float): The maximum time (in seconds) to wait for the results to
+                be sent when all trials finish.
+
+        Returns:
+            list[TrialResult]: The results of the trials in the order of the search space.
+        """
         if cls._client is None:
             raise ValueError("Tracking URL is not set. Use 'set_tracking_url' method to set it.")
 
-        if not cls._latest_run:
+        experiment = cls._get_experiment()
+        if experiment is None:
             raise ValueError(
-                "Not found current run. "
-                "First need to call 'with AutoMLFlow.run_manager(experiment)'"
+                "Experiment not started."
+                "Start experiment with 'AutoMLFlow.start_experiment(\"My experiment for test\")'"
             )
 
-        # Convert various inputs to DataFrame
-        if isinstance(file, pd.DataFrame):
-            df = file
-        elif isinstance(file, np.ndarray):
-            df = pd.DataFrame(file)
-        elif isinstance(file, (str, bytes)):
-            try:
-                if isinstance(file, str):
-                    df = pd.read_csv(file)
-                else:
-                    df = pd.read_csv(BytesIO(file))
-            except Exception as e:
-                raise ValueError(f"Failed to convert file to DataFrame: {e}")
-        else:
-            raise ValueError("Unsupported file type")
+        params = grid(search_space) if isinstance(search_space, Mapping) else list(search_space)
+        trials = [
+            Trial(number, trial_params, dataset_size(trial_params) if dataset_size else None)
+            for number, trial_params in enumerate(params)
+        ]
+        if dataset_size is not None:
+            trials = schedule(trials, get_system(), cls._client)
+
+        background = BackgroundLogger(client=cls._client)
+        background.start()
+        results = []
+        try:
+            # Forking a process with running threads is not safe
+            with ProcessPoolExecutor(
+                max_workers=n_jobs,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=cls._init_sweep_worker,
+                initargs=(cls._tracking_config, experiment),
+            ) as pool:
+                futures = [
+                    pool.submit(cls._run_trial, objective, trial, description) for trial in trials
+                ]
+                for future in as_completed(futures):
+                    result = future.result()
+                    results.append(result)
+                    if result.error is not None:
+                        logger.error(f"Trial {result.number} failed: {result.error}")
+
+                    if result.run_id is None:
+                        continue
+
+                    for key, value in result.results.items():
+                        background.log(
+                            CreateRunResultPayload(key=key, value=value, run=result.run_id)
+                        )
+        finally:
+            # Results of the trials which finished are sent even if the pool breaks
+            background.finish(flush_timeout)
 
-        # Pickle the DataFrame
-        with tempfile.NamedTemporaryFile(delete=False, prefix="run_", suffix=".pkl") as temp_file:
-            temp_file_name = temp_file.name
-            pickle.dump(df, open(temp_file_name, "wb"))
-            # Ensure all data is written and set the file position to the beginning
-            temp_file.flush()
-            temp_file.seek(0)
+        return sorted(results, key=lambda result: result.number)
 
-            try:
-                add_dataset_to(cls._latest_run, n_features, n_samples, temp_file, cls._client)
-            finally:
-                temp_file.close()
+    @classmethod
+    def _init_sweep_worker(
+        cls, tracking_config: dict[str, Any], experiment: ExperimentModel
+    ) -> None:
+        cls.set_tracking_url(**tracking_config)
+        # The experiment is resolved once by the calling process and shared by all trials
+        cls._experiment = experiment
+
+    @classmethod
+    def _run_trial(cls, objective: Objective, trial: Trial, description: str) -> TrialResult:
+        run_id = None
+        try:
+            with cls.start_run(
+                f"{description} {trial.number}", async_logging=True, monitor_process=True
+            ) as run:
+                run_id = run.id
+                _, active = cls._get_run()
+                active.predicted_time = trial.predicted_time
+                if trial.dataset_size is not None:
+                    active.n_features, active.n_samples = trial.dataset_size
+
+                cls.log_params(
+                    {
+                        key: value if isinstance(value, (int, float)) else str(value)
+                        for key, value in trial.params.items()
+                    }
+                )
+                value = objective(dict(trial.params))
+        # A failed trial is reported, and doesn't stop the other trials of the sweep
+        except Exception:  # noqa: BLE001
+            return TrialResult(trial.number, trial.params, run_id, {}, traceback.format_exc())
+
+        if isinstance(value, Mapping):
+            results = {key: float(result) for key, result in value.items()}
+        else:
+            results = {"objective": float(value)}
 
-        cls._n_features = n_features
-        cls._n_samples = n_samples
+        return TrialResult(trial.number, trial.params, run_id, results)
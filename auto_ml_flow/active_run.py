@@ -0,0 +1,75 @@
+"""State of a run in progress, kept apart from the state of other runs."""
+
+import itertools
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from auto_ml_flow.background import BackgroundLogger
+from auto_ml_flow.client.v1.models.runs import RunModel
+from auto_ml_flow.dataset_upload import DatasetUpload, UploadPolicy, finish_uploads
+from auto_ml_flow.metrics.monitor import SystemMetricsMonitor
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from auto_ml_flow.client.v1.models.predict import MetaAlgoPredictions
+    from auto_ml_flow.client.v1.models.systems import SystemInfoModel
+
+
+class ActiveRun:
+    """Handle of a started run and of everything that tracks it."""
+
+    def __init__(self, run: RunModel, background: BackgroundLogger | None = None) -> None:
+        """
+        Initialize the handle.
+
+        Args:
+            run (RunModel): The run created on the server.
+            background (BackgroundLogger | None): The logger sending the run's records from a
+                background thread. If None, records are sent at once.
+        """
+        self.run = run
+        self.background = background
+        self.start_time = datetime.now()
+        self.system_info: SystemInfoModel | None = None
+        self.monitor: SystemMetricsMonitor | None = None
+        # Set while the system record is created and monitoring is started in the background
+        self.monitor_setup: Future[SystemMetricsMonitor] | None = None
+        self.n_features = 0
+        self.n_samples = 0
+        self.predicted_time: MetaAlgoPredictions | None = None
+        # Dataset uploads running in the background, and the steps they report progress at
+        self.uploads: list[DatasetUpload] = []
+        self.upload_steps = itertools.count()
+
+    @property
+    def id(self) -> int:
+        """The id of the run."""
+        return self.run.id
+
+    def wait_monitor_setup(self) -> SystemMetricsMonitor | None:
+        """Wait until the system record is created and monitoring is started."""
+        if self.monitor_setup is None or self.monitor_setup.exception() is not None:
+            return None
+
+        return self.monitor_setup.result()
+
+    def finish_monitor(self) -> None:
+        # Taken first, so monitoring is finished once when the run ends and in `finally`
+        setup, self.monitor_setup = self.monitor_setup, None
+        if setup is None or setup.exception() is not None:
+            return
+
+        setup.result().finish()
+
+    def finish_uploads(self, policy: UploadPolicy) -> None:
+        # Taken first, so uploads are finished once when the run ends and in `finally`
+        uploads, self.uploads = self.uploads, []
+        finish_uploads(uploads, policy)
+
+    def finish_background(self, timeout: float) -> None:
+        if self.background is None:
+            return
+
+        self.background.finish(timeout)
+        self.background = None
@@ -0,0 +1,616 @@
+"""
+Node-local agent relaying all trackers of the host to the tracking server.
+
+Trackers talk to the agent over a UNIX socket instead of opening their own connections. The
+agent keeps one pooled connection to the server, merges batches of run records sent by many
+trackers at once into one request, and samples host metrics once for all runs of the host.
+
+Run the agent with `python -m auto_ml_flow.agent --url <tracking url>`, or let
+`AutoMLFlow.set_tracking_url(url, agent=True)` start it.
+
+The socket is in a directory only the user can access, and both ends authenticate each other
+with a key written next to it, since messages are pickled.
+"""
+
+import argparse
+import contextlib
+import fcntl
+import hashlib
+import json
+import os
+import queue
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from datetime import UTC, datetime
+from http import HTTPStatus
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from typing import Any
+from urllib.parse import urljoin, urlparse
+
+import requests
+from loguru import logger
+
+from auto_ml_flow.client.base import DEFAULT_POOL_SIZE, create_session
+from auto_ml_flow.client.v1 import AutoMLFlowClient
+from auto_ml_flow.metrics.monitor import SystemMetricsMonitor, run_monitors
+from auto_ml_flow.metrics.monitor.base import BaseMetricsMonitor
+
+# Batch endpoints taking a JSON list and returning one created record per item, in order.
+# Concurrent requests to them are merged into one.
+COALESCED_PATHS = (
+    "/api/v1/run-metrics/batch/",
+    "/api/v1/run-params/batch/",
+    "/api/v1/run-results/batch/",
+)
+
+# Reply of the agent to a request: status code, headers and content of the response
+Reply = tuple[int, dict[str, str], bytes]
+
+
+def get_agent_address(url: str) -> Path:
+    """The socket of the agent relaying to the tracking server, one per user and server."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    socket_dir = (
+        Path(runtime_dir) / "auto_ml_flow"
+        if runtime_dir
+        else Path(f"/tmp/auto_ml_flow-{os.getuid()}")  # noqa: S108
+    )
+    name = hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
+
+    return socket_dir / f"{name}.sock"
+
+
+def _check_private(path: Path, is_dir: bool) -> None:
+    """Check that the path belongs to the current user, and that no one else can access it."""
+    info = path.lstat()
+    is_kind = stat.S_ISDIR(info.st_mode) if is_dir else stat.S_ISREG(info.st_mode)
+    if not is_kind or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(
+            f"{path} must belong to the current user, and other users must not access it."
+        )
+
+
+def _make_private_dir(path: Path) -> None:
+    # In /tmp another user could create the directory first, so an existing one is checked
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    _check_private(path, is_dir=True)
+
+
+def _authkey_path(address: Path) -> Path:
+    return address.with_suffix(".key")
+
+
+def _write_authkey(address: Path) -> bytes:
+    """Write a new key of the agent, readable only by the current user."""
+    authkey = os.urandom(32)
+    # Created with mode 0600, and replaced atomically, so a key is never read half-written
+    with tempfile.NamedTemporaryFile("wb", dir=address.parent, delete=False) as file:
+        file.write(authkey)
+
+    Path(file.name).replace(_authkey_path(address))
+
+    return authkey
+
+
+def _read_authkey(address: Path) -> bytes | None:
+    """The key of the running agent, or None if no agent was started."""
+    path = _authkey_path(address)
+    try:
+        _check_private(address.parent, is_dir=True)
+        _check_private(path, is_dir=False)
+    except FileNotFoundError:
+        return None
+
+    return path.read_bytes()
+
+
+def _connect(address: Path) -> Connection | None:
+    authkey = _read_authkey(address)
+    if authkey is None:
+        return None
+
+    try:
+        return Client(str(address), family="AF_UNIX", authkey=authkey)
+    except (OSError, AuthenticationError):
+        return None
+
+
+def _json_post(session: requests.Session, url: str) -> Callable[[list[Any]], Reply]:
+    def post(items: list[Any]) -> Reply:
+        resp = session.post(url, json=items, verify=False, timeout=100)
+
+        return resp.status_code, dict(resp.headers), resp.content
+
+    return post
+
+
+class _Coalescer:
+    """
+    Sender of requests to one batch endpoint, merging the requests waiting in the queue.
+
+    While one merged request is in flight, the next requests queue up and are sent together,
+    so the more trackers write at once, the fewer requests reach the server.
+    """
+
+    def __init__(self, send: Callable[[list[Any]], Reply], max_batch_size: int = 5000) -> None:
+        self.send = send
+        self.max_batch_size = max_batch_size
+        self._queue: queue.Queue[tuple[list[Any], Future[Reply]]] = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, items: list[Any]) -> Future[Reply]:
+        future: Future[Reply] = Future()
+        self._queue.put((items, future))
+
+        return future
+
+    def _run(self) -> None:
+        while True:
+            waiting = [self._queue.get()]
+            size = len(waiting[0][0])
+            while size < self.max_batch_size and not self._queue.empty():
+                waiting.append(self._queue.get_nowait())
+                size += len(waiting[-1][0])
+
+            try:
+                self._send_merged(waiting, size)
+            except Exception as e:  # noqa: BLE001
+                # Senders wait for their futures, so none may be left pending
+                for _, future in waiting:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _send_merged(self, waiting: list[tuple[list[Any], Future[Reply]]], size: int) -> None:
+        status, headers, content = self.send([item for items, _ in waiting for item in items])
+        if HTTPStatus.BAD_REQUEST <= status < HTTPStatus.INTERNAL_SERVER_ERROR and len(waiting) > 1:
+            # One sender's invalid item fails the merged request, so every sender gets the
+            # reply to its own items instead
+            for items, future in waiting:
+                self._send_alone(items, future)
+            return
+
+        created = json.loads(content) if status < HTTPStatus.BAD_REQUEST else None
+        if not isinstance(created, list) or len(created) != size:
+            # Errors are reported to every sender of the merged request
+            for _, future in waiting:
+                future.set_result((status, headers, content))
+            return
+
+        start = 0
+        for items, future in waiting:
+            part = created[start : start + len(items)]
+            start += len(items)
+            future.set_result((status, headers, json.dumps(part).encode()))
+
+    def _send_alone(self, items: list[Any], future: Future[Reply]) -> None:
+        try:
+            future.set_result(self.send(items))
+        except Exception as e:  # noqa: BLE001
+            future.set_exception(e)
+
+
+class HostMetricsMonitor(SystemMetricsMonitor):
+    """Monitor sampling host metrics once, and uploading them for every attached system."""
+
+    def __init__(
+        self,
+        client: AutoMLFlowClient,
+        interval: float = 0.5,
+        flush_interval: float = 10,
+        monitors: list[BaseMetricsMonitor] | None = None,
+    ) -> None:
+        """
+        Initialize the host metrics monitor.
+
+        Args:
+            interval (float): The interval (in seconds) at which to collect metrics.
+            flush_interval (float): The interval (in seconds) at which the samples of all
+                systems are uploaded in one batch.
+            monitors (list[BaseMetricsMonitor] | None): The monitors to sample. Defaults to
+                `run_monitors()`.
+        """
+        # Samples are uploaded for the attached systems instead of one system
+        super().__init__(
+            0,
+            client,
+            interval=interval,
+            flush_interval=flush_interval,
+            buffer_size=100_000,
+            monitors=run_monitors() if monitors is None else monitors,
+        )
+        self.systems: set[int] = set()
+        self._systems_lock = threading.Lock()
+
+    def attach(self, system: int) -> None:
+        with self._systems_lock:
+            self.systems.add(system)
+
+    def detach(self, system: int) -> None:
+        with self._systems_lock:
+            self.systems.discard(system)
+
+    def collect_metrics(self) -> None:
+        with self._systems_lock:
+            systems = list(self.systems)
+
+        if not systems:
+            return
+
+        timestamp = datetime.now(UTC)
+        readings: dict[str, float] = {}
+        for monitor in self.monitors:
+            monitor.collect_metrics()
+            readings.update(monitor.metrics)
+
+            for system in systems:
+                model = monitor.to_model(system).model_copy(update={"created_at": timestamp})
+                self._buffer.append((monitor.stats_name, model))
+
+        self.scheduler.observe(list(readings.values()))
+
+
+class RelayAgent:
+    def __init__(
+        self,
+        url: str,
+        address: Path,
+        *,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        monitor_interval: float = 0.5,
+        monitor_flush_interval: float = 10,
+        idle_timeout: float = 60,
+    ) -> None:
+        """
+        Initialize the agent.
+
+        Args:
+            url (str): The URL of the tracking server.
+            address (Path): The UNIX socket trackers connect to.
+            pool_size (int): The maximum number of connections kept open to the server.
+            monitor_interval (float): The interval (in seconds) at which host metrics are
+                sampled.
+            monitor_flush_interval (float): The interval (in seconds) at which host metrics
+                of all runs are uploaded in one batch.
+            idle_timeout (float): The time (in seconds) the agent keeps running without
+                connected trackers.
+        """
+        self.url = url
+        self.address = address
+        self.idle_timeout = idle_timeout
+        self.client = AutoMLFlowClient(base_url=url, pool_size=pool_size)
+        self.monitor = HostMetricsMonitor(
+            self.client, interval=monitor_interval, flush_interval=monitor_flush_interval
+        )
+        self._coalescers = {
+            path: _Coalescer(_json_post(self.client.session, urljoin(url, path)))
+            for path in COALESCED_PATHS
+        }
+        self._connections = 0
+        self._idle_since = time.monotonic()
+        self._lock = threading.Lock()
+        self._shutdown_event = threading.Event()
+
+    def serve(self) -> None:
+        """Serve trackers until the agent is idle for `idle_timeout`."""
+        _make_private_dir(self.address.parent)
+        with self.address.with_suffix(".lock").open("w") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                logger.info(f"Another agent already serves {self.address}.")
+                return
+
+            # The socket of an agent which didn't exit cleanly
+            self.address.unlink(missing_ok=True)
+            authkey = _write_authkey(self.address)
+            listener = Listener(str(self.address), family="AF_UNIX", authkey=authkey)
+            logger.info(f"Relaying to {self.url} on {self.address}.")
+
+            self.monitor.start()
+            watchdog = threading.Thread(target=self._watch_idle, daemon=True)
+            watchdog.start()
+            try:
+                self._accept(listener)
+            finally:
+                listener.close()
+                self.monitor.finish()
+
+    def _accept(self, listener: Listener) -> None:
+        while not self._shutdown_event.is_set():
+            try:
+                conn = listener.accept()
+            except (OSError, AuthenticationError) as e:
+                logger.warning(f"Failed to accept a tracker: {e!r}")
+                continue
+
+            if self._shutdown_event.is_set():
+                conn.close()
+                return
+
+            with self._lock:
+                self._connections += 1
+
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _watch_idle(self) -> None:
+        while not self._shutdown_event.wait(1):
+            with self._lock:
+                idle = self._connections == 0 and not self.monitor.systems
+                if not idle:
+                    self._idle_since = time.monotonic()
+                elif time.monotonic() - self._idle_since > self.idle_timeout:
+                    self._shutdown_event.set()
+
+        logger.info("No trackers connected, the agent exits.")
+        # Wake up the listener blocked in `accept`
+        conn = _connect(self.address)
+        if conn is not None:
+            conn.close()
+
+    def _serve(self, conn: Connection) -> None:
+        # Systems attached through this connection, detached if the tracker dies without
+        # detaching them
+        attached: set[int] = set()
+        try:
+            while True:
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    return
+
+                conn.send(self._handle(message, attached))
+        finally:
+            conn.close()
+            for system in attached:
+                self.monitor.detach(system)
+
+            with self._lock:
+                self._connections -= 1
+
+    def _handle(self, message: tuple[Any, ...], attached: set[int]) -> tuple[Any, ...]:
+        kind, *args = message
+        if kind == "attach":
+            self.monitor.attach(args[0])
+            attached.add(args[0])
+            return ("ok",)
+
+        if kind == "detach":
+            self.monitor.detach(args[0])
+            attached.discard(args[0])
+            return ("ok",)
+
+        method, url, kwargs = args
+        try:
+            return ("response", *self._forward(method, url, kwargs))
+        except Exception as e:  # noqa: BLE001
+            return ("error", repr(e))
+
+    def _forward(self, method: str, url: str, kwargs: dict[str, Any]) -> Reply:
+        path = urlparse(url).path
+        if method == "POST" and path in self._coalescers and isinstance(kwargs.get("json"), list):
+            return self._coalescers[path].submit(kwargs["json"]).result()
+
+        resp = self.client.session.request(method, url, verify=False, **kwargs)
+
+        return resp.status_code, dict(resp.headers), resp.content
+
+
+class RelaySession(requests.Session):
+    """
+    Session sending requests through the agent instead of connecting to the server.
+
+    Streamed bodies, e.g. of dataset uploads, are sent to the server directly, since they
+    would have to be read into memory to be passed to the agent.
+    """
+
+    def __init__(self, address: Path, pool_size: int = DEFAULT_POOL_SIZE) -> None:
+        super().__init__()
+        self.address = address
+        self.pool_size = pool_size
+        # A connection is not safe to share between threads, so every thread opens its own
+        self._local = threading.local()
+        self._direct: requests.Session | None = None
+        self._direct_lock = threading.Lock()
+
+    def _direct_session(self) -> requests.Session:
+        with self._direct_lock:
+            if self._direct is None:
+                self._direct = create_session(self.pool_size)
+
+            return self._direct
+
+    def _call(self, message: tuple[Any, ...]) -> tuple[Any, ...]:
+        conn: Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = _connect(self.address)
+            if conn is None:
+                raise requests.exceptions.ConnectionError(f"Agent is not running on {self.address}")
+
+        try:
+            conn.send(message)
+            return conn.recv()
+        except (EOFError, OSError) as e:
+            conn.close()
+            self._local.conn = None
+            raise requests.exceptions.ConnectionError(f"Agent connection is lost: {e!r}") from e
+
+    def request(  # type: ignore[override]  # noqa: PLR0917
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        data: Any = None,  # noqa: ANN401
+        json: Any = None,  # noqa: ANN401
+        files: dict[str, tuple[str, Any]] | None = None,
+        timeout: float | None = None,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> requests.Response:
+        if data is not None and not isinstance(data, dict):
+            # A streamed body, which can't be pickled, or only as a copy of all its content
+            return self._direct_session().request(
+                method,
+                url,
+                params=params,
+                data=data,
+                json=json,
+                files=files,
+                timeout=timeout,
+                headers=headers,
+                **kwargs,
+            )
+
+        relayed: dict[str, Any] = {
+            "params": params,
+            "data": data,
+            "json": json,
+            "timeout": timeout,
+            "headers": headers,
+        }
+        if files:
+            # File objects can't be passed to another process, their content is
+            relayed["files"] = {
+                name: (filename, file.read()) for name, (filename, file) in files.items()
+            }
+
+        reply = self._call(("request", method, url, relayed))
+        if reply[0] == "error":
+            raise requests.exceptions.ConnectionError(reply[1])
+
+        _, status, reply_headers, content = reply
+        resp = requests.Response()
+        resp.status_code = status
+        resp.headers.update(reply_headers)
+        resp._content = content  # noqa: SLF001
+        resp.url = url
+        resp.reason = HTTPStatus(status).phrase
+
+        return resp
+
+    def attach_system(self, system: int) -> None:
+        """
+        Let the agent sample host metrics for the system.
+
+        The system is detached when the connection of the calling thread closes, e.g. when
+        the process dies, so it must be called from a thread which outlives the run.
+        """
+        self._call(("attach", system))
+
+    def detach_system(self, system: int) -> None:
+        self._call(("detach", system))
+
+
+class AgentSystemMetricsMonitor(SystemMetricsMonitor):
+    """
+    Monitor leaving host metrics to the agent.
+
+    Only metrics the agent can't see, e.g. of the training process, are sampled locally.
+    """
+
+    def __init__(
+        self,
+        system: int,
+        client: AutoMLFlowClient,
+        session: RelaySession,
+        *,
+        interval: float = 10,
+        flush_interval: float | None = None,
+        aggregate: bool = False,
+        monitors: list[BaseMetricsMonitor] | None = None,
+    ) -> None:
+        super().__init__(
+            system,
+            client,
+            interval=interval,
+            flush_interval=flush_interval,
+            aggregate=aggregate,
+            monitors=monitors or [],
+        )
+        self.session = session
+
+    def start(self) -> None:
+        self.session.attach_system(self.system)
+        if self.monitors:
+            super().start()
+
+    def finish(self) -> None:
+        if self.monitors:
+            super().finish()
+
+        try:
+            self.session.detach_system(self.system)
+        except requests.exceptions.ConnectionError as e:
+            logger.warning(f"Failed to detach from the agent: {e!r}")
+
+
+def start_agent(url: str, address: Path, timeout: float = 10) -> None:
+    """
+    Start the agent in the background, unless it is already running.
+
+    Args:
+        url (str): The URL of the tracking server.
+        address (Path): The UNIX socket of the agent.
+        timeout (float): The maximum time (in seconds) to wait for the agent to start.
+    """
+    _make_private_dir(address.parent)
+    conn = _connect(address)
+    if conn is not None:
+        conn.close()
+        return
+
+    # Detached from the session, so the agent outlives the tracker which started it
+    subprocess.Popen(  # noqa: S603
+        [sys.executable, "-m", "auto_ml_flow.agent", "--url", url, "--address", str(address)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        conn = _connect(address)
+        if conn is not None:
+            conn.close()
+            return
+
+        time.sleep(0.05)
+
+    raise TimeoutError(f"Agent didn't start on {address} in {timeout} seconds.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Relay trackers of the host to the tracking server."
+    )
+    parser.add_argument("--url", required=True, help="The URL of the tracking server.")
+    parser.add_argument("--address", type=Path, help="The UNIX socket to listen on.")
+    parser.add_argument("--pool-size", type=int, default=DEFAULT_POOL_SIZE)
+    parser.add_argument("--monitor-interval", type=float, default=0.5)
+    parser.add_argument("--monitor-flush-interval", type=float, default=10)
+    parser.add_argument("--idle-timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    agent = RelayAgent(
+        args.url,
+        args.address or get_agent_address(args.url),
+        pool_size=args.pool_size,
+        monitor_interval=args.monitor_interval,
+        monitor_flush_interval=args.monitor_flush_interval,
+        idle_timeout=args.idle_timeout,
+    )
+    with contextlib.suppress(KeyboardInterrupt):
+        agent.serve()
+
+
+if __name__ == "__main__":
+    main()
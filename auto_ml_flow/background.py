@@ -0,0 +1,167 @@
+"""Background logger of run metrics, params and results."""
+
+import contextlib
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from auto_ml_flow.client.v1 import AutoMLFlowClient
+from auto_ml_flow.client.v1.models.run_metrics import (
+    CreateRunMetricPayload,
+    CreateRunParamPayload,
+    CreateRunResultPayload,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+RunRecord = CreateRunMetricPayload | CreateRunParamPayload | CreateRunResultPayload
+
+
+class BackgroundLogger:
+    def __init__(
+        self,
+        client: AutoMLFlowClient,
+        max_queue_size: int = 10_000,
+        max_batch_size: int = 500,
+        put_timeout: float = 1,
+    ) -> None:
+        """
+        Initialize the background logger.
+
+        Args:
+            client (AutoMLFlowClient): The client used by the worker thread to send records.
+            max_queue_size (int): The maximum number of records waiting to be sent.
+            max_batch_size (int): The maximum number of records sent in one request.
+            put_timeout (float): The maximum time (in seconds) `log` waits for the worker to
+                free a slot when the queue is full. The oldest record is dropped then, so the
+                training never hangs on a server which is slow or down.
+        """
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.put_timeout = put_timeout
+        self.dropped = 0
+        self._queue: queue.Queue[RunRecord | None] = queue.Queue(maxsize=max_queue_size)
+        self._discard_event = threading.Event()
+        self._process: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start sending queued records in a background thread."""
+        if self._process is not None:
+            logger.warning("Background logging is already running.")
+            return
+
+        self._discard_event.clear()
+        self._process = threading.Thread(target=self._run, daemon=True)
+        self._process.start()
+
+    def log(self, record: RunRecord) -> None:
+        """Put the record on the queue. The record is sent later by the worker thread."""
+        alive = self._process is not None and self._process.is_alive()
+        try:
+            if alive:
+                self._queue.put(record, timeout=self.put_timeout)
+            else:
+                self._queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        while True:
+            with contextlib.suppress(queue.Empty):
+                self._queue.get_nowait()
+                if self.dropped == 0:
+                    logger.warning(
+                        "Background logging queue is full, the oldest records are dropped."
+                    )
+
+                self.dropped += 1
+
+            try:
+                self._queue.put_nowait(record)
+                return
+            except queue.Full:
+                continue
+
+    def _run(self) -> None:
+        """Background thread function to drain the queue in batches."""
+        finished = False
+        while not finished:
+            batch = [self._queue.get()]
+            # Take everything that is already queued without waiting for new records
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            if None in batch:
+                finished = True
+                batch = batch[: batch.index(None)]
+
+            if self._discard_event.is_set():
+                return
+
+            self._send(batch)  # type: ignore[arg-type]
+
+    def _send(self, records: list[RunRecord]) -> None:
+        metrics: list[CreateRunMetricPayload] = []
+        params: list[CreateRunParamPayload] = []
+        results: list[CreateRunResultPayload] = []
+        for record in records:
+            # Result payload is a subclass of metric payload, so it must be checked first
+            if isinstance(record, CreateRunResultPayload):
+                results.append(record)
+            elif isinstance(record, CreateRunParamPayload):
+                params.append(record)
+            else:
+                metrics.append(record)
+
+        batches: list[tuple[Callable[[Any], Any], list[Any]]] = [
+            (self.client.runs.metrics.create_batch, metrics),
+            (self.client.runs.params.create_batch, params),
+            (self.client.runs.results.create_batch, results),
+        ]
+        for create_batch, batch in batches:
+            if not batch:
+                continue
+
+            try:
+                create_batch(batch)
+            except Exception as e:  # noqa: BLE001
+                # Any error, e.g. a timeout or a rejected record, must not stop the worker
+                logger.error(f"Failed to send {len(batch)} records: {e!r}")
+
+    def finish(self, timeout: float = 10) -> None:
+        """
+        Send the remaining records and stop the worker thread.
+
+        Args:
+            timeout (float): The maximum time (in seconds) to wait for the queue to drain.
+                Records that are not sent in time are dropped.
+        """
+        if self._process is None:
+            return
+
+        if not self._process.is_alive():
+            logger.warning(
+                f"Background logging stopped unexpectedly. "
+                f"About {self._queue.qsize()} records were dropped."
+            )
+            self._process = None
+            return
+
+        deadline = time.monotonic() + timeout
+        with contextlib.suppress(queue.Full):
+            self._queue.put(None, timeout=timeout)
+
+        self._process.join(max(deadline - time.monotonic(), 0))
+
+        if self._process.is_alive():
+            self._discard_event.set()
+            logger.warning(
+                f"Background logging did not finish in {timeout} seconds. "
+                f"About {self._queue.qsize()} records were dropped."
+            )
+
+        self._process = None
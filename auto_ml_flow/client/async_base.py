@@ -0,0 +1,178 @@
+from http import HTTPStatus
+from typing import IO, Any, Dict, Optional, Type, TypeVar
+from urllib.parse import urljoin
+
+import httpx
+from pydantic import TypeAdapter, ValidationError
+from tenacity import (
+    RetryError,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_fixed,
+)
+
+from auto_ml_flow.client.base import DEFAULT_POOL_SIZE, JSON, get_error_detail
+from auto_ml_flow.client.exceptions import (
+    BaseURLNotProvidedError,
+    ClientBadRequestError,
+    ClientConnectionError,
+    ClientMethodNotAllowedError,
+    ClientNotFoundError,
+    ClientServerError,
+    ClientValidationError,
+)
+
+T = TypeVar("T")
+
+
+def create_async_session(pool_size: int = DEFAULT_POOL_SIZE) -> httpx.AsyncClient:
+    """
+    Create an asynchronous session with a keep-alive connection pool.
+
+    Args:
+        pool_size (int): The maximum number of connections kept open.
+    """
+    limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+
+    return httpx.AsyncClient(limits=limits, verify=False, timeout=100)
+
+
+class AsyncBaseClient:
+    def __init__(
+        self, base_url: Optional[str] = None, session: Optional[httpx.AsyncClient] = None
+    ) -> None:
+        self.session = session or create_async_session()
+        self.base_url = base_url
+
+        if not self.base_url:
+            raise BaseURLNotProvidedError("Not provided default url")
+
+    async def aclose(self) -> None:
+        await self.session.aclose()
+
+    @retry(
+        wait=wait_fixed(1),
+        stop=stop_after_attempt(5),
+        retry=retry_if_exception_type(httpx.TransportError),
+    )
+    async def _request(
+        self,
+        path: str,
+        *,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[JSON] = None,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, tuple[str, IO]]] = None,
+    ) -> httpx.Response:
+        if not self.base_url:
+            raise BaseURLNotProvidedError("Base URL not provided")
+
+        url = urljoin(self.base_url, path)
+
+        if data is not None:
+            # `requests` skips form fields set to None, httpx sends them as empty strings
+            data = {key: value for key, value in data.items() if value is not None}
+
+        resp = await self.session.request(
+            method, url, params=params, json=json, data=data, files=files
+        )
+        resp.raise_for_status()
+
+        return resp
+
+    async def _make_request(
+        self,
+        path: str,
+        method: str,
+        model: Optional[Type[T]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[JSON] = None,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, tuple[str, IO]]] = None,
+    ) -> T:
+        try:
+            resp = await self._request(
+                path, method=method, params=params, json=json, data=data, files=files
+            )
+
+        except (httpx.TransportError, RetryError) as err:
+            raise ClientConnectionError from err
+
+        except httpx.HTTPStatusError as http_err:
+            status_code = http_err.response.status_code
+
+            if status_code == HTTPStatus.BAD_REQUEST.value:
+                raise ClientBadRequestError(get_error_detail(http_err.response)) from http_err
+
+            if status_code == HTTPStatus.NOT_FOUND.value:
+                raise ClientNotFoundError(get_error_detail(http_err.response)) from http_err
+
+            if status_code == HTTPStatus.METHOD_NOT_ALLOWED.value:
+                raise ClientMethodNotAllowedError(get_error_detail(http_err.response)) from http_err
+
+            if status_code >= HTTPStatus.INTERNAL_SERVER_ERROR.value:
+                raise ClientServerError(get_error_detail(http_err.response)) from http_err
+
+            raise
+
+        data = resp.json()
+
+        if not model:
+            return data  # type: ignore
+
+        type_adapted_model = TypeAdapter(model)
+
+        try:
+            return type_adapted_model.validate_python(data)
+        except ValidationError as err:
+            raise ClientValidationError from err
+
+    async def _get(
+        self, path: str, *, model: Type[T], params: Optional[Dict[str, Any]] = None
+    ) -> T:
+        return await self._make_request(path, "GET", model, params=params)
+
+    async def _post(
+        self,
+        path: str,
+        *,
+        model: Optional[Type[T]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[JSON] = None,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, tuple[str, IO]]] = None,
+    ) -> T:
+        return await self._make_request(
+            path, "POST", model=model, params=params, json=json, data=data, files=files
+        )
+
+    async def _put(
+        self,
+        path: str,
+        *,
+        model: Optional[Type[T]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[JSON] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> T:
+        return await self._make_request(
+            path, "PUT", model=model, params=params, json=json, data=data
+        )
+
+    async def _patch(
+        self,
+        path: str,
+        *,
+        model: Optional[Type[T]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[JSON] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> T:
+        return await self._make_request(path, "PATCH", model, params=params, json=json, data=data)
+
+    async def _delete(
+        self, path: str, *, model: Optional[Type[T]] = None, params: Optional[Dict[str, Any]] = None
+    ) -> T:
+        return await self._make_request(path, "DELETE", model, params=params)
@@ -1,10 +1,15 @@
+import re
+from collections.abc import Iterable
+from datetime import UTC, datetime
 from http import HTTPStatus
-from typing import IO, Any, Dict, Optional, Type, TypeVar
+from typing import IO, Any, Dict, List, Optional, Type, TypeVar, Union, get_args, get_origin
 from urllib.parse import urljoin
 
+import httpx
 import requests
 import urllib3
-from pydantic import TypeAdapter, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from requests.adapters import HTTPAdapter
 from tenacity import (
     RetryError,
     retry,
@@ -17,21 +22,61 @@ from auto_ml_flow.client.exceptions import (
     BaseURLNotProvidedError,
     ClientBadRequestError,
     ClientConnectionError,
+    ClientMethodNotAllowedError,
     ClientNotFoundError,
     ClientServerError,
     ClientValidationError,
 )
+from auto_ml_flow.client.spool import SpoolSession
 
 T = TypeVar("T")
+JSON = Union[Dict[str, Any], List[Dict[str, Any]]]
+# Raw request body, sent at once or, if it's an iterable, with chunked transfer encoding
+Content = Union[bytes, Iterable[Union[bytes, memoryview]]]
 
 urllib3.disable_warnings(category=urllib3.exceptions.InsecureRequestWarning)
 
+DEFAULT_POOL_SIZE = 10
+# Path of a single object, ending with its id
+OBJECT_PATH = re.compile(r"/(-?\d+)/$")
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """
+    Create a session with a keep-alive connection pool.
+
+    One session is meant to be shared by all sub-clients, so every thread that talks to the
+    tracking server (training code, monitor, background logger) reuses warm connections.
+
+    Args:
+        pool_size (int): The maximum number of connections kept open to one host.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+
+    return session
+
+
+def get_error_detail(response: Union[requests.Response, httpx.Response]) -> Any:  # noqa: ANN401
+    """The body of an error response, or its text if it's not JSON, e.g. an HTML error page."""
+    try:
+        return response.json()
+    except ValueError:
+        return response.text
+
 
 class BaseClient:
+    # Whether write requests are spooled in spool mode. Requests whose answer is computed by
+    # the server, like predictions, can't be.
+    SPOOLED = True
+
     def __init__(
         self, base_url: Optional[str] = None, session: Optional[requests.Session] = None
     ) -> None:
-        self.session = session or requests.Session()
+        self.session = session or create_session()
         self.base_url = base_url
 
         if not self.base_url:
@@ -48,9 +93,11 @@ class BaseClient:
         *,
         method: str,
         params: Optional[Dict[str, Any]] = None,
-        json: Optional[Dict[str, Any]] = None,
+        json: Optional[JSON] = None,
         data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, tuple[str, IO]]] = None,
+        content: Optional[Content] = None,
+        headers: Optional[Dict[str, str]] = None,
         stream: bool = False,
         timeout: int = 100,
     ) -> requests.Response:
@@ -64,7 +111,10 @@ class BaseClient:
             url,
             params=params,
             json=json,
-            data=data,
+            # A body without length, like a generator, is sent with chunked transfer encoding.
+            # urllib3 sends memoryviews like bytes, though requests doesn't declare them
+            data=content if content is not None else data,  # type: ignore[arg-type]
+            headers=headers,
             stream=stream,
             files=files,
             timeout=timeout,
@@ -80,13 +130,33 @@ class BaseClient:
         method: str,
         model: Optional[Type[T]] = None,
         params: Optional[Dict[str, Any]] = None,
-        json: Optional[Dict[str, Any]] = None,
+        json: Optional[JSON] = None,
         data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, tuple[str, IO]]] = None,
+        content: Optional[Content] = None,
+        headers: Optional[Dict[str, str]] = None,
     ) -> T:
+        if (
+            self.SPOOLED
+            and isinstance(self.session, SpoolSession)
+            and method != "GET"
+            and not files
+            and content is None
+        ):
+            return self._spool(
+                self.session, path, method, model=model, params=params, json=json, data=data
+            )
+
         try:
             resp = self._request(
-                path, method=method, params=params, json=json, data=data, files=files
+                path,
+                method=method,
+                params=params,
+                json=json,
+                data=data,
+                files=files,
+                content=content,
+                headers=headers,
             )
             resp.raise_for_status()
 
@@ -97,13 +167,18 @@ class BaseClient:
             status_code = http_err.response.status_code
 
             if status_code == HTTPStatus.BAD_REQUEST.value:
-                raise ClientBadRequestError(http_err.response.json()) from http_err
+                raise ClientBadRequestError(get_error_detail(http_err.response)) from http_err
 
             if status_code == HTTPStatus.NOT_FOUND.value:
-                raise ClientNotFoundError(http_err.response.json()) from http_err
+                raise ClientNotFoundError(get_error_detail(http_err.response)) from http_err
+
+            if status_code == HTTPStatus.METHOD_NOT_ALLOWED.value:
+                raise ClientMethodNotAllowedError(
+                    get_error_detail(http_err.response)  # type: ignore[arg-type]
+                ) from http_err
 
             if status_code >= HTTPStatus.INTERNAL_SERVER_ERROR.value:
-                raise ClientServerError(http_err.response.json()) from http_err
+                raise ClientServerError(get_error_detail(http_err.response)) from http_err
 
             raise
 
@@ -119,6 +194,50 @@ class BaseClient:
         except ValidationError as err:
             raise ClientValidationError from err
 
+    def _spool(
+        self,
+        session: SpoolSession,
+        path: str,
+        method: str,
+        *,
+        model: Optional[Type[T]],
+        params: Optional[Dict[str, Any]],
+        json: Optional[JSON],
+        data: Optional[Dict[str, Any]],
+    ) -> T:
+        """Append the request to the log, and answer it as the server would."""
+        creates = (
+            method == "POST"
+            and isinstance(model, type)
+            and issubclass(model, BaseModel)
+            and "id" in model.model_fields
+        )
+        request = session.log.append(
+            method, path, params=params, json_body=json, form=data, creates=creates
+        )
+
+        # The created objects are built from the request, without validation, as the fields
+        # which only the server fills in are missing
+        now = datetime.now(UTC)
+        if isinstance(json, list):
+            items = [{**item, "created_at": now, "updated_at": now} for item in json]
+            if model is None or get_origin(model) is not list:
+                return items  # type: ignore
+
+            (item_model,) = get_args(model)
+            return [item_model.model_construct(**item) for item in items]  # type: ignore
+
+        body: Dict[str, Any] = {**(data or json or {}), "created_at": now, "updated_at": now}
+        if request.placeholder is not None:
+            body["id"] = request.placeholder
+        elif match := OBJECT_PATH.search(path):
+            body["id"] = int(match[1])
+
+        if not model:
+            return body  # type: ignore
+
+        return model.model_construct(**body)  # type: ignore
+
     def _get(self, path: str, *, model: Type[T], params: Optional[Dict[str, Any]] = None) -> T:
         return self._make_request(path, "GET", model, params=params)
 
@@ -128,12 +247,22 @@ class BaseClient:
         *,
         model: Optional[Type[T]] = None,
         params: Optional[Dict[str, Any]] = None,
-        json: Optional[Dict[str, Any]] = None,
+        json: Optional[JSON] = None,
         data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, tuple[str, IO]]] = None,
+        content: Optional[Content] = None,
+        headers: Optional[Dict[str, str]] = None,
     ) -> T:
         return self._make_request(
-            path, "POST", model=model, params=params, json=json, data=data, files=files
+            path,
+            "POST",
+            model=model,
+            params=params,
+            json=json,
+            data=data,
+            files=files,
+            content=content,
+            headers=headers,
         )
 
     def _put(
@@ -142,12 +271,22 @@ class BaseClient:
         *,
         model: Optional[Type[T]] = None,
         params: Optional[Dict[str, Any]] = None,
-        json: Optional[Dict[str, Any]] = None,
+        json: Optional[JSON] = None,
         data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, IO]] = None,
+        content: Optional[Content] = None,
+        headers: Optional[Dict[str, str]] = None,
     ) -> T:
         return self._make_request(
-            path, "PUT", model=model, params=params, json=json, data=data, files=files
+            path,
+            "PUT",
+            model=model,
+            params=params,
+            json=json,
+            data=data,
+            files=files,
+            content=content,
+            headers=headers,
         )
 
     def _patch(
@@ -156,7 +295,7 @@ class BaseClient:
         *,
         model: Optional[Type[T]] = None,
         params: Optional[Dict[str, Any]] = None,
-        json: Optional[Dict[str, Any]] = None,
+        json: Optional[JSON] = None,
         data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, IO]] = None,
     ) -> T:
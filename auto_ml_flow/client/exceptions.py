@@ -18,5 +18,9 @@ class ClientNotFoundError(ClientError):
     """Exception raised for 404 Not Found HTTP error."""
 
 
+class ClientMethodNotAllowedError(ClientError):
+    """Exception raised for 405 Method Not Allowed HTTP error."""
+
+
 class ClientServerError(ClientError):
     """Exception raised for 500 Internal Server Error HTTP error."""
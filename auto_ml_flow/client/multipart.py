@@ -0,0 +1,68 @@
+"""Multipart bodies streamed from a generator, without a copy of the file in memory."""
+
+import os
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+# Returns a new iterator over the content of the file, so the body can be sent again on retry
+Chunks = Callable[[], Iterable[bytes | memoryview]]
+
+
+class MultipartBody:
+    """
+    A `multipart/form-data` body with form fields and one file.
+
+    The file content is pulled from `chunks` while the body is sent, so it is sent with
+    chunked transfer encoding and memory doesn't depend on the size of the file. Every
+    iteration restarts the content, so the same body can be passed to retried requests.
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, Any],
+        name: str,
+        file_name: str,
+        chunks: Chunks,
+        content_type: str = "application/octet-stream",
+    ) -> None:
+        """
+        Initialize the body.
+
+        Args:
+            fields (dict[str, Any]): The form fields. Fields set to None are skipped.
+            name (str): The name of the file field.
+            file_name (str): The name of the file.
+            chunks (Chunks): The function returning the content of the file.
+            content_type (str): The content type of the file.
+        """
+        self.boundary = os.urandom(16).hex()
+        self.fields = fields
+        self.name = name
+        self.file_name = file_name
+        self.chunks = chunks
+        self.file_content_type = content_type
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def _part_header(self, name: str, file_name: str | None = None) -> bytes:
+        disposition = f'form-data; name="{name}"'
+        header = f"--{self.boundary}\r\nContent-Disposition: {disposition}"
+        if file_name is not None:
+            header += f'; filename="{file_name}"\r\nContent-Type: {self.file_content_type}'
+
+        return f"{header}\r\n\r\n".encode()
+
+    def __iter__(self) -> Iterator[bytes | memoryview]:
+        for name, value in self.fields.items():
+            if value is not None:
+                yield self._part_header(name) + str(value).encode() + b"\r\n"
+
+        yield self._part_header(self.name, self.file_name)
+        for chunk in self.chunks():
+            # Empty chunks would end the chunked body early
+            if chunk:
+                yield chunk
+
+        yield f"\r\n--{self.boundary}--\r\n".encode()
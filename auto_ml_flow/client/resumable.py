@@ -0,0 +1,234 @@
+"""Resumable upload of dataset files in parts, sent in parallel."""
+
+import base64
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from loguru import logger
+from pydantic import BaseModel, ValidationError
+
+from auto_ml_flow.client.exceptions import (
+    ClientConnectionError,
+    ClientNotFoundError,
+    ClientServerError,
+    ClientValidationError,
+)
+from auto_ml_flow.client.multipart import Chunks
+from auto_ml_flow.client.v1.api.uploads import DatasetUploadsClient
+from auto_ml_flow.client.v1.models.datasets import (
+    CommitDatasetUploadPayload,
+    CreateDatasetPayload,
+    CreateDatasetUploadPayload,
+    DatasetModel,
+    DatasetUploadModel,
+    DatasetUploadPartModel,
+)
+
+PART_SIZE = 8 << 20
+MAX_WORKERS = 4
+MAX_PART_ATTEMPTS = 3
+
+
+def get_uploads_dir() -> Path:
+    return (
+        Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local/share")
+        / "auto_ml_flow/uploads"
+    )
+
+
+def get_checksum(content: bytes) -> str:
+    """The `Content-Digest` of the content (RFC 9530)."""
+    digest = base64.b64encode(hashlib.sha256(content).digest()).decode()
+
+    return f"sha-256=:{digest}:"
+
+
+def iter_parts(chunks: Iterable[bytes | memoryview], part_size: int) -> Iterator[bytes]:
+    """Regroup chunks of any size into parts of `part_size` bytes, except the last one."""
+    buffer = bytearray()
+    for chunk in chunks:
+        view = memoryview(chunk).cast("B")
+        while view:
+            taken = part_size - len(buffer)
+            buffer += view[:taken]
+            view = view[taken:]
+            if len(buffer) >= part_size:
+                yield bytes(buffer)
+                buffer.clear()
+
+    if buffer:
+        yield bytes(buffer)
+
+
+class UploadToken(BaseModel):
+    """What's needed to resume an upload, kept on disk until the upload is committed."""
+
+    upload_id: str
+    part_size: int
+
+
+class ResumableUpload:
+    """
+    Upload of a dataset file in parts: created, then sent part by part, then committed.
+
+    Parts are sent in parallel, each with its checksum, and a part is sent again if it fails
+    or doesn't arrive intact. With the hash of the dataset, the upload is recorded in a token
+    on disk, so uploading the same dataset again after an interruption sends only the parts
+    the server didn't receive.
+    """
+
+    def __init__(
+        self,
+        client: DatasetUploadsClient,
+        part_size: int = PART_SIZE,
+        max_workers: int = MAX_WORKERS,
+        tokens_dir: Path | None = None,
+    ) -> None:
+        """
+        Initialize the upload.
+
+        Args:
+            client (DatasetUploadsClient): The client of the uploads.
+            part_size (int): The size (in bytes) of the parts of new uploads.
+            max_workers (int): The number of parts sent at once. Twice as many parts are held
+                in memory at most.
+            tokens_dir (Path | None): The directory of the tokens of interrupted uploads.
+                Defaults to `$XDG_DATA_HOME/auto_ml_flow/uploads`.
+        """
+        self.client = client
+        self.part_size = part_size
+        self.max_workers = max_workers
+        self.tokens_dir = tokens_dir or get_uploads_dir()
+
+    def _token_path(self, hash_: str) -> Path:
+        key = hashlib.blake2b(f"{self.client.base_url}\0{hash_}".encode(), digest_size=16)
+
+        return self.tokens_dir / f"{key.hexdigest()}.json"
+
+    def _resume(self, hash_: str) -> DatasetUploadModel | None:
+        path = self._token_path(hash_)
+        try:
+            token = UploadToken.model_validate_json(path.read_bytes())
+        except (OSError, ValidationError):
+            return None
+
+        try:
+            upload = self.client.retrieve(token.upload_id)
+        except ClientNotFoundError:
+            # E.g. expired on the server
+            path.unlink(missing_ok=True)
+            return None
+
+        logger.info(f"Resuming upload {upload.id}, {len(upload.parts)} parts already sent.")
+
+        return upload
+
+    def _save_token(self, hash_: str, upload: DatasetUploadModel) -> None:
+        self.tokens_dir.mkdir(parents=True, exist_ok=True)
+        token = UploadToken(upload_id=upload.id, part_size=upload.part_size)
+        # Replaced atomically, so a crash never leaves a token which doesn't parse
+        with tempfile.NamedTemporaryFile("w", dir=self.tokens_dir, delete=False) as file:
+            file.write(token.model_dump_json())
+
+        Path(file.name).replace(self._token_path(hash_))
+
+    def _send_part(self, upload_id: str, number: int, content: bytes) -> DatasetUploadPartModel:
+        checksum = get_checksum(content)
+        for attempt in range(1, MAX_PART_ATTEMPTS + 1):
+            try:
+                part = self.client.upload_part(upload_id, number, content, checksum)
+            except (ClientConnectionError, ClientServerError) as e:
+                if attempt == MAX_PART_ATTEMPTS:
+                    raise
+
+                logger.warning(f"Failed to send part {number}, retrying: {e!r}")
+                time.sleep(attempt)
+                continue
+
+            if part.checksum == checksum:
+                return part
+
+            logger.warning(f"Part {number} arrived corrupted, retrying.")
+
+        raise ClientValidationError(
+            f"Part {number} arrived corrupted {MAX_PART_ATTEMPTS} times in a row"
+        )
+
+    def _send_parts(
+        self, upload: DatasetUploadModel, chunks: Chunks
+    ) -> list[DatasetUploadPartModel]:
+        received = {part.number: part for part in upload.parts}
+        parts: list[DatasetUploadPartModel | Future[DatasetUploadPartModel]] = []
+        # Parts are read from the serializer only as fast as they are sent
+        in_flight = threading.BoundedSemaphore(self.max_workers * 2)
+        failed = threading.Event()
+
+        def done(future: Future[DatasetUploadPartModel]) -> None:
+            in_flight.release()
+            if future.exception() is not None:
+                failed.set()
+
+        with ThreadPoolExecutor(self.max_workers, thread_name_prefix="auto_ml_flow_upload") as pool:
+            for number, content in enumerate(iter_parts(chunks(), upload.part_size), start=1):
+                part = received.get(number)
+                if part is not None and part.checksum == get_checksum(content):
+                    parts.append(part)
+                    continue
+
+                in_flight.acquire()
+                if failed.is_set():
+                    in_flight.release()
+                    pool.shutdown(cancel_futures=True)
+                    break
+
+                future = pool.submit(self._send_part, upload.id, number, content)
+                future.add_done_callback(done)
+                parts.append(future)
+
+        return [part.result() if isinstance(part, Future) else part for part in parts]
+
+    def upload(
+        self,
+        dataset: CreateDatasetPayload,
+        file_name: str,
+        chunks: Chunks,
+    ) -> DatasetModel | None:
+        """
+        Upload the dataset file, resuming the interrupted upload of the same dataset.
+
+        Args:
+            dataset (CreateDatasetPayload): The dataset. Its hash identifies the upload to
+                resume; without it, the upload starts from the beginning every time.
+            file_name (str): The name of the file.
+            chunks (Chunks): The function returning the content of the file.
+
+        Returns:
+            DatasetModel | None: The dataset, or None if the server doesn't support uploads
+                in parts.
+        """
+        upload = self._resume(dataset.hash) if dataset.hash else None
+        if upload is None:
+            try:
+                upload = self.client.create(
+                    CreateDatasetUploadPayload(file_name=file_name, part_size=self.part_size)
+                )
+            except ClientNotFoundError:
+                return None
+
+            if dataset.hash:
+                self._save_token(dataset.hash, upload)
+
+        parts = self._send_parts(upload, chunks)
+        created = self.client.commit(
+            upload.id, CommitDatasetUploadPayload(**dataset.model_dump(), parts=parts)
+        )
+        if dataset.hash:
+            self._token_path(dataset.hash).unlink(missing_ok=True)
+
+        return created
@@ -0,0 +1,597 @@
+"""
+Write-ahead log of requests to the tracking server, for tracking while it is unreachable.
+
+In spool mode, every write request is appended to a local log and answered at once, and a
+background uploader replays the log in order whenever the server is reachable. Objects created
+while spooled get negative placeholder ids, which are replaced by the real ids on replay.
+Every request carries an idempotency key, so a request replayed twice, e.g. after a crash
+between sending it and saving the replay offset, is created once.
+
+Logs left by processes which exited before the server was back are replayed with
+`python -m auto_ml_flow.client.spool --url <tracking url>`, together with file uploads left
+to the spool, e.g. of datasets still uploading when their run ended.
+"""
+
+import argparse
+import fcntl
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from functools import partial
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+from urllib.parse import urljoin
+
+import requests
+from loguru import logger
+from pydantic import BaseModel, ValidationError
+
+from auto_ml_flow.client.multipart import Chunks, MultipartBody
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+# Fields of payloads holding ids of other objects, which may be placeholders
+ID_FIELDS = ("run", "experiment", "system")
+PLACEHOLDER_IN_PATH = re.compile(r"/(-\d+)/")
+# Objects with a natural key: if a replayed creation is rejected because the object exists,
+# e.g. created by another process meanwhile, its id is looked up instead
+LOOKUPS = {"/api/v1/experiments/": "/api/v1/experiments/{name}/"}
+
+
+def get_spool_dir() -> Path:
+    return (
+        Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local/share") / "auto_ml_flow/spool"
+    )
+
+
+class SpooledRequest(BaseModel):
+    key: str
+    method: str
+    path: str
+    params: dict[str, Any] | None = None
+    json_body: Any = None
+    form: dict[str, Any] | None = None
+    # The id the caller got for the created object, until the server assigns the real one
+    placeholder: int | None = None
+
+
+class SpooledFile(BaseModel):
+    """A file upload left to the spool, e.g. of a dataset still uploading when its run ended."""
+
+    key: str
+    path: str
+    fields: dict[str, Any]
+    name: str
+    file_name: str
+    content_type: str
+
+
+class SpoolState(BaseModel):
+    # The position in the log of the first request which is not replayed yet
+    offset: int = 0
+    # Real ids of objects created while spooled, by placeholder
+    ids: dict[int, int] = {}
+
+
+class ServerUnavailableError(Exception):
+    """The server can't take requests now, replay is retried later."""
+
+
+class WriteAheadLog:
+    """Append-only log of requests, synced to disk in batches."""
+
+    def __init__(self, path: Path, fsync_interval: float = 0.2) -> None:
+        """
+        Open the log for appending.
+
+        Args:
+            path (Path): The log file.
+            fsync_interval (float): The interval (in seconds) at which appended requests are
+                synced to disk. Requests appended since the last sync are lost if the host
+                crashes, but appending never waits for the disk.
+        """
+        self.path = path
+        self.fsync_interval = fsync_interval
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = path.open("ab")
+        # Held while the process appends, so the replay CLI leaves the log alone
+        fcntl.flock(self._file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        self.synced_size = self._file.tell()
+        self._next_placeholder = -1
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.synced = threading.Condition(self._lock)
+        self._closed = threading.Event()
+        self._syncer = threading.Thread(target=self._sync_periodically, daemon=True)
+        self._syncer.start()
+
+    @classmethod
+    def create(cls, spool_dir: Path | None = None) -> "WriteAheadLog":
+        """A new log of the current process in the spool directory."""
+        name = f"{datetime.now(UTC):%Y%m%dT%H%M%S}-{os.getpid()}.wal"
+
+        return cls((spool_dir or get_spool_dir()) / name)
+
+    def append(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json_body: Any = None,  # noqa: ANN401
+        form: dict[str, Any] | None = None,
+        creates: bool = False,
+    ) -> SpooledRequest:
+        """
+        Append the request to the log.
+
+        Args:
+            creates (bool): Whether the request creates an object with an id, which the
+                caller may refer to later. The object gets a placeholder id then.
+        """
+        with self._lock:
+            placeholder = None
+            if creates:
+                placeholder = self._next_placeholder
+                self._next_placeholder -= 1
+
+            request = SpooledRequest(
+                key=uuid.uuid4().hex,
+                method=method,
+                path=path,
+                params=params,
+                json_body=json_body,
+                form=form,
+                placeholder=placeholder,
+            )
+            # Form values are sent as strings anyway, e.g. datetimes and enums
+            line = json.dumps(request.model_dump(exclude_none=True), default=str)
+            self._file.write(line.encode() + b"\n")
+            self._dirty = True
+
+        return request
+
+    def _sync(self) -> None:
+        if not self._dirty:
+            return
+
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._dirty = False
+        self.synced_size = self._file.tell()
+        self.synced.notify_all()
+
+    def flush(self) -> None:
+        """Sync the appended requests to disk at once."""
+        with self._lock:
+            self._sync()
+
+    def _sync_periodically(self) -> None:
+        while not self._closed.wait(self.fsync_interval):
+            with self._lock:
+                self._sync()
+
+    def close(self) -> None:
+        self._closed.set()
+        self._syncer.join()
+        with self._lock:
+            self._sync()
+            self._file.close()
+
+
+def read_requests(
+    path: Path, offset: int, end: int | None = None
+) -> Iterator[tuple[SpooledRequest | None, int]]:
+    """
+    Requests of the log from `offset` until `end`, with the offset following each of them.
+
+    Lines which don't parse, e.g. corrupted on disk, are logged and yielded as None, so they
+    are skipped like the requests which are replayed.
+    """
+    with path.open("rb") as file:
+        file.seek(offset)
+        for line in file:
+            if end is not None and offset + len(line) > end:
+                return
+
+            offset += len(line)
+            # The last line is incomplete if the process was killed while appending it
+            if not line.endswith(b"\n"):
+                return
+
+            try:
+                request = SpooledRequest.model_validate_json(line)
+            except ValidationError as e:
+                logger.error(f"Spooled request before offset {offset} of {path} is corrupted: {e}")
+                yield None, offset
+                continue
+
+            yield request, offset
+
+
+class Replayer:
+    """Sender of the requests of a log to the server, in order."""
+
+    def __init__(self, path: Path, base_url: str, session: requests.Session) -> None:
+        self.path = path
+        self.base_url = base_url
+        self.session = session
+        self.state_path = path.with_suffix(".state")
+        try:
+            self.state = SpoolState.model_validate_json(self.state_path.read_bytes())
+        except (OSError, ValidationError):
+            self.state = SpoolState()
+
+    def _save_state(self) -> None:
+        # Replaced atomically, so a crash never leaves a state which doesn't parse
+        with tempfile.NamedTemporaryFile("w", dir=self.path.parent, delete=False) as file:
+            file.write(self.state.model_dump_json())
+
+        Path(file.name).replace(self.state_path)
+
+    def _real_id(self, value: Any) -> Any:  # noqa: ANN401
+        if isinstance(value, int) and value < 0:
+            return self.state.ids[value]
+
+        return value
+
+    def _rewrite(self, value: Any) -> Any:  # noqa: ANN401
+        if isinstance(value, dict):
+            return {
+                key: self._real_id(item) if key in ID_FIELDS else self._rewrite(item)
+                for key, item in value.items()
+            }
+
+        if isinstance(value, list):
+            return [self._rewrite(item) for item in value]
+
+        return value
+
+    def _send(self, request: SpooledRequest) -> None:
+        path = PLACEHOLDER_IN_PATH.sub(
+            lambda match: f"/{self._real_id(int(match[1]))}/", request.path
+        )
+        resp = self.session.request(
+            request.method,
+            urljoin(self.base_url, path),
+            params=request.params,
+            json=self._rewrite(request.json_body),
+            data=self._rewrite(request.form),
+            headers={IDEMPOTENCY_HEADER: request.key},
+            timeout=100,
+            verify=False,
+        )
+        if resp.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            raise ServerUnavailableError(f"{resp.status_code} {resp.text[:200]}")
+
+        if (
+            resp.status_code == HTTPStatus.BAD_REQUEST
+            and request.placeholder is not None
+            and path in LOOKUPS
+            and request.form is not None
+        ):
+            resp = self.session.get(
+                urljoin(self.base_url, LOOKUPS[path].format(**request.form)),
+                timeout=100,
+                verify=False,
+            )
+
+        if resp.status_code >= HTTPStatus.BAD_REQUEST:
+            # The server will never take it, replaying the rest is still worth it
+            logger.error(
+                f"Spooled {request.method} {path} was rejected: "
+                f"{resp.status_code} {resp.text[:200]}"
+            )
+            return
+
+        if request.placeholder is None:
+            return
+
+        try:
+            created = resp.json()
+        except ValueError:
+            created = None
+
+        if not isinstance(created, dict) or "id" not in created:
+            # Requests referring to the object are skipped, as if it was rejected
+            logger.error(
+                f"Spooled {request.method} {path} was answered without an id: "
+                f"{resp.status_code} {resp.text[:200]}"
+            )
+            return
+
+        self.state.ids[request.placeholder] = created["id"]
+
+    def replay(self, end: int | None = None, save_every: int = 100) -> bool:
+        """
+        Send the requests which are not replayed yet.
+
+        Args:
+            end (int | None): The position in the log to stop at. Defaults to the end.
+            save_every (int): The number of requests after which the replay offset is saved.
+
+        Returns:
+            bool: Whether all requests until `end` were sent. Requests referring to an object
+                whose creation was rejected, or answered without an id, are skipped, and so
+                are lines of the log which don't parse.
+        """
+        sent = 0
+        try:
+            for request, offset in read_requests(self.path, self.state.offset, end):
+                if request is not None:
+                    try:
+                        self._send(request)
+                    except KeyError as e:
+                        logger.error(
+                            f"Spooled {request.method} {request.path} refers to {e}, "
+                            "which was not created"
+                        )
+
+                self.state.offset = offset
+                sent += 1
+                if sent % save_every == 0:
+                    self._save_state()
+        except (requests.exceptions.RequestException, ServerUnavailableError) as e:
+            logger.debug(f"Server is unavailable, spooled requests are kept: {e!r}")
+            return False
+        finally:
+            if sent:
+                self._save_state()
+
+        return True
+
+    def remove(self) -> None:
+        """Remove the log and its state once everything is replayed."""
+        self.path.unlink(missing_ok=True)
+        self.state_path.unlink(missing_ok=True)
+
+
+class SpoolSession(requests.Session):
+    """Session of a client in spool mode, holding the log its write requests go to."""
+
+    def __init__(self, log: WriteAheadLog, upstream: requests.Session) -> None:
+        """
+        Initialize the session.
+
+        Args:
+            log (WriteAheadLog): The log write requests are appended to.
+            upstream (requests.Session): The session read requests and replays are sent with.
+        """
+        super().__init__()
+        self.log = log
+        self.upstream = upstream
+
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> requests.Response:  # type: ignore[override]  # noqa: ANN401
+        return self.upstream.request(method, url, *args, **kwargs)
+
+
+class SpoolUploader:
+    """Background replay of the log of the current process."""
+
+    def __init__(self, session: SpoolSession, base_url: str, max_backoff: float = 30) -> None:
+        """
+        Initialize the uploader.
+
+        Args:
+            session (SpoolSession): The session of the client in spool mode.
+            base_url (str): The URL of the tracking server.
+            max_backoff (float): The maximum time (in seconds) between attempts to reach the
+                server while it is unavailable.
+        """
+        self.log = session.log
+        self.max_backoff = max_backoff
+        self.replayer = Replayer(self.log.path, base_url, session.upstream)
+        self._shutdown_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _run(self) -> None:
+        backoff = 1.0
+        while not self._shutdown_event.is_set():
+            with self.log.synced:
+                if self.replayer.state.offset >= self.log.synced_size:
+                    self.log.synced.wait(1)
+                end = self.log.synced_size
+
+            if self.replayer.replay(end):
+                backoff = 1.0
+                continue
+
+            self._shutdown_event.wait(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def close(self, timeout: float = 10) -> None:
+        """
+        Replay the rest of the log and stop.
+
+        Args:
+            timeout (float): The maximum time (in seconds) to wait for the rest of the log to
+                be replayed. If the server is unavailable, the log is left for the replay CLI.
+        """
+        self._shutdown_event.set()
+        self._thread.join()
+        self.log.flush()
+
+        deadline = time.monotonic() + timeout
+        replayed = self.replayer.replay()
+        while not replayed and time.monotonic() < deadline:
+            time.sleep(1)
+            replayed = self.replayer.replay()
+
+        if replayed:
+            self.replayer.remove()
+        else:
+            logger.warning(
+                f"Tracking server is unavailable, requests are spooled to {self.log.path}."
+            )
+
+        # Closed last, the lock keeps the replay CLI away from the log until then
+        self.log.close()
+
+
+def spool_file(
+    path: str,
+    fields: dict[str, Any],
+    name: str,
+    file_name: str,
+    chunks: Chunks,
+    *,
+    content_type: str = "application/octet-stream",
+    spool_dir: Path | None = None,
+) -> Path:
+    """
+    Write a file upload to the spool, to be sent by the replay CLI.
+
+    The content is written first and the request last, so a request in the spool always has
+    its whole content.
+
+    Args:
+        path (str): The path of the endpoint the file is posted to.
+        fields (dict[str, Any]): The form fields.
+        name (str): The name of the file field.
+        file_name (str): The name of the file.
+        chunks (Chunks): The function returning the content of the file.
+        content_type (str): The content type of the file.
+        spool_dir (Path | None): The spool directory. Defaults to
+            `$XDG_DATA_HOME/auto_ml_flow/spool`.
+
+    Returns:
+        Path: The spooled request.
+    """
+    files_dir = (spool_dir or get_spool_dir()) / "files"
+    files_dir.mkdir(parents=True, exist_ok=True)
+    request = SpooledFile(
+        key=uuid.uuid4().hex,
+        path=path,
+        fields=fields,
+        name=name,
+        file_name=file_name,
+        content_type=content_type,
+    )
+    with (files_dir / f"{request.key}.bin").open("wb") as content:
+        for chunk in chunks():
+            content.write(chunk)
+
+        content.flush()
+        os.fsync(content.fileno())
+
+    request_path = files_dir / f"{request.key}.json"
+    with tempfile.NamedTemporaryFile("w", dir=files_dir, delete=False) as file:
+        file.write(request.model_dump_json())
+
+    Path(file.name).replace(request_path)
+
+    return request_path
+
+
+def _read_chunks(path: Path, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+    with path.open("rb") as file:
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
+def replay_files(base_url: str, session: requests.Session, spool_dir: Path | None = None) -> int:
+    """
+    Send the file uploads left in the spool directory.
+
+    Returns:
+        int: The number of uploads which could not be sent.
+    """
+    pending = 0
+    for request_path in sorted(((spool_dir or get_spool_dir()) / "files").glob("*.json")):
+        content_path = request_path.with_suffix(".bin")
+        try:
+            request = SpooledFile.model_validate_json(request_path.read_bytes())
+        except (OSError, ValidationError) as e:
+            logger.error(f"Spooled upload {request_path} can't be read: {e!r}")
+            pending += 1
+            continue
+
+        body = MultipartBody(
+            request.fields,
+            request.name,
+            request.file_name,
+            partial(_read_chunks, content_path),
+            content_type=request.content_type,
+        )
+        try:
+            resp = session.post(
+                urljoin(base_url, request.path),
+                data=body,  # type: ignore[arg-type]
+                headers={"Content-Type": body.content_type, IDEMPOTENCY_HEADER: request.key},
+                timeout=100,
+                verify=False,
+            )
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Server is unavailable, spooled upload is kept: {e!r}")
+            pending += 1
+            continue
+
+        if resp.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            pending += 1
+            continue
+
+        if resp.status_code >= HTTPStatus.BAD_REQUEST:
+            logger.error(
+                f"Spooled upload of {request.file_name} was rejected: "
+                f"{resp.status_code} {resp.text[:200]}"
+            )
+        else:
+            logger.info(f"Uploaded spooled {request.file_name}.")
+
+        content_path.unlink(missing_ok=True)
+        request_path.unlink()
+
+    return pending
+
+
+def replay_spool(base_url: str, spool_dir: Path | None = None) -> int:
+    """
+    Replay the logs left in the spool directory.
+
+    Logs which are still appended to by a running process are skipped, that process replays
+    them itself. Spooled file uploads are sent after the logs, which create what they refer to.
+
+    Returns:
+        int: The number of logs and file uploads which could not be replayed completely.
+    """
+    session = requests.Session()
+    pending = 0
+    for path in sorted((spool_dir or get_spool_dir()).glob("*.wal")):
+        with path.open("rb") as file:
+            try:
+                fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                continue
+
+            replayer = Replayer(path, base_url, session)
+            if replayer.replay():
+                logger.info(f"Replayed {path}.")
+                replayer.remove()
+            else:
+                pending += 1
+
+    return pending + replay_files(base_url, session, spool_dir)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Replay requests spooled while the tracking server was unavailable."
+    )
+    parser.add_argument("--url", required=True, help="The URL of the tracking server.")
+    parser.add_argument("--dir", type=Path, help="The spool directory.")
+    args = parser.parse_args()
+
+    raise SystemExit(1 if replay_spool(args.url, args.dir) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 from requests import Session
 
-from auto_ml_flow.client.base import BaseClient
+from auto_ml_flow.client.base import DEFAULT_POOL_SIZE, BaseClient, create_session
 from auto_ml_flow.client.v1.api.datasets import DatasetsClient
 from auto_ml_flow.client.v1.api.experiments import ExperimentsClient
 from auto_ml_flow.client.v1.api.predict import MetaAlgoClient
@@ -9,11 +9,16 @@ from auto_ml_flow.client.v1.api.systems import SystemsClient
 
 
 class AutoMLFlowClient(BaseClient):
-    def __init__(self, base_url: str | None = None, session: Session | None = None) -> None:
-        super().__init__(base_url, session)
+    def __init__(
+        self,
+        base_url: str | None = None,
+        session: Session | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+    ) -> None:
+        super().__init__(base_url, session or create_session(pool_size))
 
-        self.experiments = ExperimentsClient(base_url=base_url, session=session)
-        self.runs = RunsClient(base_url=base_url, session=session)
-        self.systems = SystemsClient(base_url=base_url, session=session)
-        self.datasets = DatasetsClient(base_url=base_url, session=session)
-        self.meta_algos = MetaAlgoClient(base_url=base_url, session=session)
+        self.experiments = ExperimentsClient(base_url=base_url, session=self.session)
+        self.runs = RunsClient(base_url=base_url, session=self.session)
+        self.systems = SystemsClient(base_url=base_url, session=self.session)
+        self.datasets = DatasetsClient(base_url=base_url, session=self.session)
+        self.meta_algos = MetaAlgoClient(base_url=base_url, session=self.session)
@@ -0,0 +1,25 @@
+from httpx import AsyncClient
+
+from auto_ml_flow.client.async_base import AsyncBaseClient, create_async_session
+from auto_ml_flow.client.base import DEFAULT_POOL_SIZE
+from auto_ml_flow.client.v1.aio.api.datasets import AsyncDatasetsClient
+from auto_ml_flow.client.v1.aio.api.experiments import AsyncExperimentsClient
+from auto_ml_flow.client.v1.aio.api.predict import AsyncMetaAlgoClient
+from auto_ml_flow.client.v1.aio.api.runs import AsyncRunsClient
+from auto_ml_flow.client.v1.aio.api.systems import AsyncSystemsClient
+
+
+class AsyncAutoMLFlowClient(AsyncBaseClient):
+    def __init__(
+        self,
+        base_url: str | None = None,
+        session: AsyncClient | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+    ) -> None:
+        super().__init__(base_url, session or create_async_session(pool_size))
+
+        self.experiments = AsyncExperimentsClient(base_url=base_url, session=self.session)
+        self.runs = AsyncRunsClient(base_url=base_url, session=self.session)
+        self.systems = AsyncSystemsClient(base_url=base_url, session=self.session)
+        self.datasets = AsyncDatasetsClient(base_url=base_url, session=self.session)
+        self.meta_algos = AsyncMetaAlgoClient(base_url=base_url, session=self.session)
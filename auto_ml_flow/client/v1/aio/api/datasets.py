@@ -0,0 +1,42 @@
+from typing import IO
+
+from httpx import AsyncClient
+
+from auto_ml_flow.client.async_base import AsyncBaseClient
+from auto_ml_flow.client.v1.models.datasets import (
+    CreateDatasetPayload,
+    DatasetModel,
+    LinkDatasetPayload,
+)
+
+
+class AsyncDatasetsClient(AsyncBaseClient):
+    def __init__(self, base_url: str | None = None, session: AsyncClient | None = None) -> None:
+        super().__init__(base_url, session)
+
+    DEFAULT_PREFIX = "/api/v1/datasets"
+
+    # Defined before `list`, which shadows the builtin in the class body
+    async def find(self, hash_: str) -> list[DatasetModel]:
+        return await self._get(
+            f"{self.DEFAULT_PREFIX}/", params={"hash": hash_}, model=list[DatasetModel]
+        )
+
+    async def list(self) -> list[DatasetModel]:
+        return await self._get(f"{self.DEFAULT_PREFIX}/", model=list[DatasetModel])
+
+    async def retrieve(self, id_: int) -> DatasetModel:
+        return await self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=DatasetModel)
+
+    async def link(self, id_: int, link: LinkDatasetPayload) -> DatasetModel:
+        return await self._post(
+            f"{self.DEFAULT_PREFIX}/{id_}/runs/", data=link.model_dump(), model=DatasetModel
+        )
+
+    async def create(self, dataset: CreateDatasetPayload, file: IO) -> DatasetModel:
+        return await self._post(
+            f"{self.DEFAULT_PREFIX}/",
+            data=dataset.model_dump(mode="json"),
+            files={"file": (file.name, file)},
+            model=DatasetModel,
+        )
@@ -0,0 +1,20 @@
+from auto_ml_flow.client.async_base import AsyncBaseClient
+from auto_ml_flow.client.v1.models.experiments import (
+    CreateExperimentPayload,
+    ExperimentModel,
+)
+
+
+class AsyncExperimentsClient(AsyncBaseClient):
+    DEFAULT_PREFIX = "/api/v1/experiments"
+
+    async def list(self) -> list[ExperimentModel]:
+        return await self._get(f"{self.DEFAULT_PREFIX}/", model=list[ExperimentModel])
+
+    async def retrieve(self, name: str) -> ExperimentModel:
+        return await self._get(f"{self.DEFAULT_PREFIX}/{name}/", model=ExperimentModel)
+
+    async def create(self, experiment: CreateExperimentPayload) -> ExperimentModel:
+        return await self._post(
+            f"{self.DEFAULT_PREFIX}/", data=experiment.model_dump(), model=ExperimentModel
+        )
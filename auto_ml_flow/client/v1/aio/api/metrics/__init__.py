@@ -0,0 +1,33 @@
+from httpx import AsyncClient
+
+from auto_ml_flow.client.async_base import AsyncBaseClient
+from auto_ml_flow.client.v1.aio.api.metrics.cgroup import AsyncCgroupMetricsClient
+from auto_ml_flow.client.v1.aio.api.metrics.cpu import AsyncCPUMetricsClient
+from auto_ml_flow.client.v1.aio.api.metrics.disk import AsyncDiskMetricsClient
+from auto_ml_flow.client.v1.aio.api.metrics.disk_io import AsyncDiskIOMetricsClient
+from auto_ml_flow.client.v1.aio.api.metrics.gpu import AsyncGPUMetricsClient
+from auto_ml_flow.client.v1.aio.api.metrics.memory import AsyncMemoryMetricsClient
+from auto_ml_flow.client.v1.aio.api.metrics.network import AsyncNetworkMetricsClient
+from auto_ml_flow.client.v1.aio.api.metrics.network_io import AsyncNetworkIOMetricsClient
+from auto_ml_flow.client.v1.aio.api.metrics.process import AsyncProcessMetricsClient
+from auto_ml_flow.client.v1.models.metrics import SystemMetricsBatchPayload
+
+
+class AsyncMetricsClient(AsyncBaseClient):
+    def __init__(self, base_url: str | None = None, session: AsyncClient | None = None) -> None:
+        super().__init__(base_url, session)
+
+        self.cpu_stats = AsyncCPUMetricsClient(base_url, self.session)
+        self.network_stats = AsyncNetworkMetricsClient(base_url, self.session)
+        self.memory_stats = AsyncMemoryMetricsClient(base_url, self.session)
+        self.disk_stats = AsyncDiskMetricsClient(base_url, self.session)
+        self.process_stats = AsyncProcessMetricsClient(base_url, self.session)
+        self.gpu_stats = AsyncGPUMetricsClient(base_url, self.session)
+        self.disk_io_stats = AsyncDiskIOMetricsClient(base_url, self.session)
+        self.network_io_stats = AsyncNetworkIOMetricsClient(base_url, self.session)
+        self.cgroup_stats = AsyncCgroupMetricsClient(base_url, self.session)
+
+    DEFAULT_PREFIX = "/api/v1/system-metrics"
+
+    async def create_batch(self, batch: SystemMetricsBatchPayload) -> None:
+        await self._post(f"{self.DEFAULT_PREFIX}/batch/", json=batch.model_dump(mode="json"))
@@ -0,0 +1,17 @@
+from auto_ml_flow.client.async_base import AsyncBaseClient
+from auto_ml_flow.client.v1.models.metrics import CgroupMetricModel
+
+
+class AsyncCgroupMetricsClient(AsyncBaseClient):
+    DEFAULT_PREFIX = "/api/v1/cgroup-stats"
+
+    async def list(self) -> list[CgroupMetricModel]:
+        return await self._get(f"{self.DEFAULT_PREFIX}/", model=list[CgroupMetricModel])
+
+    async def retrieve(self, id_: int) -> CgroupMetricModel:
+        return await self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=CgroupMetricModel)
+
+    async def create(self, cgroup_stat: CgroupMetricModel) -> CgroupMetricModel:
+        return await self._post(
+            f"{self.DEFAULT_PREFIX}/", data=cgroup_stat.model_dump(), model=CgroupMetricModel
+        )
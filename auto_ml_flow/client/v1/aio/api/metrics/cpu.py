@@ -0,0 +1,17 @@
+from auto_ml_flow.client.async_base import AsyncBaseClient
+from auto_ml_flow.client.v1.models.metrics import CPUMetricModel
+
+
+class AsyncCPUMetricsClient(AsyncBaseClient):
+    DEFAULT_PREFIX = "/api/v1/cpu-stats"
+
+    async def list(self) -> list[CPUMetricModel]:
+        return await self._get(f"{self.DEFAULT_PREFIX}/", model=list[CPUMetricModel])
+
+    async def retrieve(self, id_: int) -> CPUMetricModel:
+        return await self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=CPUMetricModel)
+
+    async def create(self, cpu_stat: CPUMetricModel) -> CPUMetricModel:
+        return await self._post(
+            f"{self.DEFAULT_PREFIX}/", data=cpu_stat.model_dump(), model=CPUMetricModel
+        )
@@ -0,0 +1,17 @@
+from auto_ml_flow.client.async_base import AsyncBaseClient
+from auto_ml_flow.client.v1.models.metrics import DiskMetricModel
+
+
+class AsyncDiskMetricsClient(AsyncBaseClient):
+    DEFAULT_PREFIX = "/api/v1/disk-stats"
+
+    async def list(self) -> list[DiskMetricModel]:
+        return await self._get(f"{self.DEFAULT_PREFIX}/", model=list[DiskMetricModel])
+
+    async def retrieve(self, id_: int) -> DiskMetricModel:
+        return await self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=DiskMetricModel)
+
+    async def create(self, disk_stat: DiskMetricModel) -> DiskMetricModel:
+        return await self._post(
+            f"{self.DEFAULT_PREFIX}/", data=disk_stat.model_dump(), model=DiskMetricModel
+        )
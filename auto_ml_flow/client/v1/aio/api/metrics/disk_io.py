@@ -0,0 +1,20 @@
+from auto_ml_flow.client.async_base import AsyncBaseClient
+from auto_ml_flow.client.v1.models.metrics import DiskIOMetricModel
+
+
+class AsyncDiskIOMetricsClient(AsyncBaseClient):
+    DEFAULT_PREFIX = "/api/v1/disk-io-stats"
+
+    async def list(self) -> list[DiskIOMetricModel]:
+        return await self._get(f"{self.DEFAULT_PREFIX}/", model=list[DiskIOMetricModel])
+
+    async def retrieve(self, id_: int) -> DiskIOMetricModel:
+        return await self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=DiskIOMetricModel)
+
+    async def create(self, disk_io_stat: DiskIOMetricModel) -> DiskIOMetricModel:
+        # Devices are nested, so the payload can't be sent as form data
+        return await self._post(
+            f"{self.DEFAULT_PREFIX}/",
+            json=disk_io_stat.model_dump(mode="json"),
+            model=DiskIOMetricModel,
+        )
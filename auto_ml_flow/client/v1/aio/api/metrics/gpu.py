@@ -0,0 +1,18 @@
+from auto_ml_flow.client.async_base import AsyncBaseClient
+from auto_ml_flow.client.v1.models.metrics import GPUMetricModel
+
+
+class AsyncGPUMetricsClient(AsyncBaseClient):
+    DEFAULT_PREFIX = "/api/v1/gpu-stats"
+
+    async def list(self) -> list[GPUMetricModel]:
+        return await self._get(f"{self.DEFAULT_PREFIX}/", model=list[GPUMetricModel])
+
+    async def retrieve(self, id_: int) -> GPUMetricModel:
+        return await self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=GPUMetricModel)
+
+    async def create(self, gpu_stat: GPUMetricModel) -> GPUMetricModel:
+        # Devices are nested, so the payload can't be sent as form data
+        return await self._post(
+            f"{self.DEFAULT_PREFIX}/", json=gpu_stat.model_dump(mode="json"), model=GPUMetricModel
+        )
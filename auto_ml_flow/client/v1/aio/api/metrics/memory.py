@@ -0,0 +1,17 @@
+from auto_ml_flow.client.async_base import AsyncBaseClient
+from auto_ml_flow.client.v1.models.metrics import MemoryMetricModel
+
+
+class AsyncMemoryMetricsClient(AsyncBaseClient):
+    DEFAULT_PREFIX = "/api/v1/memory-stats"
+
+    async def list(self) -> list[MemoryMetricModel]:
+        return await self._get(f"{self.DEFAULT_PREFIX}/", model=list[MemoryMetricModel])
+
+    async def retrieve(self, id_: int) -> MemoryMetricModel:
+        return await self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=MemoryMetricModel)
+
+    async def create(self, memory_stat: MemoryMetricModel) -> MemoryMetricModel:
+        return await self._post(
+            f"{self.DEFAULT_PREFIX}/", data=memory_stat.model_dump(), model=MemoryMetricModel
+        )
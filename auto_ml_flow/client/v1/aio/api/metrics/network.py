@@ -0,0 +1,17 @@
+from auto_ml_flow.client.async_base import AsyncBaseClient
+from auto_ml_flow.client.v1.models.metrics import NetworkMetricModel
+
+
+class AsyncNetworkMetricsClient(AsyncBaseClient):
+    DEFAULT_PREFIX = "/api/v1/network-stats"
+
+    async def list(self) -> list[NetworkMetricModel]:
+        return await self._get(f"{self.DEFAULT_PREFIX}/", model=list[NetworkMetricModel])
+
+    async def retrieve(self, id_: int) -> NetworkMetricModel:
+        return await self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=NetworkMetricModel)
+
+    async def create(self, network_stat: NetworkMetricModel) -> NetworkMetricModel:
+        return await self._post(
+            f"{self.DEFAULT_PREFIX}/", data=network_stat.model_dump(), model=NetworkMetricModel
+        )
@@ -0,0 +1,20 @@
+from auto_ml_flow.client.async_base import AsyncBaseClient
+from auto_ml_flow.client.v1.models.metrics import NetworkIOMetricModel
+
+
+class AsyncNetworkIOMetricsClient(AsyncBaseClient):
+    DEFAULT_PREFIX = "/api/v1/network-io-stats"
+
+    async def list(self) -> list[NetworkIOMetricModel]:
+        return await self._get(f"{self.DEFAULT_PREFIX}/", model=list[NetworkIOMetricModel])
+
+    async def retrieve(self, id_: int) -> NetworkIOMetricModel:
+        return await self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=NetworkIOMetricModel)
+
+    async def create(self, network_io_stat: NetworkIOMetricModel) -> NetworkIOMetricModel:
+        # Interfaces are nested, so the payload can't be sent as form data
+        return await self._post(
+            f"{self.DEFAULT_PREFIX}/",
+            json=network_io_stat.model_dump(mode="json"),
+            model=NetworkIOMetricModel,
+        )
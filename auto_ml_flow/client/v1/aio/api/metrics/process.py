@@ -0,0 +1,17 @@
+from auto_ml_flow.client.async_base import AsyncBaseClient
+from auto_ml_flow.client.v1.models.metrics import ProcessMetricModel
+
+
+class AsyncProcessMetricsClient(AsyncBaseClient):
+    DEFAULT_PREFIX = "/api/v1/process-stats"
+
+    async def list(self) -> list[ProcessMetricModel]:
+        return await self._get(f"{self.DEFAULT_PREFIX}/", model=list[ProcessMetricModel])
+
+    async def retrieve(self, id_: int) -> ProcessMetricModel:
+        return await self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=ProcessMetricModel)
+
+    async def create(self, process_stat: ProcessMetricModel) -> ProcessMetricModel:
+        return await self._post(
+            f"{self.DEFAULT_PREFIX}/", data=process_stat.model_dump(), model=ProcessMetricModel
+        )
@@ -0,0 +1,11 @@
+from auto_ml_flow.client.async_base import AsyncBaseClient
+from auto_ml_flow.client.v1.models.predict import MetaAlgoFeatures, MetaAlgoPredictions
+
+
+class AsyncMetaAlgoClient(AsyncBaseClient):
+    DEFAULT_PREFIX = "/api/v1/meta-algos"
+
+    async def predict(self, param: MetaAlgoFeatures) -> MetaAlgoPredictions:
+        return await self._post(
+            f"{self.DEFAULT_PREFIX}/predict/", data=param.model_dump(), model=MetaAlgoPredictions
+        )
@@ -0,0 +1,37 @@
+from loguru import logger
+
+from auto_ml_flow.client.async_base import AsyncBaseClient
+from auto_ml_flow.client.exceptions import ClientMethodNotAllowedError, ClientNotFoundError
+from auto_ml_flow.client.v1.models.run_metrics import CreateRunMetricPayload, RunMetric
+
+
+class AsyncRunMetricsClient(AsyncBaseClient):
+    DEFAULT_PREFIX = "/api/v1/run-metrics"
+
+    # Cleared once the server answers it has no batch endpoint
+    batch_supported = True
+
+    # Defined before `list`, which shadows the builtin in the class body
+    async def create_batch(self, runs: list[CreateRunMetricPayload]) -> list[RunMetric]:
+        """Create run metrics in one request, or one by one if the server can't take batches."""
+        if self.batch_supported:
+            try:
+                return await self._post(
+                    f"{self.DEFAULT_PREFIX}/batch/",
+                    json=[run.model_dump(exclude_none=True) for run in runs],
+                    model=list[RunMetric],
+                )
+            except (ClientNotFoundError, ClientMethodNotAllowedError) as e:
+                logger.debug(f"Server doesn't take batches of run metrics, sent one by one: {e!r}")
+                self.batch_supported = False
+
+        return [await self.create(run) for run in runs]
+
+    async def list(self) -> list[RunMetric]:
+        return await self._get(f"{self.DEFAULT_PREFIX}/", model=list[RunMetric])
+
+    async def retrieve(self, id_: int) -> RunMetric:
+        return await self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=RunMetric)
+
+    async def create(self, run: CreateRunMetricPayload) -> RunMetric:
+        return await self._post(f"{self.DEFAULT_PREFIX}/", data=run.model_dump(), model=RunMetric)
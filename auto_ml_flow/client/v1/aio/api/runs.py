@@ -0,0 +1,36 @@
+from httpx import AsyncClient
+
+from auto_ml_flow.client.async_base import AsyncBaseClient
+from auto_ml_flow.client.v1.aio.api.param_metrics import AsyncParamsMetricsClient
+from auto_ml_flow.client.v1.aio.api.result_metrics import AsyncResultMetricsClient
+from auto_ml_flow.client.v1.aio.api.run_metrics import AsyncRunMetricsClient
+from auto_ml_flow.client.v1.models.runs import (
+    CreateRunPayload,
+    PatchRunPayload,
+    RunModel,
+)
+
+
+class AsyncRunsClient(AsyncBaseClient):
+    def __init__(self, base_url: str | None = None, session: AsyncClient | None = None) -> None:
+        super().__init__(base_url, session)
+
+        self.metrics = AsyncRunMetricsClient(base_url, session=self.session)
+        self.params = AsyncParamsMetricsClient(base_url, session=self.session)
+        self.results = AsyncResultMetricsClient(base_url, session=self.session)
+
+    DEFAULT_PREFIX = "/api/v1/runs"
+
+    async def list(self) -> list[RunModel]:
+        return await self._get(f"{self.DEFAULT_PREFIX}/", model=list[RunModel])
+
+    async def retrieve(self, id_: int) -> RunModel:
+        return await self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=RunModel)
+
+    async def create(self, run: CreateRunPayload) -> RunModel:
+        return await self._post(f"{self.DEFAULT_PREFIX}/", data=run.model_dump(), model=RunModel)
+
+    async def patch(self, id_: int, run: PatchRunPayload) -> RunModel:
+        return await self._patch(
+            f"{self.DEFAULT_PREFIX}/{id_}/", data=run.model_dump(), model=RunModel
+        )
@@ -0,0 +1,23 @@
+from httpx import AsyncClient
+
+from auto_ml_flow.client.async_base import AsyncBaseClient
+from auto_ml_flow.client.v1.aio.api.metrics import AsyncMetricsClient
+from auto_ml_flow.client.v1.models.systems import CreateSystemPayload, SystemModel
+
+
+class AsyncSystemsClient(AsyncBaseClient):
+    def __init__(self, base_url: str | None = None, session: AsyncClient | None = None) -> None:
+        super().__init__(base_url, session)
+
+        self.metrics = AsyncMetricsClient(base_url, self.session)
+
+    DEFAULT_PREFIX = "/api/v1/systems"
+
+    async def list(self) -> list[SystemModel]:
+        return await self._get(f"{self.DEFAULT_PREFIX}/", model=list[SystemModel])
+
+    async def retrieve(self, id_: int) -> SystemModel:
+        return await self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=SystemModel)
+
+    async def create(self, run: CreateSystemPayload) -> SystemModel:
+        return await self._post(f"{self.DEFAULT_PREFIX}/", data=run.model_dump(), model=SystemModel)
@@ -3,25 +3,72 @@ from typing import IO
 from requests import Session
 
 from auto_ml_flow.client.base import BaseClient
-from auto_ml_flow.client.v1.models.datasets import CreateDatasetPayload, DatasetModel
+from auto_ml_flow.client.multipart import Chunks, MultipartBody
+from auto_ml_flow.client.v1.api.uploads import DatasetUploadsClient
+from auto_ml_flow.client.v1.models.datasets import (
+    CreateDatasetPayload,
+    DatasetModel,
+    LinkDatasetPayload,
+)
 
 
 class DatasetsClient(BaseClient):
     def __init__(self, base_url: str | None = None, session: Session | None = None) -> None:
         super().__init__(base_url, session)
 
+        self.uploads = DatasetUploadsClient(base_url, session=self.session)
+
     DEFAULT_PREFIX = "/api/v1/datasets"
 
+    # Defined before `list`, which shadows the builtin in the class body
+    def find(self, hash_: str) -> list[DatasetModel]:
+        return self._get(
+            f"{self.DEFAULT_PREFIX}/", params={"hash": hash_}, model=list[DatasetModel]
+        )
+
     def list(self) -> list[DatasetModel]:
         return self._get(f"{self.DEFAULT_PREFIX}/", model=list[DatasetModel])
 
     def retrieve(self, id_: int) -> DatasetModel:
         return self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=DatasetModel)
 
+    def link(self, id_: int, link: LinkDatasetPayload) -> DatasetModel:
+        return self._post(
+            f"{self.DEFAULT_PREFIX}/{id_}/runs/", data=link.model_dump(), model=DatasetModel
+        )
+
     def create(self, dataset: CreateDatasetPayload, file: IO) -> DatasetModel:
         return self._post(
             f"{self.DEFAULT_PREFIX}/",
-            data=dataset.model_dump(),
+            data=dataset.model_dump(mode="json"),
             files={"file": (file.name, file)},
             model=DatasetModel,
         )
+
+    def upload(
+        self,
+        dataset: CreateDatasetPayload,
+        file_name: str,
+        chunks: Chunks,
+        content_type: str = "application/octet-stream",
+    ) -> DatasetModel:
+        """
+        Create a dataset whose file is streamed from `chunks` while it's sent.
+
+        Args:
+            dataset (CreateDatasetPayload): The dataset.
+            file_name (str): The name of the file.
+            chunks (Chunks): The function returning the content of the file, called again if
+                the request is retried.
+            content_type (str): The content type of the file.
+        """
+        body = MultipartBody(
+            dataset.model_dump(mode="json"), "file", file_name, chunks, content_type=content_type
+        )
+
+        return self._post(
+            f"{self.DEFAULT_PREFIX}/",
+            content=body,
+            headers={"Content-Type": body.content_type},
+            model=DatasetModel,
+        )
@@ -1,17 +1,33 @@
 from requests import Session
 
 from auto_ml_flow.client.base import BaseClient
+from auto_ml_flow.client.v1.api.metrics.cgroup import CgroupMetricsClient
 from auto_ml_flow.client.v1.api.metrics.cpu import CPUMetricsClient
 from auto_ml_flow.client.v1.api.metrics.disk import DiskMetricsClient
+from auto_ml_flow.client.v1.api.metrics.disk_io import DiskIOMetricsClient
+from auto_ml_flow.client.v1.api.metrics.gpu import GPUMetricsClient
 from auto_ml_flow.client.v1.api.metrics.memory import MemoryMetricsClient
 from auto_ml_flow.client.v1.api.metrics.network import NetworkMetricsClient
+from auto_ml_flow.client.v1.api.metrics.network_io import NetworkIOMetricsClient
+from auto_ml_flow.client.v1.api.metrics.process import ProcessMetricsClient
+from auto_ml_flow.client.v1.models.metrics import SystemMetricsBatchPayload
 
 
 class MetricsClient(BaseClient):
     def __init__(self, base_url: str | None = None, session: Session | None = None) -> None:
         super().__init__(base_url, session)
 
-        self.cpu_stats = CPUMetricsClient(base_url, session)
-        self.network_stats = NetworkMetricsClient(base_url, session)
-        self.memory_stats = MemoryMetricsClient(base_url, session)
-        self.disk_stats = DiskMetricsClient(base_url, session)
+        self.cpu_stats = CPUMetricsClient(base_url, self.session)
+        self.network_stats = NetworkMetricsClient(base_url, self.session)
+        self.memory_stats = MemoryMetricsClient(base_url, self.session)
+        self.disk_stats = DiskMetricsClient(base_url, self.session)
+        self.process_stats = ProcessMetricsClient(base_url, self.session)
+        self.gpu_stats = GPUMetricsClient(base_url, self.session)
+        self.disk_io_stats = DiskIOMetricsClient(base_url, self.session)
+        self.network_io_stats = NetworkIOMetricsClient(base_url, self.session)
+        self.cgroup_stats = CgroupMetricsClient(base_url, self.session)
+
+    DEFAULT_PREFIX = "/api/v1/system-metrics"
+
+    def create_batch(self, batch: SystemMetricsBatchPayload) -> None:
+        self._post(f"{self.DEFAULT_PREFIX}/batch/", json=batch.model_dump(mode="json"))
@@ -0,0 +1,17 @@
+from auto_ml_flow.client.base import BaseClient
+from auto_ml_flow.client.v1.models.metrics import CgroupMetricModel
+
+
+class CgroupMetricsClient(BaseClient):
+    DEFAULT_PREFIX = "/api/v1/cgroup-stats"
+
+    def list(self) -> list[CgroupMetricModel]:
+        return self._get(f"{self.DEFAULT_PREFIX}/", model=list[CgroupMetricModel])
+
+    def retrieve(self, id_: int) -> CgroupMetricModel:
+        return self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=CgroupMetricModel)
+
+    def create(self, cgroup_stat: CgroupMetricModel) -> CgroupMetricModel:
+        return self._post(
+            f"{self.DEFAULT_PREFIX}/", data=cgroup_stat.model_dump(), model=CgroupMetricModel
+        )
@@ -0,0 +1,20 @@
+from auto_ml_flow.client.base import BaseClient
+from auto_ml_flow.client.v1.models.metrics import DiskIOMetricModel
+
+
+class DiskIOMetricsClient(BaseClient):
+    DEFAULT_PREFIX = "/api/v1/disk-io-stats"
+
+    def list(self) -> list[DiskIOMetricModel]:
+        return self._get(f"{self.DEFAULT_PREFIX}/", model=list[DiskIOMetricModel])
+
+    def retrieve(self, id_: int) -> DiskIOMetricModel:
+        return self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=DiskIOMetricModel)
+
+    def create(self, disk_io_stat: DiskIOMetricModel) -> DiskIOMetricModel:
+        # Devices are nested, so the payload can't be sent as form data
+        return self._post(
+            f"{self.DEFAULT_PREFIX}/",
+            json=disk_io_stat.model_dump(mode="json"),
+            model=DiskIOMetricModel,
+        )
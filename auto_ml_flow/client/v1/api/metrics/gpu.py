@@ -0,0 +1,18 @@
+from auto_ml_flow.client.base import BaseClient
+from auto_ml_flow.client.v1.models.metrics import GPUMetricModel
+
+
+class GPUMetricsClient(BaseClient):
+    DEFAULT_PREFIX = "/api/v1/gpu-stats"
+
+    def list(self) -> list[GPUMetricModel]:
+        return self._get(f"{self.DEFAULT_PREFIX}/", model=list[GPUMetricModel])
+
+    def retrieve(self, id_: int) -> GPUMetricModel:
+        return self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=GPUMetricModel)
+
+    def create(self, gpu_stat: GPUMetricModel) -> GPUMetricModel:
+        # Devices are nested, so the payload can't be sent as form data
+        return self._post(
+            f"{self.DEFAULT_PREFIX}/", json=gpu_stat.model_dump(mode="json"), model=GPUMetricModel
+        )
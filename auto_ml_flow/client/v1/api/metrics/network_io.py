@@ -0,0 +1,20 @@
+from auto_ml_flow.client.base import BaseClient
+from auto_ml_flow.client.v1.models.metrics import NetworkIOMetricModel
+
+
+class NetworkIOMetricsClient(BaseClient):
+    DEFAULT_PREFIX = "/api/v1/network-io-stats"
+
+    def list(self) -> list[NetworkIOMetricModel]:
+        return self._get(f"{self.DEFAULT_PREFIX}/", model=list[NetworkIOMetricModel])
+
+    def retrieve(self, id_: int) -> NetworkIOMetricModel:
+        return self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=NetworkIOMetricModel)
+
+    def create(self, network_io_stat: NetworkIOMetricModel) -> NetworkIOMetricModel:
+        # Interfaces are nested, so the payload can't be sent as form data
+        return self._post(
+            f"{self.DEFAULT_PREFIX}/",
+            json=network_io_stat.model_dump(mode="json"),
+            model=NetworkIOMetricModel,
+        )
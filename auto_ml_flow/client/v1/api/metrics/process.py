@@ -0,0 +1,17 @@
+from auto_ml_flow.client.base import BaseClient
+from auto_ml_flow.client.v1.models.metrics import ProcessMetricModel
+
+
+class ProcessMetricsClient(BaseClient):
+    DEFAULT_PREFIX = "/api/v1/process-stats"
+
+    def list(self) -> list[ProcessMetricModel]:
+        return self._get(f"{self.DEFAULT_PREFIX}/", model=list[ProcessMetricModel])
+
+    def retrieve(self, id_: int) -> ProcessMetricModel:
+        return self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=ProcessMetricModel)
+
+    def create(self, process_stat: ProcessMetricModel) -> ProcessMetricModel:
+        return self._post(
+            f"{self.DEFAULT_PREFIX}/", data=process_stat.model_dump(), model=ProcessMetricModel
+        )
@@ -1,10 +1,32 @@
+from loguru import logger
+
 from auto_ml_flow.client.base import BaseClient
+from auto_ml_flow.client.exceptions import ClientMethodNotAllowedError, ClientNotFoundError
 from auto_ml_flow.client.v1.models.run_metrics import CreateRunParamPayload, ParamModel
 
 
 class ParamsMetricsClient(BaseClient):
     DEFAULT_PREFIX = "/api/v1/run-params"
 
+    # Cleared once the server answers it has no batch endpoint
+    batch_supported = True
+
+    # Defined before `list`, which shadows the builtin in the class body
+    def create_batch(self, params: list[CreateRunParamPayload]) -> list[ParamModel]:
+        """Create run params in one request, or one by one if the server can't take batches."""
+        if self.batch_supported:
+            try:
+                return self._post(
+                    f"{self.DEFAULT_PREFIX}/batch/",
+                    json=[param.model_dump(exclude_none=True) for param in params],
+                    model=list[ParamModel],
+                )
+            except (ClientNotFoundError, ClientMethodNotAllowedError) as e:
+                logger.debug(f"Server doesn't take batches of run params, sent one by one: {e!r}")
+                self.batch_supported = False
+
+        return [self.create(param) for param in params]
+
     def list(self) -> list[ParamModel]:
         return self._get(f"{self.DEFAULT_PREFIX}/", model=list[ParamModel])
 
@@ -4,6 +4,7 @@ from auto_ml_flow.client.v1.models.predict import MetaAlgoFeatures, MetaAlgoPred
 
 class MetaAlgoClient(BaseClient):
     DEFAULT_PREFIX = "/api/v1/meta-algos"
+    SPOOLED = False
 
     def predict(self, param: MetaAlgoFeatures) -> MetaAlgoPredictions:
         return self._post(
@@ -1,4 +1,7 @@
+from loguru import logger
+
 from auto_ml_flow.client.base import BaseClient
+from auto_ml_flow.client.exceptions import ClientMethodNotAllowedError, ClientNotFoundError
 from auto_ml_flow.client.v1.models.run_metrics import (
     CreateRunResultPayload,
     ResultModel,
@@ -8,6 +11,25 @@ from auto_ml_flow.client.v1.models.run_metrics import (
 class ResultMetricsClient(BaseClient):
     DEFAULT_PREFIX = "/api/v1/run-results"
 
+    # Cleared once the server answers it has no batch endpoint
+    batch_supported = True
+
+    # Defined before `list`, which shadows the builtin in the class body
+    def create_batch(self, results: list[CreateRunResultPayload]) -> list[ResultModel]:
+        """Create run results in one request, or one by one if the server can't take batches."""
+        if self.batch_supported:
+            try:
+                return self._post(
+                    f"{self.DEFAULT_PREFIX}/batch/",
+                    json=[result.model_dump(exclude_none=True) for result in results],
+                    model=list[ResultModel],
+                )
+            except (ClientNotFoundError, ClientMethodNotAllowedError) as e:
+                logger.debug(f"Server doesn't take batches of run results, sent one by one: {e!r}")
+                self.batch_supported = False
+
+        return [self.create(result) for result in results]
+
     def list(self) -> list[ResultModel]:
         return self._get(f"{self.DEFAULT_PREFIX}/", model=list[ResultModel])
 
@@ -15,9 +15,9 @@ class RunsClient(BaseClient):
     def __init__(self, base_url: str | None = None, session: Session | None = None) -> None:
         super().__init__(base_url, session)
 
-        self.metrics = RunMetricsClient(base_url, session=session)
-        self.params = ParamsMetricsClient(base_url, session=session)
-        self.results = ResultMetricsClient(base_url, session=session)
+        self.metrics = RunMetricsClient(base_url, session=self.session)
+        self.params = ParamsMetricsClient(base_url, session=self.session)
+        self.results = ResultMetricsClient(base_url, session=self.session)
 
     DEFAULT_PREFIX = "/api/v1/runs"
 
@@ -9,7 +9,7 @@ class SystemsClient(BaseClient):
     def __init__(self, base_url: str | None = None, session: Session | None = None) -> None:
         super().__init__(base_url, session)
 
-        self.metrics = MetricsClient(base_url, session)
+        self.metrics = MetricsClient(base_url, self.session)
 
     DEFAULT_PREFIX = "/api/v1/systems"
 
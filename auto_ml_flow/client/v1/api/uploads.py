@@ -0,0 +1,44 @@
+from requests import Session
+
+from auto_ml_flow.client.base import BaseClient
+from auto_ml_flow.client.v1.models.datasets import (
+    CommitDatasetUploadPayload,
+    CreateDatasetUploadPayload,
+    DatasetModel,
+    DatasetUploadModel,
+    DatasetUploadPartModel,
+)
+
+
+class DatasetUploadsClient(BaseClient):
+    def __init__(self, base_url: str | None = None, session: Session | None = None) -> None:
+        super().__init__(base_url, session)
+
+    DEFAULT_PREFIX = "/api/v1/datasets/uploads"
+    # Parts are only accepted for an upload the server has created
+    SPOOLED = False
+
+    def create(self, upload: CreateDatasetUploadPayload) -> DatasetUploadModel:
+        return self._post(
+            f"{self.DEFAULT_PREFIX}/", json=upload.model_dump(), model=DatasetUploadModel
+        )
+
+    def retrieve(self, id_: str) -> DatasetUploadModel:
+        return self._get(f"{self.DEFAULT_PREFIX}/{id_}/", model=DatasetUploadModel)
+
+    def upload_part(
+        self, id_: str, number: int, content: bytes, checksum: str
+    ) -> DatasetUploadPartModel:
+        return self._put(
+            f"{self.DEFAULT_PREFIX}/{id_}/parts/{number}/",
+            content=content,
+            headers={"Content-Type": "application/octet-stream", "Content-Digest": checksum},
+            model=DatasetUploadPartModel,
+        )
+
+    def commit(self, id_: str, upload: CommitDatasetUploadPayload) -> DatasetModel:
+        return self._post(
+            f"{self.DEFAULT_PREFIX}/{id_}/commit/",
+            json=upload.model_dump(mode="json"),
+            model=DatasetModel,
+        )
@@ -6,3 +6,10 @@ class Status(str, Enum):
     STARTED = "STARTED"
     FAILED = "FAILED"
     DONE = "DONE"
+
+
+class DatasetFormat(str, Enum):
+    PICKLE = "pickle"
+    NPY = "npy"
+    ARROW = "arrow"
+    PARQUET = "parquet"
@@ -1,12 +1,46 @@
 from pydantic import BaseModel
 
+from auto_ml_flow.client.v1.consts import DatasetFormat
+
 
 class CreateDatasetPayload(BaseModel):
     n_samples: int
     n_features: int
     run: int
+    # How the file is serialized, so it can be read, or memory-mapped, without guessing
+    format: DatasetFormat = DatasetFormat.PICKLE
+    # Digest of the content, e.g. `blake2b:<hex>`, so runs logging the same dataset share it
+    hash: str | None = None
+
+
+class LinkDatasetPayload(BaseModel):
+    run: int
 
 
 class DatasetModel(CreateDatasetPayload):
     id: int
     file: str
+
+
+class CreateDatasetUploadPayload(BaseModel):
+    file_name: str
+    part_size: int
+
+
+class DatasetUploadPartModel(BaseModel):
+    number: int
+    size: int
+    # `Content-Digest` of the part as received by the server, e.g. `sha-256=:<base64>:`
+    checksum: str
+
+
+class DatasetUploadModel(BaseModel):
+    id: str
+    file_name: str
+    part_size: int
+    # Parts received so far, so an interrupted upload sends only the others
+    parts: list[DatasetUploadPartModel] = []
+
+
+class CommitDatasetUploadPayload(CreateDatasetPayload):
+    parts: list[DatasetUploadPartModel]
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from pydantic import BaseModel
 
 
@@ -5,11 +7,13 @@ class MemoryMetricModel(BaseModel):
     usage_megabytes: float
     usage_percentage: float
     system: int
+    created_at: datetime | None = None
 
 
 class CPUMetricModel(BaseModel):
     utilization: float
     system: int
+    created_at: datetime | None = None
 
 
 class DiskMetricModel(BaseModel):
@@ -17,9 +21,113 @@ class DiskMetricModel(BaseModel):
     usage_megabytes: float
     available: float
     system: int
+    created_at: datetime | None = None
 
 
 class NetworkMetricModel(BaseModel):
     receive_megabytes: float
     transmit_megabytes: float
     system: int
+    created_at: datetime | None = None
+
+
+class ProcessMetricModel(BaseModel):
+    rss_megabytes: float
+    uss_megabytes: float | None = None
+    cpu_user_seconds: float
+    cpu_system_seconds: float
+    cpu_cores_used: float
+    num_processes: int
+    num_threads: int
+    num_fds: int | None = None
+    read_megabytes: float | None = None
+    write_megabytes: float | None = None
+    system: int
+    created_at: datetime | None = None
+
+
+class GPUDeviceMetricModel(BaseModel):
+    index: int
+    name: str
+    utilization_percentage: float | None = None
+    memory_used_megabytes: float | None = None
+    memory_total_megabytes: float | None = None
+    power_watts: float | None = None
+    temperature_celsius: float | None = None
+    sm_clock_mhz: float | None = None
+
+
+class GPUMetricModel(BaseModel):
+    devices: list[GPUDeviceMetricModel]
+    system: int
+    created_at: datetime | None = None
+
+
+class DiskIODeviceMetricModel(BaseModel):
+    device: str
+    read_bytes_per_second: float
+    write_bytes_per_second: float
+    read_iops: float
+    write_iops: float
+    busy_percentage: float | None = None
+
+
+class DiskIOMetricModel(BaseModel):
+    devices: list[DiskIODeviceMetricModel]
+    system: int
+    created_at: datetime | None = None
+
+
+class NetworkIOInterfaceMetricModel(BaseModel):
+    interface: str
+    receive_bytes_per_second: float
+    transmit_bytes_per_second: float
+    receive_packets_per_second: float
+    transmit_packets_per_second: float
+
+
+class NetworkIOMetricModel(BaseModel):
+    interfaces: list[NetworkIOInterfaceMetricModel]
+    system: int
+    created_at: datetime | None = None
+
+
+class CgroupMetricModel(BaseModel):
+    cpu_limit_cores: float | None = None
+    cpu_usage_cores: float | None = None
+    cpu_throttled_percentage: float | None = None
+    cpu_throttled_seconds: float | None = None
+    memory_max_megabytes: float | None = None
+    memory_usage_megabytes: float | None = None
+    memory_pressure_some_percentage: float | None = None
+    memory_pressure_full_percentage: float | None = None
+    system: int
+    created_at: datetime | None = None
+
+
+class MetricAggregateModel(BaseModel):
+    name: str
+    count: int
+    min: float
+    max: float
+    mean: float
+    p50: float
+    p95: float
+    last: float
+    window_start: datetime
+    window_end: datetime
+    is_summary: bool = False
+    system: int
+
+
+class SystemMetricsBatchPayload(BaseModel):
+    cpu_stats: list[CPUMetricModel] = []
+    disk_stats: list[DiskMetricModel] = []
+    memory_stats: list[MemoryMetricModel] = []
+    network_stats: list[NetworkMetricModel] = []
+    process_stats: list[ProcessMetricModel] = []
+    gpu_stats: list[GPUMetricModel] = []
+    disk_io_stats: list[DiskIOMetricModel] = []
+    network_io_stats: list[NetworkIOMetricModel] = []
+    cgroup_stats: list[CgroupMetricModel] = []
+    aggregates: list[MetricAggregateModel] = []
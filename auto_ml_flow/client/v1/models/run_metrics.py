@@ -10,12 +10,14 @@ class RunMetric(BaseModel):
     created_at: datetime
     updated_at: datetime
     run: int
+    step: int | None = None
 
 
 class CreateRunMetricPayload(BaseModel):
     key: str
     value: float
     run: int
+    step: int | None = None
 
 
 class ParamModel(RunMetric):
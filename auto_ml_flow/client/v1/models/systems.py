@@ -4,6 +4,8 @@ from pydantic import BaseModel
 class SystemInfoModel(BaseModel):
     name: str | None = None
     cpu_name: str
+    # The number of CPUs the container quota allows, None without quota
+    cpu_limit: float | None = None
     gpu_name: str | None = None
     ram: int
     ram_available: int
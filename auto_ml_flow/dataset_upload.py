@@ -0,0 +1,230 @@
+"""Dataset uploads running in the background, while the training goes on."""
+
+import itertools
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import CancelledError, Future
+from pathlib import Path
+from typing import Literal
+
+from loguru import logger
+
+from auto_ml_flow.client.exceptions import ClientError
+from auto_ml_flow.client.multipart import Chunks
+from auto_ml_flow.client.v1.models.datasets import DatasetModel
+from auto_ml_flow.serializers.base import Chunk
+
+# What is done with uploads still in progress when their run ends: wait for them, cancel
+# them, or write them to the offline spool, to be sent by the replay CLI
+UploadPolicy = Literal["wait", "cancel", "spool"]
+# Logs metrics of the run at a step
+Report = Callable[[dict[str, float], int], None]
+
+REPORT_INTERVAL = 5.0
+
+
+class UploadCancelledError(CancelledError):
+    """The upload was cancelled while it was running."""
+
+
+class DatasetUpload:
+    """
+    Handle of a dataset upload, returned by `AutoMLFlow.log_dataset` before it's done.
+
+    While the file is sent, the megabytes read so far and the throughput are logged as the
+    `dataset_upload_mb` and `dataset_upload_mb_per_s` metrics of the run.
+    """
+
+    def __init__(
+        self,
+        report: Report | None = None,
+        spool: Callable[[], Path | None] | None = None,
+        report_interval: float = REPORT_INTERVAL,
+        steps: Iterator[int] | None = None,
+    ) -> None:
+        """
+        Initialize the handle.
+
+        Args:
+            report (Report | None): The function logging progress metrics of the run. If
+                None, progress is not reported.
+            spool (Callable[[], Path | None] | None): The function writing the upload to the
+                offline spool. If None, the upload can't be spooled.
+            report_interval (float): The interval (in seconds) at which progress is reported.
+            steps (Iterator[int] | None): The steps progress is reported at. Uploads of the
+                same run share them, so their progress metrics don't overwrite each other.
+                Defaults to steps from 0.
+        """
+        self.report = report
+        self.report_interval = report_interval
+        self.bytes_sent = 0
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self._spool = spool
+        self._future: Future[DatasetModel] = Future()
+        self._cancelled = threading.Event()
+        self._reported_at = 0.0
+        self._steps = steps if steps is not None else itertools.count()
+
+    def run(self, upload: Callable[[], DatasetModel]) -> None:
+        """Run the upload in the calling thread, and resolve the handle with its result."""
+        if not self._future.set_running_or_notify_cancel():
+            return
+
+        try:
+            result = upload()
+        except BaseException as e:  # noqa: BLE001
+            self.finished_at = time.monotonic()
+            self._future.set_exception(e)
+            return
+
+        self.finished_at = time.monotonic()
+        if self.bytes_sent:
+            self._report()
+
+        self._future.set_result(result)
+
+    def track(self, chunks: Chunks) -> Chunks:
+        """Wrap the content of the file, to measure progress and stop when cancelled."""
+
+        def tracked() -> Iterator[Chunk]:
+            self.bytes_sent = 0
+            self.started_at = self._reported_at = time.monotonic()
+            iterator = iter(chunks())
+            try:
+                for chunk in iterator:
+                    self.raise_if_cancelled()
+
+                    self.bytes_sent += len(chunk)
+                    if time.monotonic() - self._reported_at >= self.report_interval:
+                        self._report()
+
+                    yield chunk
+            finally:
+                # Stops the serializer thread at once if the upload stops before the end
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    close()
+
+        return tracked
+
+    def _report(self) -> None:
+        self._reported_at = time.monotonic()
+        if self.report is None:
+            return
+
+        try:
+            self.report(
+                {
+                    "dataset_upload_mb": self.bytes_sent / 1e6,
+                    "dataset_upload_mb_per_s": self.throughput / 1e6,
+                },
+                next(self._steps),
+            )
+        except ClientError as e:
+            logger.debug(f"Failed to report the progress of the dataset upload: {e!r}")
+
+    @property
+    def throughput(self) -> float:
+        """The average throughput (in bytes per second) of the upload so far."""
+        if self.started_at is None:
+            return 0.0
+
+        elapsed = (self.finished_at or time.monotonic()) - self.started_at
+
+        return self.bytes_sent / elapsed if elapsed > 0 else 0.0
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def cancelled(self) -> bool:
+        if not self._future.done():
+            return False
+
+        return self._future.cancelled() or isinstance(self._future.exception(), CancelledError)
+
+    def result(self, timeout: float | None = None) -> DatasetModel:
+        """
+        Wait for the upload and return the dataset.
+
+        Raises:
+            CancelledError: If the upload was cancelled.
+            TimeoutError: If the upload is not done within `timeout` seconds.
+        """
+        return self._future.result(timeout)
+
+    def exception(self, timeout: float | None = None) -> BaseException | None:
+        return self._future.exception(timeout)
+
+    def add_done_callback(self, callback: Callable[["DatasetUpload"], None]) -> None:
+        self._future.add_done_callback(lambda _: callback(self))
+
+    def cancel(self) -> None:
+        """
+        Cancel the upload. A running upload stops at the next chunk it hashes or sends, or
+        after the lookup by hash.
+        """
+        self._cancelled.set()
+        self._future.cancel()
+
+    def cancel_requested(self) -> bool:
+        """Whether `cancel` was called, though the upload may still be stopping."""
+        return self._cancelled.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Raise UploadCancelledError if `cancel` was called. Called by the upload between its
+        steps.
+        """
+        if self._cancelled.is_set():
+            raise UploadCancelledError
+
+    def spool(self) -> Path | None:
+        """
+        Cancel the upload and write it to the offline spool, unless it's done meanwhile.
+
+        Returns:
+            Path | None: The spooled request, or None if the upload was done or can't be
+                spooled.
+        """
+        self.cancel()
+        try:
+            self.result()
+        except CancelledError:
+            pass
+        except Exception:  # noqa: BLE001
+            # Spooled all the same, e.g. the server was unavailable
+            logger.debug("Dataset upload failed, it's spooled.")
+        else:
+            return None
+
+        if self._spool is None:
+            logger.warning("Dataset upload can't be spooled, it's cancelled.")
+            return None
+
+        return self._spool()
+
+
+def finish_uploads(uploads: list[DatasetUpload], policy: UploadPolicy) -> None:
+    """
+    Finish the uploads of a run which ends, according to the policy.
+
+    Errors of the uploads are logged, so they don't fail the run.
+    """
+    for upload in uploads:
+        if not upload.done():
+            if policy == "cancel":
+                upload.cancel()
+            elif policy == "spool":
+                path = upload.spool()
+                if path is not None:
+                    logger.info(f"Dataset upload is spooled to {path}.")
+                    continue
+
+        try:
+            upload.result()
+        except CancelledError:
+            continue
+        except Exception as e:  # noqa: BLE001
+            logger.error(f"Failed to upload the dataset: {e!r}")
@@ -0,0 +1,327 @@
+"""Logging to the run of the parent process from worker processes."""
+
+import base64
+import contextlib
+import itertools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Literal, NamedTuple, Self
+
+from loguru import logger
+
+from auto_ml_flow.background import BackgroundLogger, RunRecord
+from auto_ml_flow.client.v1 import AutoMLFlowClient
+from auto_ml_flow.client.v1.models.run_metrics import (
+    CreateRunMetricPayload,
+    CreateRunParamPayload,
+    CreateRunResultPayload,
+)
+
+# Workers started inside `AutoMLFlow.serve_workers` inherit the token through environment
+TOKEN_ENV = "AUTO_ML_FLOW_RUN_TOKEN"  # noqa: S105
+
+Reduce = Literal["mean", "sum"]
+
+
+class RunToken(NamedTuple):
+    """Everything a worker needs to log to the run: where to connect and the secret."""
+
+    address: str
+    authkey: bytes
+    run: int
+
+    def encode(self) -> str:
+        content = json.dumps([self.address, self.authkey.hex(), self.run])
+
+        return base64.urlsafe_b64encode(content.encode()).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "RunToken":
+        address, authkey, run = json.loads(base64.urlsafe_b64decode(token))
+
+        return cls(address, bytes.fromhex(authkey), run)
+
+
+class WorkerFanIn:
+    """
+    Receiver of records logged by worker processes to the run of the parent process.
+
+    Workers connect over a local socket, authenticated by the run token, and their records
+    are uploaded in batches through the parent's client, so the server sees one run and one
+    set of connections.
+    """
+
+    def __init__(
+        self,
+        run: int,
+        client: AutoMLFlowClient,
+        reduce: Reduce | None = None,
+        world_size: int | None = None,
+    ) -> None:
+        """
+        Initialize the fan-in.
+
+        Args:
+            run (int): The id of the run the records are logged to.
+            client (AutoMLFlowClient): The client uploading the records.
+            reduce (Reduce | None): If set, values of a metric logged by all workers at the
+                same step are merged into one value, their mean or sum. Metrics logged without
+                step are never reduced.
+            world_size (int | None): The number of workers values are reduced over. Defaults
+                to the workers connected at the time, so set it when workers connect at
+                different times.
+        """
+        self.run = run
+        self.reduce = reduce
+        self.world_size = world_size
+        self._background = BackgroundLogger(client=client)
+        self._listener: Listener | None = None
+        self._token: RunToken | None = None
+        self._acceptor: threading.Thread | None = None
+        self._readers: list[threading.Thread] = []
+        # Workers connected at the moment, which values are reduced over by default
+        self._workers: set[int] = set()
+        self._worker_ids = itertools.count()
+        self._closed = threading.Event()
+        # Values of reduced metrics waiting for the other workers, with the workers which
+        # logged them, by key and step
+        self._pending: defaultdict[tuple[str, int], list[tuple[int, float]]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def start(self) -> RunToken:
+        """Start accepting workers and return the token they connect with."""
+        if self._token is not None:
+            return self._token
+
+        authkey = os.urandom(32)
+        # A UNIX socket in a temporary directory, or a named pipe on Windows
+        self._listener = Listener(authkey=authkey)
+        self._token = RunToken(str(self._listener.address), authkey, self.run)
+        self._background.start()
+        self._acceptor = threading.Thread(target=self._accept, daemon=True)
+        self._acceptor.start()
+
+        return self._token
+
+    def _accept(self) -> None:
+        if self._listener is None:
+            return
+
+        while not self._closed.is_set():
+            try:
+                conn = self._listener.accept()
+            except (OSError, EOFError, AuthenticationError) as e:
+                # E.g. a client with a wrong token
+                if not self._closed.is_set():
+                    logger.warning(f"Failed to accept a worker: {e!r}")
+                continue
+
+            if self._closed.is_set():
+                conn.close()
+                return
+
+            worker = next(self._worker_ids)
+            with self._lock:
+                self._workers.add(worker)
+
+            reader = threading.Thread(target=self._serve, args=(conn, worker), daemon=True)
+            reader.start()
+            self._readers.append(reader)
+
+    def _serve(self, conn: Connection, worker: int) -> None:
+        try:
+            with conn:
+                while True:
+                    try:
+                        records: list[RunRecord] = conn.recv()
+                    except (EOFError, OSError):
+                        return
+
+                    for record in records:
+                        self._handle(record, worker)
+        finally:
+            self._disconnect(worker)
+
+    def _disconnect(self, worker: int) -> None:
+        with self._lock:
+            self._workers.discard(worker)
+            # Values which were waiting only for the worker which left are complete now
+            complete = {
+                key: entries for key, entries in self._pending.items() if self._complete(entries)
+            }
+            for key in complete:
+                del self._pending[key]
+
+        for key, entries in complete.items():
+            self._log_reduced(key, entries)
+
+    def _complete(self, entries: list[tuple[int, float]]) -> bool:
+        if self.world_size is not None:
+            return len(entries) >= self.world_size
+
+        return self._workers <= {worker for worker, _ in entries}
+
+    def _handle(self, record: RunRecord, worker: int) -> None:
+        if record.run != self.run:
+            logger.warning(f"Dropped a record of run {record.run} sent to run {self.run}.")
+            return
+
+        if self.reduce is None or type(record) is not CreateRunMetricPayload or record.step is None:
+            self._background.log(record)
+            return
+
+        key = (record.key, record.step)
+        with self._lock:
+            entries = self._pending[key]
+            entries.append((worker, record.value))
+            if not self._complete(entries):
+                return
+
+            del self._pending[key]
+
+        self._log_reduced(key, entries)
+
+    def _log_reduced(self, key: tuple[str, int], entries: list[tuple[int, float]]) -> None:
+        value = sum(value for _, value in entries)
+        if self.reduce == "mean":
+            value /= len(entries)
+
+        self._background.log(
+            CreateRunMetricPayload(key=key[0], value=value, run=self.run, step=key[1])
+        )
+
+    def close(self, timeout: float = 10) -> None:
+        """
+        Stop accepting workers and upload the remaining records.
+
+        Values which are still waiting for other workers are reduced over the workers which
+        logged them.
+
+        Args:
+            timeout (float): The maximum time (in seconds) to wait for connected workers to
+                close their connections, and then for the records to be sent.
+        """
+        if self._listener is None or self._token is None:
+            return
+
+        self._closed.set()
+        # Wake up the acceptor blocked in `accept`
+        with contextlib.suppress(OSError):
+            Client(self._token.address, authkey=self._token.authkey).close()
+
+        if self._acceptor is not None:
+            self._acceptor.join()
+
+        deadline = time.monotonic() + timeout
+        for reader in self._readers:
+            reader.join(max(deadline - time.monotonic(), 0))
+            if reader.is_alive():
+                logger.warning("A worker didn't close its connection, its records are lost.")
+
+        self._listener.close()
+        self._listener = None
+
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(list)
+
+        for key, entries in pending.items():
+            self._log_reduced(key, entries)
+
+        self._background.finish(max(deadline - time.monotonic(), 0))
+
+
+class WorkerLogger:
+    """Logger of a worker process sending records to the run of the parent process."""
+
+    def __init__(
+        self, token: str | None = None, max_batch_size: int = 100, flush_interval: float = 1
+    ) -> None:
+        """
+        Connect to the run.
+
+        Args:
+            token (str | None): The token returned by `AutoMLFlow.serve_workers`. Defaults to
+                the token inherited from the parent process through environment.
+            max_batch_size (int): The maximum number of records sent in one message.
+            flush_interval (float): The maximum time (in seconds) records are buffered for.
+        """
+        token = token or os.environ.get(TOKEN_ENV)
+        if not token:
+            raise ValueError(
+                "Run token is not set. Start workers inside 'with AutoMLFlow.serve_workers()'"
+            )
+
+        self.token = RunToken.decode(token)
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self._conn: Connection | None = Client(self.token.address, authkey=self.token.authkey)
+        self._buffer: list[RunRecord] = []
+        self._flushed_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def _log(self, record: RunRecord) -> None:
+        with self._lock:
+            self._buffer.append(record)
+            if (
+                len(self._buffer) < self.max_batch_size
+                and time.monotonic() - self._flushed_at < self.flush_interval
+            ):
+                return
+
+            self._flush()
+
+    def _flush(self) -> None:
+        self._flushed_at = time.monotonic()
+        records, self._buffer = self._buffer, []
+        if not records or self._conn is None:
+            return
+
+        try:
+            self._conn.send(records)
+        except OSError as e:
+            logger.error(f"Failed to send {len(records)} records to the run: {e!r}")
+
+    def flush(self) -> None:
+        """Send the buffered records at once."""
+        with self._lock:
+            self._flush()
+
+    def log_metric(self, key: str, value: float, step: int | None = None) -> None:
+        self._log(CreateRunMetricPayload(key=key, value=value, run=self.token.run, step=step))
+
+    def log_metrics(self, metrics: dict[str, float], step: int | None = None) -> None:
+        for key, value in metrics.items():
+            self.log_metric(key, value, step=step)
+
+    def log_param(self, key: str, value: str | float) -> None:
+        self._log(CreateRunParamPayload(key=key, value=value, run=self.token.run))
+
+    def log_params(self, params: dict[str, str | float]) -> None:
+        for key, value in params.items():
+            self.log_param(key, value)
+
+    def log_result(self, key: str, value: float) -> None:
+        self._log(CreateRunResultPayload(key=key, value=value, run=self.token.run))
+
+    def log_results(self, results: dict[str, float]) -> None:
+        for key, value in results.items():
+            self.log_result(key, value)
+
+    def close(self) -> None:
+        """Send the buffered records and disconnect."""
+        with self._lock:
+            self._flush()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,153 @@
+"""Asynchronous counterparts of the handlers, working with `AsyncAutoMLFlowClient`."""
+
+from collections.abc import Sequence
+
+from loguru import logger
+
+from auto_ml_flow.client.exceptions import ClientNotFoundError
+from auto_ml_flow.client.v1.aio import AsyncAutoMLFlowClient
+from auto_ml_flow.client.v1.consts import Status
+from auto_ml_flow.client.v1.models.experiments import (
+    CreateExperimentPayload,
+    ExperimentModel,
+)
+from auto_ml_flow.client.v1.models.run_metrics import (
+    CreateRunMetricPayload,
+    CreateRunParamPayload,
+    CreateRunResultPayload,
+    ParamModel,
+    ResultModel,
+    RunMetric,
+)
+from auto_ml_flow.client.v1.models.runs import (
+    CreateRunPayload,
+    PatchRunPayload,
+    RunModel,
+)
+from auto_ml_flow.client.v1.models.systems import CreateSystemPayload, SystemModel
+
+
+async def get_or_create_experiment(
+    name: str, client: AsyncAutoMLFlowClient, description: str | None = None
+) -> ExperimentModel:
+    try:
+        return await client.experiments.retrieve(name)
+    except ClientNotFoundError:
+        payload = CreateExperimentPayload(name=name, description=description)
+
+        return await client.experiments.create(payload)
+
+
+async def run_started(
+    experiment_id: int, client: AsyncAutoMLFlowClient, description: str | None = None
+) -> RunModel:
+    payload = CreateRunPayload(experiment=experiment_id, description=description)
+
+    return await client.runs.create(payload)
+
+
+async def run_ended(
+    run_id: int,
+    status: Status,
+    duration: float,
+    client: AsyncAutoMLFlowClient,
+    traceback: str | None = None,
+) -> RunModel:
+    payload = PatchRunPayload(status=status, duration=duration, traceback=traceback)
+
+    logger.info(
+        f"The launch has been completed with status {status}. The duration was: {duration} seconds"
+    )
+
+    return await client.runs.patch(id_=run_id, run=payload)
+
+
+async def create_system(system: CreateSystemPayload, client: AsyncAutoMLFlowClient) -> SystemModel:
+    return await client.systems.create(system)
+
+
+async def add_metric_to(
+    run: RunModel, key: str, value: float, client: AsyncAutoMLFlowClient, step: int | None = None
+) -> RunMetric:
+    payload = CreateRunMetricPayload(key=key, value=value, run=run.id, step=step)
+
+    return await client.runs.metrics.create(payload)
+
+
+async def add_result_to(
+    run: RunModel, key: str, value: float, client: AsyncAutoMLFlowClient
+) -> RunMetric:
+    payload = CreateRunResultPayload(key=key, value=value, run=run.id)
+
+    return await client.runs.results.create(payload)
+
+
+async def add_param_to(
+    run: RunModel, key: str, value: str, client: AsyncAutoMLFlowClient
+) -> RunMetric:
+    payload = CreateRunParamPayload(key=key, value=value, run=run.id)
+
+    return await client.runs.params.create(payload)
+
+
+async def add_metrics_to(
+    run: RunModel,
+    metrics: dict[str, float],
+    client: AsyncAutoMLFlowClient,
+    step: int | None = None,
+) -> list[RunMetric]:
+    payloads = [
+        CreateRunMetricPayload(key=key, value=value, run=run.id, step=step)
+        for key, value in metrics.items()
+    ]
+    if not payloads:
+        return []
+
+    return await client.runs.metrics.create_batch(payloads)
+
+
+async def add_metric_series_to(
+    run: RunModel,
+    key: str,
+    values: Sequence[float],
+    client: AsyncAutoMLFlowClient,
+    steps: Sequence[int] | None = None,
+) -> list[RunMetric]:
+    if steps is None:
+        steps = range(len(values))
+
+    if len(steps) != len(values):
+        raise ValueError(f"Got {len(values)} values but {len(steps)} steps for metric {key!r}")
+
+    payloads = [
+        CreateRunMetricPayload(key=key, value=value, run=run.id, step=step)
+        for value, step in zip(values, steps, strict=True)
+    ]
+    if not payloads:
+        return []
+
+    return await client.runs.metrics.create_batch(payloads)
+
+
+async def add_results_to(
+    run: RunModel, results: dict[str, float], client: AsyncAutoMLFlowClient
+) -> list[ResultModel]:
+    payloads = [
+        CreateRunResultPayload(key=key, value=value, run=run.id) for key, value in results.items()
+    ]
+    if not payloads:
+        return []
+
+    return await client.runs.results.create_batch(payloads)
+
+
+async def add_params_to(
+    run: RunModel, params: dict[str, str | float], client: AsyncAutoMLFlowClient
+) -> list[ParamModel]:
+    payloads = [
+        CreateRunParamPayload(key=key, value=value, run=run.id) for key, value in params.items()
+    ]
+    if not payloads:
+        return []
+
+    return await client.runs.params.create_batch(payloads)
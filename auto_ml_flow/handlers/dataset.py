@@ -1,8 +1,23 @@
-from typing import IO
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import IO, Any
 
+from loguru import logger
+
+from auto_ml_flow.client.exceptions import ClientError
+from auto_ml_flow.client.multipart import Chunks
+from auto_ml_flow.client.resumable import ResumableUpload
+from auto_ml_flow.client.spool import spool_file
 from auto_ml_flow.client.v1 import AutoMLFlowClient
-from auto_ml_flow.client.v1.models.datasets import CreateDatasetPayload, DatasetModel
+from auto_ml_flow.client.v1.api.datasets import DatasetsClient
+from auto_ml_flow.client.v1.models.datasets import (
+    CreateDatasetPayload,
+    DatasetModel,
+    LinkDatasetPayload,
+)
 from auto_ml_flow.client.v1.models.runs import RunModel
+from auto_ml_flow.serializers import DatasetSerializer
 
 
 def add_dataset_to(
@@ -11,3 +26,104 @@ def add_dataset_to(
     payload = CreateDatasetPayload(n_features=n_features, n_samples=n_samples, run=run.id)
 
     return client.datasets.create(payload, file=file)
+
+
+def upload_dataset_to(
+    run: RunModel,
+    n_features: int,
+    n_samples: int,
+    data: Any,  # noqa: ANN401
+    client: AutoMLFlowClient,
+    *,
+    serializer: DatasetSerializer,
+    hash_: str | None = None,
+    track: Callable[[Chunks], Chunks] | None = None,
+) -> DatasetModel:
+    payload = CreateDatasetPayload(
+        n_features=n_features,
+        n_samples=n_samples,
+        run=run.id,
+        format=serializer.format,
+        hash=hash_,
+    )
+
+    file_name = f"run_{run.id}.{serializer.extension}"
+    # Serialized while it's sent, so neither a temporary file nor a serialized copy is needed
+    chunks: Chunks = partial(serializer.chunks, data)
+    if track is not None:
+        chunks = track(chunks)
+
+    dataset = ResumableUpload(client.datasets.uploads).upload(payload, file_name, chunks)
+    if dataset is not None:
+        return dataset
+
+    # Servers without uploads in parts get the file in one request
+    return client.datasets.upload(payload, file_name, chunks, content_type=serializer.content_type)
+
+
+def spool_dataset_of(
+    run: RunModel,
+    n_features: int,
+    n_samples: int,
+    data: Any,  # noqa: ANN401
+    *,
+    serializer: DatasetSerializer,
+    hash_: str | None = None,
+) -> Path | None:
+    """Write the dataset to the offline spool, to be uploaded by the replay CLI."""
+    if run.id < 0:
+        # The id the server gives the run is known only to the log of this process
+        logger.warning(
+            f"Run {run.id} is not created on the server yet, its dataset can't be spooled."
+        )
+        return None
+
+    payload = CreateDatasetPayload(
+        n_features=n_features,
+        n_samples=n_samples,
+        run=run.id,
+        format=serializer.format,
+        hash=hash_,
+    )
+
+    return spool_file(
+        f"{DatasetsClient.DEFAULT_PREFIX}/",
+        payload.model_dump(mode="json"),
+        "file",
+        f"run_{run.id}.{serializer.extension}",
+        partial(serializer.chunks, data),
+        content_type=serializer.content_type,
+    )
+
+
+def link_existing_dataset(
+    run: RunModel, hash_: str, client: AutoMLFlowClient, *, serializer: DatasetSerializer
+) -> DatasetModel | None:
+    """
+    Link the run to the dataset with the same content, if the server already has one.
+
+    The dataset must have been uploaded in the format of `serializer` too, since the digest
+    doesn't depend on the format, while readers of the dataset do.
+    """
+    try:
+        # Servers which don't filter by hash return all datasets, so the hash is checked here
+        dataset = next(
+            (
+                item
+                for item in client.datasets.find(hash_)
+                if item.hash == hash_ and item.format == serializer.format
+            ),
+            None,
+        )
+        if dataset is None:
+            return None
+
+        linked = client.datasets.link(dataset.id, LinkDatasetPayload(run=run.id))
+    except ClientError as e:
+        # E.g. a server without these endpoints. If it's unavailable, the upload fails too
+        logger.debug(f"Failed to look up the dataset by hash, the dataset is uploaded: {e!r}")
+        return None
+
+    logger.info(f"Dataset {dataset.id} has the same content, linked it to run {run.id}.")
+
+    return linked
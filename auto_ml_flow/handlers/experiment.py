@@ -1,4 +1,5 @@
-from auto_ml_flow.client.exceptions import ClientNotFoundError
+from auto_ml_flow.client.exceptions import ClientConnectionError, ClientNotFoundError
+from auto_ml_flow.client.spool import SpoolSession
 from auto_ml_flow.client.v1 import AutoMLFlowClient
 from auto_ml_flow.client.v1.models.experiments import (
     CreateExperimentPayload,
@@ -25,3 +26,9 @@ def get_or_create_experiment(
         return get_experiment_by(name, client)
     except ClientNotFoundError:
         return create_experiment(name=name, description=description, client=client)
+    except ClientConnectionError:
+        if not isinstance(client.session, SpoolSession):
+            raise
+
+        # The spooled creation falls back to the lookup on replay if the experiment exists
+        return create_experiment(name=name, description=description, client=client)
@@ -0,0 +1,70 @@
+from auto_ml_flow.client.v1 import AutoMLFlowClient
+from auto_ml_flow.client.v1.models.predict import MetaAlgoFeatures, MetaAlgoPredictions
+from auto_ml_flow.client.v1.models.systems import SystemInfoModel
+from auto_ml_flow.metrics.cgroup import get_cgroup
+from auto_ml_flow.metrics.monitor.aggregate import WindowAggregator
+from auto_ml_flow.metrics.monitor.base import BaseMetricsMonitor
+from auto_ml_flow.metrics.monitor.cpu import CPUMonitor
+from auto_ml_flow.metrics.monitor.disk import DiskMonitor
+from auto_ml_flow.metrics.monitor.memory import MemoryMonitor
+from auto_ml_flow.metrics.monitor.network import NetworkMonitor
+
+
+def get_training_time_features(
+    system_info: SystemInfoModel,
+    n_features: int,
+    n_samples: int,
+    aggregator: WindowAggregator | None = None,
+    monitors: list[BaseMetricsMonitor] | None = None,
+) -> MetaAlgoFeatures:
+    metrics = {}
+
+    # Inside a container, CPU and memory are measured against its limits, like by the monitors
+    # of the run
+    cgroup = get_cgroup()
+    snapshot = [
+        CPUMonitor(cgroup=cgroup),
+        DiskMonitor(),
+        NetworkMonitor(),
+        MemoryMonitor(cgroup=cgroup),
+    ]
+    for monitor in snapshot:
+        monitor.collect_metrics()
+        metrics.update(monitor.metrics)
+
+    # The last readings of the run's monitors are measured over a whole interval
+    for monitor in monitors or []:
+        metrics.update(monitor.metrics)
+
+    if aggregator is not None:
+        # Averages over the run describe the load better than a single snapshot. Network
+        # metrics are counted from the start of monitoring, so the last value is the sum.
+        for name, stats in aggregator.run_stats().items():
+            metrics[name] = stats["last" if name.startswith("network_") else "mean"]
+
+    metrics.update(system_info.model_dump())
+
+    return MetaAlgoFeatures(
+        system_ram=metrics["ram"],
+        system_swap=metrics["swap"],
+        system_swap_available=metrics["swap_available"],
+        system_load_avg_last_min=metrics["load_avg_last_min"],
+        system_load_avg_last_5_min=metrics["load_avg_last_5_min"],
+        system_load_avg_last_15_min=metrics["load_avg_last_15_min"],
+        avg_memory_usage_megabytes=metrics["system_memory_usage_megabytes"],
+        avg_memory_usage_percentage=metrics["system_memory_usage_percentage"],
+        avg_cpu_utilization=metrics["cpu_utilization_percentage"],
+        avg_disk_usage_percentage=metrics["disk_usage_percentage"],
+        avg_disk_usage_megabytes=metrics["disk_usage_megabytes"],
+        avg_disk_available=metrics["disk_available_megabytes"],
+        sum_network_receive_megabytes=metrics["network_receive_megabytes"],
+        sum_network_transmit_megabytes=metrics["network_transmit_megabytes"],
+        dataset_n_samples=n_samples,
+        dataset_n_features=n_features,
+    )
+
+
+def predict_training_time(
+    features: MetaAlgoFeatures, client: AutoMLFlowClient
+) -> MetaAlgoPredictions:
+    return client.meta_algos.predict(features)
@@ -2,6 +2,7 @@ from loguru import logger
 
 from auto_ml_flow.client.v1 import AutoMLFlowClient
 from auto_ml_flow.client.v1.consts import Status
+from auto_ml_flow.client.v1.models.predict import MetaAlgoPredictions
 from auto_ml_flow.client.v1.models.runs import (
     CreateRunPayload,
     PatchRunPayload,
@@ -27,7 +28,7 @@ def run_ended(
     duration: float,
     client: AutoMLFlowClient,
     traceback: str | None = None,
-    predicted_time: float | None = None,
+    predicted_time: MetaAlgoPredictions | None = None,
 ) -> RunModel:
     payload = PatchRunPayload(status=status, duration=duration, traceback=traceback)
 
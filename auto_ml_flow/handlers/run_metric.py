@@ -1,8 +1,12 @@
+from collections.abc import Sequence
+
 from auto_ml_flow.client.v1 import AutoMLFlowClient
 from auto_ml_flow.client.v1.models.run_metrics import (
     CreateRunMetricPayload,
     CreateRunParamPayload,
     CreateRunResultPayload,
+    ParamModel,
+    ResultModel,
     RunMetric,
 )
 from auto_ml_flow.client.v1.models.runs import RunModel
@@ -12,8 +16,10 @@ def get_run_metrics_by(id_: int, client: AutoMLFlowClient) -> RunMetric:
     return client.runs.metrics.retrieve(id_)
 
 
-def add_metric_to(run: RunModel, key: str, value: float, client: AutoMLFlowClient) -> RunMetric:
-    payload = CreateRunMetricPayload(key=key, value=value, run=run.id)
+def add_metric_to(
+    run: RunModel, key: str, value: float, client: AutoMLFlowClient, step: int | None = None
+) -> RunMetric:
+    payload = CreateRunMetricPayload(key=key, value=value, run=run.id, step=step)
 
     return client.runs.metrics.create(payload)
 
@@ -28,3 +34,63 @@ def add_param_to(run: RunModel, key: str, value: str, client: AutoMLFlowClient)
     payload = CreateRunParamPayload(key=key, value=value, run=run.id)
 
     return client.runs.params.create(payload)
+
+
+def add_metrics_to(
+    run: RunModel, metrics: dict[str, float], client: AutoMLFlowClient, step: int | None = None
+) -> list[RunMetric]:
+    payloads = [
+        CreateRunMetricPayload(key=key, value=value, run=run.id, step=step)
+        for key, value in metrics.items()
+    ]
+    if not payloads:
+        return []
+
+    return client.runs.metrics.create_batch(payloads)
+
+
+def add_metric_series_to(
+    run: RunModel,
+    key: str,
+    values: Sequence[float],
+    client: AutoMLFlowClient,
+    steps: Sequence[int] | None = None,
+) -> list[RunMetric]:
+    if steps is None:
+        steps = range(len(values))
+
+    if len(steps) != len(values):
+        raise ValueError(f"Got {len(values)} values but {len(steps)} steps for metric {key!r}")
+
+    payloads = [
+        CreateRunMetricPayload(key=key, value=value, run=run.id, step=step)
+        for value, step in zip(values, steps, strict=True)
+    ]
+    if not payloads:
+        return []
+
+    return client.runs.metrics.create_batch(payloads)
+
+
+def add_results_to(
+    run: RunModel, results: dict[str, float], client: AutoMLFlowClient
+) -> list[ResultModel]:
+    payloads = [
+        CreateRunResultPayload(key=key, value=value, run=run.id) for key, value in results.items()
+    ]
+    if not payloads:
+        return []
+
+    return client.runs.results.create_batch(payloads)
+
+
+def add_params_to(
+    run: RunModel, params: dict[str, str | float], client: AutoMLFlowClient
+) -> list[ParamModel]:
+    payloads = [
+        CreateRunParamPayload(key=key, value=value, run=run.id) for key, value in params.items()
+    ]
+    if not payloads:
+        return []
+
+    return client.runs.params.create_batch(payloads)
@@ -0,0 +1,181 @@
+"""Resource limits and usage of the cgroup v2 the process runs in, e.g. a container."""
+
+import sys
+from functools import cache
+from pathlib import Path
+from typing import NamedTuple
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+PROC_SELF_CGROUP = Path("/proc/self/cgroup")
+
+
+class CPUStat(NamedTuple):
+    usage_usec: int
+    nr_periods: int
+    nr_throttled: int
+    throttled_usec: int
+
+
+class Pressure(NamedTuple):
+    # Share of time (in percents) over the last 10 seconds some or all tasks were stalled
+    some_avg10: float
+    full_avg10: float | None
+
+
+class Cgroup:
+    """cgroup v2 of the current process."""
+
+    def __init__(self, path: Path, root: Path = CGROUP_ROOT) -> None:
+        """
+        Initialize the cgroup.
+
+        Args:
+            path (Path): The directory of the cgroup.
+            root (Path): The mount point of the cgroup v2 hierarchy. Limits of all cgroups
+                between it and `path` apply.
+        """
+        self.path = path
+        self.root = root
+
+    @classmethod
+    def from_proc(
+        cls, root: Path = CGROUP_ROOT, proc_cgroup: Path = PROC_SELF_CGROUP
+    ) -> "Cgroup | None":
+        """The cgroup of the current process, or None if cgroup v2 is not used."""
+        if not (root / "cgroup.controllers").exists():
+            return None
+
+        try:
+            lines = proc_cgroup.read_text().splitlines()
+        except OSError:
+            return None
+
+        for line in lines:
+            # cgroup v2 is the "0::<path>" entry. Inside a cgroup namespace the path is "/".
+            hierarchy, controllers, relative = line.split(":", 2)
+            if hierarchy == "0" and not controllers:
+                path = root / relative.lstrip("/")
+                return cls(path, root) if path.is_dir() else None
+
+        return None
+
+    def _read(self, name: str, path: Path | None = None) -> str | None:
+        try:
+            return ((path or self.path) / name).read_text().strip()
+        except OSError:
+            return None
+
+    def _read_keys(self, name: str) -> dict[str, int]:
+        content = self._read(name) or ""
+
+        return {key: int(value) for key, value in (line.split() for line in content.splitlines())}
+
+    def _ancestors(self) -> list[Path]:
+        paths = [self.path]
+        while paths[-1] != self.root and paths[-1].parent != paths[-1]:
+            paths.append(paths[-1].parent)
+
+        return paths
+
+    def _min_limit(self, name: str) -> int | None:
+        # A parent limit applies to all children, so the tightest one is effective
+        limits = []
+        for path in self._ancestors():
+            value = self._read(name, path)
+            if value is not None and value != "max":
+                limits.append(int(value))
+
+        return min(limits, default=None)
+
+    @property
+    def cpu_limit(self) -> float | None:
+        """The number of CPUs the quota allows, or None without quota."""
+        limits = []
+        for path in self._ancestors():
+            value = self._read("cpu.max", path)
+            if value is None:
+                continue
+
+            quota, _, period = value.partition(" ")
+            if quota != "max":
+                limits.append(int(quota) / int(period or 100_000))
+
+        return min(limits, default=None)
+
+    @property
+    def memory_max(self) -> int | None:
+        """The memory limit (in bytes), or None without limit."""
+        return self._min_limit("memory.max")
+
+    @property
+    def swap_max(self) -> int | None:
+        """The swap limit (in bytes), or None without limit."""
+        return self._min_limit("memory.swap.max")
+
+    @property
+    def limited(self) -> bool:
+        return self.cpu_limit is not None or self.memory_max is not None
+
+    def memory_usage(self) -> int | None:
+        """
+        The memory used (in bytes), without inactive page cache.
+
+        Like `docker stats`, the page cache which the kernel can reclaim at once is left out,
+        so reading large files doesn't look like memory pressure.
+        """
+        current = self._read("memory.current")
+        if current is None:
+            return None
+
+        inactive_file = self._read_keys("memory.stat").get("inactive_file", 0)
+
+        return max(int(current) - inactive_file, 0)
+
+    def swap_usage(self) -> int | None:
+        current = self._read("memory.swap.current")
+
+        return int(current) if current is not None else None
+
+    def cpu_stat(self) -> CPUStat | None:
+        stat = self._read_keys("cpu.stat")
+        if "usage_usec" not in stat:
+            return None
+
+        # Throttling fields exist only when the cpu controller is enabled
+        return CPUStat(
+            usage_usec=stat["usage_usec"],
+            nr_periods=stat.get("nr_periods", 0),
+            nr_throttled=stat.get("nr_throttled", 0),
+            throttled_usec=stat.get("throttled_usec", 0),
+        )
+
+    def memory_pressure(self) -> Pressure | None:
+        content = self._read("memory.pressure")
+        if content is None:
+            return None
+
+        averages = {}
+        for line in content.splitlines():
+            kind, *fields = line.split()
+            values = dict(field.split("=") for field in fields)
+            averages[kind] = float(values["avg10"])
+
+        return Pressure(some_avg10=averages.get("some", 0.0), full_avg10=averages.get("full"))
+
+
+@cache
+def get_cgroup() -> Cgroup | None:
+    """
+    The cgroup v2 of the process, shared by all monitors.
+
+    None if cgroup v2 is not used, or if it doesn't limit CPU or memory, so the host
+    resources are available.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+
+    cgroup = Cgroup.from_proc()
+    if cgroup is None or not cgroup.limited:
+        return None
+
+    return cgroup
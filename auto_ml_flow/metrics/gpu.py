@@ -0,0 +1,71 @@
+from collections.abc import Callable
+from functools import cache
+from types import ModuleType
+from typing import Any
+
+from loguru import logger
+
+
+class NVMLDevices:
+    """NVML library with the handles of all GPUs, initialized once."""
+
+    def __init__(self, nvml: ModuleType | None = None) -> None:
+        """
+        Initialize NVML and look up all devices.
+
+        Without NVML library, driver or GPU the device list is empty.
+
+        Args:
+            nvml (ModuleType | None): The NVML bindings. Defaults to `pynvml`.
+        """
+        self.nvml = nvml
+        self.handles: list[Any] = []
+        self.names: list[str] = []
+
+        try:
+            if self.nvml is None:
+                import pynvml  # noqa: PLC0415
+
+                self.nvml = pynvml
+
+            self.nvml.nvmlInit()
+            count = self.nvml.nvmlDeviceGetCount()
+            self.handles = [self.nvml.nvmlDeviceGetHandleByIndex(i) for i in range(count)]
+            self.names = [_to_str(self.nvml.nvmlDeviceGetName(handle)) for handle in self.handles]
+        except Exception as e:  # noqa: BLE001
+            # NVML raises its own error types for missing driver, library or devices
+            logger.debug(f"GPU monitoring is not available: {e!r}")
+            self.handles, self.names = [], []
+
+    @property
+    def available(self) -> bool:
+        return bool(self.handles)
+
+    def read(self, getter: Callable[..., Any], *args: Any) -> Any:  # noqa: ANN401
+        """Call the NVML getter, returning None if the device doesn't support it."""
+        try:
+            return getter(*args)
+        except Exception:  # noqa: BLE001
+            return None
+
+
+def _to_str(name: str | bytes) -> str:
+    # Older NVML bindings return bytes
+    return name.decode() if isinstance(name, bytes) else name
+
+
+@cache
+def get_nvml_devices() -> NVMLDevices:
+    """NVML devices shared by all monitors of the process."""
+    return NVMLDevices()
+
+
+def get_gpu_name(devices: NVMLDevices | None = None) -> str | None:
+    names = (devices or get_nvml_devices()).names
+    if not names:
+        return None
+
+    if len(set(names)) == 1:
+        return names[0] if len(names) == 1 else f"{names[0]} x {len(names)}"
+
+    return ", ".join(names)
@@ -1,32 +1,225 @@
+import asyncio
+import os
 import threading
-import time
+from collections import deque
+from datetime import UTC, datetime
 
 from loguru import logger
+from pydantic import BaseModel
 
 from auto_ml_flow.client.v1 import AutoMLFlowClient
+from auto_ml_flow.client.v1.aio import AsyncAutoMLFlowClient
+from auto_ml_flow.client.v1.models.metrics import SystemMetricsBatchPayload
+from auto_ml_flow.metrics.cgroup import get_cgroup
+from auto_ml_flow.metrics.monitor.aggregate import WindowAggregator
+from auto_ml_flow.metrics.monitor.base import BaseMetricsMonitor
+from auto_ml_flow.metrics.monitor.cgroup import CgroupMonitor
 from auto_ml_flow.metrics.monitor.cpu import CPUMonitor
 from auto_ml_flow.metrics.monitor.disk import DiskMonitor
+from auto_ml_flow.metrics.monitor.disk_io import DiskIOMonitor
+from auto_ml_flow.metrics.monitor.gpu import GPUMonitor
 from auto_ml_flow.metrics.monitor.memory import MemoryMonitor
 from auto_ml_flow.metrics.monitor.network import NetworkMonitor
+from auto_ml_flow.metrics.monitor.network_io import NetworkIOMonitor
+from auto_ml_flow.metrics.monitor.process import ProcessMonitor
+from auto_ml_flow.metrics.monitor.scheduler import FixedRateScheduler
+from auto_ml_flow.metrics.procfs import get_proc_reader
 
 
-class SystemMetricsMonitor:
-    def __init__(self, system: int, client: AutoMLFlowClient, interval: int = 10) -> None:
+def default_monitors(use_procfs: bool = True) -> list[BaseMetricsMonitor]:
+    """
+    Monitors of the host CPU, memory, disk and network usage and I/O throughput.
+
+    Inside a cgroup v2 with CPU or memory limits, e.g. a container, CPU and memory usage are
+    reported against the limits, and the cgroup monitor is added.
+
+    Args:
+        use_procfs (bool): Read the metrics of all monitors from `/proc` at once on every tick
+            instead of calling psutil for each of them. Ignored where `/proc` is not available.
+    """
+    proc = get_proc_reader() if use_procfs else None
+    cgroup = get_cgroup()
+
+    monitors: list[BaseMetricsMonitor] = [
+        CPUMonitor(proc=proc, cgroup=cgroup),
+        DiskMonitor(),
+        DiskIOMonitor(proc=proc),
+        NetworkMonitor(proc=proc),
+        NetworkIOMonitor(proc=proc),
+        MemoryMonitor(proc=proc, cgroup=cgroup),
+    ]
+    if cgroup is not None:
+        monitors.append(CgroupMonitor(cgroup))
+
+    return monitors
+
+
+def run_monitors(process_pid: int | None = None) -> list[BaseMetricsMonitor]:
+    """
+    Monitors of a training run: the default ones, and the GPU monitor if there are GPUs.
+
+    Args:
+        process_pid (int | None): If set, also monitor the process tree of this process. The
+            process calling this function is left out of the tree, so a sampling process
+            doesn't count itself.
+    """
+    monitors = default_monitors()
+    if process_pid is not None:
+        exclude = () if process_pid == os.getpid() else (os.getpid(),)
+        monitors.append(ProcessMonitor(pid=process_pid, exclude=exclude))
+
+    gpu_monitor = GPUMonitor()
+    if gpu_monitor.available:
+        monitors.append(gpu_monitor)
+
+    return monitors
+
+
+class SystemMetricsSampler:
+    """
+    Sampling of system metrics at a fixed rate in a background thread.
+
+    Samples are buffered, or aggregated per window, until monitors take them to upload.
+    """
+
+    def __init__(
+        self,
+        system: int,
+        *,
+        interval: float = 10,
+        flush_interval: float | None = None,
+        buffer_size: int = 10_000,
+        max_interval: float | None = None,
+        aggregate: bool = False,
+        monitors: list[BaseMetricsMonitor] | None = None,
+    ) -> None:
         """
-        Initialize the system metrics monitor.
+        Initialize the sampler.
 
         Args:
-            interval (int): The interval (in seconds) at which to collect metrics.
+            interval (float): The interval (in seconds) at which to collect metrics.
+            flush_interval (float | None): The interval (in seconds) at which buffered samples
+                are uploaded in one batch. If None, samples are sent one by one every `interval`.
+            buffer_size (int): The maximum number of samples kept in the buffer. When the
+                buffer is full, the oldest samples are dropped.
+            max_interval (float | None): If set, sampling backs off up to this interval (in
+                seconds) while readings are stable, and returns to `interval` when they change.
+            aggregate (bool): Upload min/max/mean/p50/p95/last of every metric per
+                `flush_interval` window instead of raw samples, and a summary of the whole run
+                when monitoring finishes.
+            monitors (list[BaseMetricsMonitor] | None): The monitors to sample. Defaults to
+                `default_monitors()`.
         """
+        if aggregate and flush_interval is None:
+            raise ValueError("Aggregation needs 'flush_interval' as the window size.")
+
         self.system = system
-        self.client = client
-        self.monitors = [CPUMonitor(), DiskMonitor(), NetworkMonitor(), MemoryMonitor()]
+        self.monitors = default_monitors() if monitors is None else monitors
         self.interval = interval
+        self.flush_interval = flush_interval
+        self.scheduler = FixedRateScheduler(interval, max_interval=max_interval)
+        self._buffer: deque[tuple[str, BaseModel]] = deque(maxlen=buffer_size)
+        self.aggregator = WindowAggregator() if aggregate else None
         self._shutdown_event = threading.Event()
         self._process: threading.Thread | None = None
 
+    def _run(self) -> None:
+        """Background thread function to collect metrics periodically."""
+        while not self.scheduler.wait(self._shutdown_event):
+            self.collect_metrics()
+
+    def collect_metrics(self) -> None:
+        """Collect system metrics into the buffer."""
+        timestamp = datetime.now(UTC)
+        readings: dict[str, float] = {}
+        for monitor in self.monitors:
+            monitor.collect_metrics()
+            readings.update(monitor.metrics)
+
+            if self.aggregator is None:
+                model = monitor.to_model(self.system).model_copy(update={"created_at": timestamp})
+                self._buffer.append((monitor.stats_name, model))
+
+        if self.aggregator is not None:
+            self.aggregator.add(readings, timestamp)
+
+        self.scheduler.observe(list(readings.values()))
+
+    def take_samples(
+        self, summary: bool = False
+    ) -> tuple[list[tuple[str, BaseModel]], SystemMetricsBatchPayload]:
+        """
+        Take the buffered samples and the aggregates of the window which ends.
+
+        Args:
+            summary (bool): Also take the aggregates of the whole run.
+
+        Returns:
+            tuple[list[tuple[str, BaseModel]], SystemMetricsBatchPayload]: The samples by
+                stats name, and the batch holding the aggregates, and the samples too if
+                they are uploaded in batches.
+        """
+        batch = SystemMetricsBatchPayload()
+        if self.aggregator is not None:
+            timestamp = datetime.now(UTC)
+            batch.aggregates = self.aggregator.rotate(self.system, timestamp)
+            if summary:
+                batch.aggregates.extend(self.aggregator.summary(self.system, timestamp))
+
+        samples = []
+        while self._buffer:
+            samples.append(self._buffer.popleft())
+
+        if self.flush_interval is not None:
+            for stats_name, model in samples:
+                getattr(batch, stats_name).append(model)
+
+        return samples, batch
+
+    def _log_jitter(self) -> None:
+        jitter = self.scheduler.jitter_stats
+        logger.debug(
+            f"System metrics sampling jitter: mean {jitter['mean'] * 1000:.2f} ms, "
+            f"max {jitter['max'] * 1000:.2f} ms, missed ticks {jitter['missed_ticks']:.0f}"
+        )
+
+
+class SystemMetricsMonitor(SystemMetricsSampler):
+    def __init__(
+        self,
+        system: int,
+        client: AutoMLFlowClient,
+        interval: float = 10,
+        flush_interval: float | None = None,
+        buffer_size: int = 10_000,
+        max_interval: float | None = None,
+        aggregate: bool = False,
+        monitors: list[BaseMetricsMonitor] | None = None,
+    ) -> None:
+        """
+        Initialize the system metrics monitor.
+
+        Metrics are sampled at a fixed rate in one thread and uploaded from another one, so slow
+        uploads don't shift the sampling schedule. See `SystemMetricsSampler` for the other
+        arguments.
+
+        Args:
+            client (AutoMLFlowClient): The client uploading the samples.
+        """
+        super().__init__(
+            system,
+            interval=interval,
+            flush_interval=flush_interval,
+            buffer_size=buffer_size,
+            max_interval=max_interval,
+            aggregate=aggregate,
+            monitors=monitors,
+        )
+        self.client = client
+        self._uploader: threading.Thread | None = None
+
     def start(self) -> None:
-        """Start the system metrics monitoring in a background thread."""
+        """Start the system metrics monitoring in background threads."""
         if self._process is not None:
             logger.warning("System metrics monitoring is already running.")
             return
@@ -35,32 +228,155 @@ class SystemMetricsMonitor:
 
         self._shutdown_event.clear()
         self._process = threading.Thread(target=self._run)
+        self._uploader = threading.Thread(target=self._upload)
         self._process.start()
+        self._uploader.start()
 
-    def _run(self) -> None:
-        """Background thread function to collect metrics periodically."""
-        while not self._shutdown_event.is_set():
-            self.collect_metrics()
-            time.sleep(self.interval)
+    def _upload(self) -> None:
+        """Background thread function to upload collected metrics periodically."""
+        while not self._shutdown_event.wait(self.flush_interval or self.interval):
+            self.flush()
 
-    def collect_metrics(self) -> None:
-        """Collect system metrics."""
+    def flush(self, summary: bool = False) -> None:
+        """
+        Upload all buffered samples.
 
-        for monitor in self.monitors:
-            monitor.collect_metrics()
-            monitor.log_metrics(system=self.system, client=self.client)
+        Args:
+            summary (bool): Also upload the aggregates of the whole run.
+        """
+        samples, batch = self.take_samples(summary)
+        if not samples and not batch.aggregates:
+            return
+
+        try:
+            if self.flush_interval is None:
+                for stats_name, model in samples:
+                    getattr(self.client.systems.metrics, stats_name).create(model)
+                return
+
+            self.client.systems.metrics.create_batch(batch)
+        except Exception as e:  # noqa: BLE001
+            # Any error, e.g. a timeout or a rejected sample, must not stop the uploader
+            logger.error(f"Failed to upload system metrics: {e!r}")
 
     def finish(self) -> None:
         """Stop monitoring system metrics."""
-        if self._process is None:
+        if self._process is None or self._uploader is None:
             logger.warning("System metrics monitoring is not running.")
             return
 
+        # Both threads wait on the event, so they wake up at once instead of after an interval
         self._shutdown_event.set()
 
         try:
             self._process.join()
+            self._uploader.join()
         except Exception as e:  # noqa: BLE001
             logger.error(f"Error terminating system metrics monitoring process: {e}.")
 
         self._process = None
+        self._uploader = None
+        self.flush(summary=True)
+        self._log_jitter()
+
+
+class AsyncSystemMetricsMonitor(SystemMetricsSampler):
+    def __init__(
+        self,
+        system: int,
+        client: AsyncAutoMLFlowClient,
+        interval: float = 10,
+        *,
+        flush_interval: float | None = None,
+        buffer_size: int = 10_000,
+        max_interval: float | None = None,
+        aggregate: bool = False,
+        monitors: list[BaseMetricsMonitor] | None = None,
+    ) -> None:
+        """
+        Initialize the system metrics monitor uploading from a task of the event loop.
+
+        Metrics are sampled in a background thread like in `SystemMetricsMonitor`, so psutil
+        calls don't block the event loop, and uploaded by a task. See `SystemMetricsSampler`
+        for the other arguments.
+
+        Args:
+            client (AsyncAutoMLFlowClient): The client uploading the samples.
+        """
+        super().__init__(
+            system,
+            interval=interval,
+            flush_interval=flush_interval,
+            buffer_size=buffer_size,
+            max_interval=max_interval,
+            aggregate=aggregate,
+            monitors=monitors,
+        )
+        self.client = client
+        self._task: asyncio.Task | None = None
+        self._stop = asyncio.Event()
+
+    def start(self) -> None:
+        """Start the sampling thread and the upload task."""
+        if self._task is not None:
+            logger.warning("System metrics monitoring is already running.")
+            return
+
+        logger.info("Starting system metrics monitoring...")
+
+        self._shutdown_event.clear()
+        self._stop = asyncio.Event()
+        self._process = threading.Thread(target=self._run)
+        self._process.start()
+        self._task = asyncio.create_task(self._upload())
+
+    async def _upload(self) -> None:
+        """Background task function to upload collected metrics periodically."""
+        while not self._stop.is_set():
+            try:
+                await asyncio.wait_for(self._stop.wait(), self.flush_interval or self.interval)
+            except TimeoutError:
+                await self.flush()
+
+    async def flush(self, summary: bool = False) -> None:
+        """
+        Upload all buffered samples.
+
+        Args:
+            summary (bool): Also upload the aggregates of the whole run.
+        """
+        samples, batch = self.take_samples(summary)
+        if not samples and not batch.aggregates:
+            return
+
+        try:
+            if self.flush_interval is None:
+                await asyncio.gather(
+                    *(
+                        getattr(self.client.systems.metrics, stats_name).create(model)
+                        for stats_name, model in samples
+                    )
+                )
+                return
+
+            await self.client.systems.metrics.create_batch(batch)
+        except Exception as e:  # noqa: BLE001
+            # Any error, e.g. a timeout or a rejected sample, must not stop the uploader
+            logger.error(f"Failed to upload system metrics: {e!r}")
+
+    async def finish(self) -> None:
+        """Stop monitoring system metrics and upload the remaining samples."""
+        if self._task is None or self._process is None:
+            logger.warning("System metrics monitoring is not running.")
+            return
+
+        self._shutdown_event.set()
+        # Not cancelled, since samples taken by a flush in progress would be lost
+        self._stop.set()
+        await self._task
+
+        await asyncio.to_thread(self._process.join)
+        self._task = None
+        self._process = None
+        await self.flush(summary=True)
+        self._log_jitter()
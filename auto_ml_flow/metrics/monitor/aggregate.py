@@ -0,0 +1,292 @@
+"""Client-side windowed aggregation of system metrics samples."""
+
+import copy
+import threading
+import warnings
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+
+import numpy as np
+
+from auto_ml_flow.client.v1.models.metrics import MetricAggregateModel
+
+STATS = ("count", "min", "max", "mean", "p50", "p95", "last")
+
+
+def aggregate(samples: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Compute the statistics of every column of the samples at once.
+
+    Args:
+        samples (np.ndarray): The 2D array of samples, one row per sample and one column per
+            metric. Missing readings are NaN.
+    """
+    with warnings.catch_warnings():
+        # Columns which have no readings in the window give NaN without warnings
+        warnings.simplefilter("ignore", RuntimeWarning)
+        p50, p95 = np.nanpercentile(samples, [50, 95], axis=0)
+
+        return {
+            "count": np.count_nonzero(~np.isnan(samples), axis=0),
+            "min": np.nanmin(samples, axis=0),
+            "max": np.nanmax(samples, axis=0),
+            "mean": np.nanmean(samples, axis=0),
+            "p50": p50,
+            "p95": p95,
+            "last": samples[-1],
+        }
+
+
+class _SampleBuffer:
+    """Growable 2D array of samples."""
+
+    def __init__(self, capacity: int) -> None:
+        self._data = np.full((capacity, 0), np.nan)
+        self.size = 0
+        self.start: datetime | None = None
+
+    @property
+    def samples(self) -> np.ndarray:
+        return self._data[: self.size]
+
+    def add_column(self) -> None:
+        self._data = np.hstack((self._data, np.full((len(self._data), 1), np.nan)))
+
+    def append(self, row: np.ndarray, timestamp: datetime) -> None:
+        if self.size == len(self._data):
+            grown = np.full((max(len(self._data) * 2, 1), self._data.shape[1]), np.nan)
+            grown[: self.size] = self._data
+            self._data = grown
+
+        self._data[self.size] = row
+        self.size += 1
+        if self.start is None:
+            self.start = timestamp
+
+    def extend(self, rows: np.ndarray, start: datetime) -> None:
+        if self.size + len(rows) > len(self._data):
+            capacity = max(len(self._data) * 2, self.size + len(rows))
+            grown = np.full((capacity, self._data.shape[1]), np.nan)
+            grown[: self.size] = self._data[: self.size]
+            self._data = grown
+
+        self._data[self.size : self.size + len(rows)] = rows
+        self.size += len(rows)
+        if self.start is None:
+            self.start = start
+
+    def clear(self) -> None:
+        self._data[: self.size] = np.nan
+        self.size = 0
+        self.start = None
+
+
+class _RunStats:
+    """
+    Statistics of all samples of a run, updated window by window.
+
+    Count, min, max, sum and last are exact. Percentiles are estimated from a reservoir,
+    a uniform random sample of the rows, so memory doesn't grow with the length of the run.
+    """
+
+    def __init__(self, reservoir_size: int, seed: int | None = None) -> None:
+        self.count = np.zeros(0, dtype=int)
+        self.min = np.full(0, np.nan)
+        self.max = np.full(0, np.nan)
+        self.sum = np.zeros(0)
+        self.last = np.full(0, np.nan)
+        self.reservoir = np.full((reservoir_size, 0), np.nan)
+        # Rows seen so far
+        self.size = 0
+        self.start: datetime | None = None
+        self._rng = np.random.default_rng(seed)
+
+    def add_column(self) -> None:
+        self.count = np.append(self.count, 0)
+        self.min = np.append(self.min, np.nan)
+        self.max = np.append(self.max, np.nan)
+        self.sum = np.append(self.sum, 0.0)
+        self.last = np.append(self.last, np.nan)
+        self.reservoir = np.hstack((self.reservoir, np.full((len(self.reservoir), 1), np.nan)))
+
+    def fold(self, samples: np.ndarray, start: datetime | None) -> None:
+        """Add the samples of a window."""
+        if not len(samples):
+            return
+
+        readings = ~np.isnan(samples)
+        with warnings.catch_warnings():
+            # Columns which have no readings in the window give NaN without warnings
+            warnings.simplefilter("ignore", RuntimeWarning)
+            self.min = np.fmin(self.min, np.nanmin(samples, axis=0))
+            self.max = np.fmax(self.max, np.nanmax(samples, axis=0))
+
+        self.count += readings.sum(axis=0)
+        self.sum += np.nansum(samples, axis=0)
+        # The last reading of every column, which may be in an earlier row than the last
+        read = readings.any(axis=0)
+        last_rows = len(samples) - 1 - np.argmax(readings[::-1], axis=0)
+        self.last[read] = samples[last_rows, np.arange(samples.shape[1])][read]
+
+        # Algorithm R: the row seen as the i-th replaces a random slot with probability k / i
+        seen = self.size + np.arange(len(samples))
+        slots = np.where(
+            seen < len(self.reservoir), seen, self._rng.integers(0, seen + 1, len(samples))
+        )
+        kept = slots < len(self.reservoir)
+        self.reservoir[slots[kept]] = samples[kept]
+        self.size += len(samples)
+        if self.start is None:
+            self.start = start
+
+    def copy(self) -> "_RunStats":
+        return copy.deepcopy(self)
+
+    def stats(self) -> dict[str, np.ndarray]:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            p50, p95 = np.nanpercentile(
+                self.reservoir[: min(self.size, len(self.reservoir))], [50, 95], axis=0
+            )
+            mean = self.sum / self.count
+
+        return {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "mean": mean,
+            "p50": p50,
+            "p95": p95,
+            "last": self.last,
+        }
+
+
+class WindowAggregator:
+    def __init__(
+        self, capacity: int = 1024, reservoir_size: int = 4096, seed: int | None = None
+    ) -> None:
+        """
+        Initialize the aggregator.
+
+        Args:
+            capacity (int): The number of samples preallocated for a window. The buffer grows
+                when a window holds more samples.
+            reservoir_size (int): The number of samples the percentiles of the whole run are
+                estimated from. Only windows keep all their samples.
+            seed (int | None): The seed of the sampling of the reservoir.
+        """
+        self.names: list[str] = []
+        self._columns: dict[str, int] = {}
+        self._window = _SampleBuffer(capacity)
+        self._run = _RunStats(reservoir_size, seed)
+        self._lock = threading.Lock()
+
+    def _add_columns(self, names: Iterable[str]) -> None:
+        for name in names:
+            if name not in self._columns:
+                self._columns[name] = len(self.names)
+                self.names.append(name)
+                self._window.add_column()
+                self._run.add_column()
+
+    def add(self, readings: dict[str, float], timestamp: datetime) -> None:
+        """Add one sample of readings to the current window."""
+        with self._lock:
+            self._add_columns(readings)
+
+            row = np.fromiter(
+                (readings.get(name, np.nan) for name in self.names),
+                dtype=float,
+                count=len(self.names),
+            )
+            self._window.append(row, timestamp)
+
+    def extend(self, names: Sequence[str], rows: np.ndarray, start: datetime) -> None:
+        """
+        Add many samples at once.
+
+        Args:
+            names (Sequence[str]): The metric of every column of the rows.
+            rows (np.ndarray): The 2D array of samples, one row per sample. Missing readings
+                are NaN.
+            start (datetime): The time of the first sample.
+        """
+        if not len(rows):
+            return
+
+        with self._lock:
+            self._add_columns(names)
+
+            samples = np.full((len(rows), len(self.names)), np.nan)
+            samples[:, [self._columns[name] for name in names]] = rows[:, : len(names)]
+            self._window.extend(samples, start)
+
+    def rotate(self, system: int, timestamp: datetime) -> list[MetricAggregateModel]:
+        """Aggregate the current window, add it to the run, and start a new one."""
+        with self._lock:
+            models = self._to_models(
+                aggregate(self._window.samples) if self._window.size else None,
+                self._window.start,
+                system,
+                timestamp,
+            )
+            self._run.fold(self._window.samples, self._window.start)
+            self._window.clear()
+
+        return models
+
+    def _run_with_window(self) -> _RunStats:
+        """The statistics of the run, including the current window."""
+        if not self._window.size:
+            return self._run
+
+        run = self._run.copy()
+        run.fold(self._window.samples, self._window.start)
+
+        return run
+
+    def summary(self, system: int, timestamp: datetime) -> list[MetricAggregateModel]:
+        """Aggregate all samples of the run."""
+        with self._lock:
+            run = self._run_with_window()
+            return self._to_models(
+                run.stats() if run.size else None, run.start, system, timestamp, is_summary=True
+            )
+
+    def run_stats(self) -> dict[str, dict[str, float]]:
+        """Statistics of every metric over the run so far."""
+        with self._lock:
+            run = self._run_with_window()
+            if not run.size:
+                return {}
+
+            stats = run.stats()
+
+        return {
+            name: {stat: float(stats[stat][column]) for stat in STATS}
+            for name, column in self._columns.items()
+        }
+
+    def _to_models(
+        self,
+        stats: dict[str, np.ndarray] | None,
+        start: datetime | None,
+        system: int,
+        timestamp: datetime,
+        is_summary: bool = False,
+    ) -> list[MetricAggregateModel]:
+        if stats is None or start is None:
+            return []
+
+        return [
+            MetricAggregateModel(
+                name=name,
+                system=system,
+                window_start=start,
+                window_end=timestamp,
+                is_summary=is_summary,
+                **{stat: stats[stat][column].item() for stat in STATS},
+            )
+            for name, column in self._columns.items()
+            if stats["count"][column]
+        ]
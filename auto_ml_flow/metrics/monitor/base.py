@@ -2,7 +2,7 @@
 
 import abc
 
-from auto_ml_flow.client.v1 import AutoMLFlowClient
+from pydantic import BaseModel
 
 
 def bytes_to_megabytes(bytes_value: float, to_int=False):
@@ -13,9 +13,21 @@ def bytes_to_megabytes(bytes_value: float, to_int=False):
     return result
 
 
+def counter_rate(current: float, previous: float, elapsed: float) -> float:
+    """Per second rate of a cumulative counter between two samples."""
+    if elapsed <= 0:
+        return 0.0
+
+    # Counters are reset when a device is re-attached, so the delta is clamped at zero
+    return max(current - previous, 0) / elapsed
+
+
 class BaseMetricsMonitor(abc.ABC):
     """Base class of system metrics monitor."""
 
+    # Field of `SystemMetricsBatchPayload` which the metrics are uploaded to
+    stats_name: str
+
     def __init__(self) -> None:
         self._metrics: dict[str, float] = {}
 
@@ -28,10 +40,10 @@ class BaseMetricsMonitor(abc.ABC):
         ...
 
     @abc.abstractmethod
-    def log_metrics(self, system: int, client: AutoMLFlowClient) -> None:
-        """Method to send metrics to server
+    def to_model(self, system: int) -> BaseModel:
+        """Method to build the payload of collected metrics.
 
-        Subclass should implement this method to collect metrics, and call client method
+        Subclass should implement this method to convert `self._metrics` to the model
         """
         ...
 
@@ -0,0 +1,71 @@
+import time
+
+from auto_ml_flow.client.v1.models.metrics import CgroupMetricModel
+from auto_ml_flow.metrics.cgroup import Cgroup
+from auto_ml_flow.metrics.monitor.base import BaseMetricsMonitor, bytes_to_megabytes, counter_rate
+
+
+class CgroupMonitor(BaseMetricsMonitor):
+    """CPU quota, throttling, memory limit and memory pressure of the container."""
+
+    stats_name = "cgroup_stats"
+
+    def __init__(self, cgroup: Cgroup) -> None:
+        """
+        Initialize the cgroup monitor.
+
+        Args:
+            cgroup (Cgroup): The cgroup to monitor.
+        """
+        super().__init__()
+        self.cgroup = cgroup
+        # Throttled time is counted from the start of monitoring
+        self._initial = self._previous = cgroup.cpu_stat()
+        self._previous_time = time.monotonic()
+
+    def collect_metrics(self) -> None:
+        cpu_limit = self.cgroup.cpu_limit
+        if cpu_limit is not None:
+            self._metrics["cgroup_cpu_limit_cores"] = cpu_limit
+
+        cpu_stat, now = self.cgroup.cpu_stat(), time.monotonic()
+        previous, initial = self._previous, self._initial
+        if cpu_stat is not None and previous is not None and initial is not None:
+            elapsed = now - self._previous_time
+            usage = counter_rate(cpu_stat.usage_usec, previous.usage_usec, elapsed)
+            self._metrics["cgroup_cpu_usage_cores"] = usage / 1e6
+
+            periods = cpu_stat.nr_periods - previous.nr_periods
+            throttled = cpu_stat.nr_throttled - previous.nr_throttled
+            if cpu_limit is not None:
+                self._metrics["cgroup_cpu_throttled_percentage"] = (
+                    throttled / periods * 100 if periods > 0 else 0.0
+                )
+                self._metrics["cgroup_cpu_throttled_seconds"] = (
+                    cpu_stat.throttled_usec - initial.throttled_usec
+                ) / 1e6
+
+        self._previous, self._previous_time = cpu_stat, now
+
+        memory_max = self.cgroup.memory_max
+        if memory_max is not None:
+            self._metrics["cgroup_memory_max_megabytes"] = bytes_to_megabytes(memory_max)
+
+        memory_usage = self.cgroup.memory_usage()
+        if memory_usage is not None:
+            self._metrics["cgroup_memory_usage_megabytes"] = bytes_to_megabytes(memory_usage)
+
+        # Pressure stall information needs a kernel with PSI enabled
+        pressure = self.cgroup.memory_pressure()
+        if pressure is not None:
+            self._metrics["cgroup_memory_pressure_some_percentage"] = pressure.some_avg10
+            if pressure.full_avg10 is not None:
+                self._metrics["cgroup_memory_pressure_full_percentage"] = pressure.full_avg10
+
+    def to_model(self, system: int) -> CgroupMetricModel:
+        prefix = "cgroup_"
+
+        return CgroupMetricModel(
+            system=system,
+            **{name.removeprefix(prefix): value for name, value in self.metrics.items()},
+        )
@@ -1,17 +1,59 @@
+import time
+
 import psutil
 
-from auto_ml_flow.client.v1 import AutoMLFlowClient
 from auto_ml_flow.client.v1.models.metrics import CPUMetricModel
-from auto_ml_flow.metrics.monitor.base import BaseMetricsMonitor
+from auto_ml_flow.metrics.cgroup import Cgroup
+from auto_ml_flow.metrics.monitor.base import BaseMetricsMonitor, counter_rate
+from auto_ml_flow.metrics.procfs import ProcReader
 
 
 class CPUMonitor(BaseMetricsMonitor):
+    stats_name = "cpu_stats"
+
+    def __init__(self, proc: ProcReader | None = None, cgroup: Cgroup | None = None) -> None:
+        """
+        Initialize the CPU monitor.
+
+        Args:
+            proc (ProcReader | None): The `/proc` reader to take CPU times from. If None,
+                psutil is used.
+            cgroup (Cgroup | None): The cgroup to take CPU usage from, if it has a CPU quota.
+                Utilization is then the share of the quota used, not of all host CPUs.
+        """
+        super().__init__()
+        self.proc = proc
+        self.cgroup = cgroup if cgroup is not None and cgroup.cpu_limit is not None else None
+        self._previous = proc.read().cpu if proc is not None else None
+        self._previous_usage = self.cgroup.cpu_stat() if self.cgroup is not None else None
+        self._previous_time = time.monotonic()
+
+    def _collect_cgroup_metrics(self, cgroup: Cgroup) -> bool:
+        cpu_stat, cpu_limit, now = cgroup.cpu_stat(), cgroup.cpu_limit, time.monotonic()
+        if cpu_stat is None or cpu_limit is None or self._previous_usage is None:
+            return False
+
+        elapsed = now - self._previous_time
+        cores_used = counter_rate(cpu_stat.usage_usec, self._previous_usage.usage_usec, elapsed)
+        utilization = cores_used / 1e6 / cpu_limit * 100
+        self._metrics["cpu_utilization_percentage"] = min(utilization, 100.0)
+        self._previous_usage, self._previous_time = cpu_stat, now
+
+        return True
+
     def collect_metrics(self) -> None:
-        self._metrics["cpu_utilization_percentage"] = psutil.cpu_percent()
+        if self.cgroup is not None and self._collect_cgroup_metrics(self.cgroup):
+            return
+
+        if self.proc is None or self._previous is None:
+            self._metrics["cpu_utilization_percentage"] = psutil.cpu_percent()
+            return
 
-    def log_metrics(self, system: int, client: AutoMLFlowClient) -> None:
-        cpu_stats = CPUMetricModel(
-            utilization=self.metrics["cpu_utilization_percentage"], system=system
-        )
+        cpu, previous = self.proc.read().cpu, self._previous
+        total = cpu.total - previous.total
+        utilization = (cpu.busy - previous.busy) / total * 100 if total > 0 else 0.0
+        self._metrics["cpu_utilization_percentage"] = min(max(utilization, 0.0), 100.0)
+        self._previous = cpu
 
-        client.systems.metrics.cpu_stats.create(cpu_stats)
+    def to_model(self, system: int) -> CPUMetricModel:
+        return CPUMetricModel(utilization=self.metrics["cpu_utilization_percentage"], system=system)
@@ -0,0 +1,105 @@
+import time
+from collections.abc import Collection
+from pathlib import Path
+from typing import Any
+
+import psutil
+
+from auto_ml_flow.client.v1.models.metrics import DiskIODeviceMetricModel, DiskIOMetricModel
+from auto_ml_flow.metrics.monitor.base import BaseMetricsMonitor, counter_rate
+from auto_ml_flow.metrics.procfs import ProcReader
+
+SYS_BLOCK = Path("/sys/block")
+
+
+class DiskIOMonitor(BaseMetricsMonitor):
+    """Throughput and IOPS of every block device, as rates between two samples."""
+
+    stats_name = "disk_io_stats"
+
+    def __init__(
+        self,
+        devices: Collection[str] | None = None,
+        exclude_prefixes: tuple[str, ...] = ("loop", "ram", "zram"),
+        proc: ProcReader | None = None,
+    ) -> None:
+        """
+        Initialize the disk I/O monitor.
+
+        Args:
+            devices (Collection[str] | None): The names of the devices to monitor. Defaults to
+                all whole disks, partitions are skipped so that I/O is not counted twice.
+            exclude_prefixes (tuple[str, ...]): The prefixes of device names which are not
+                monitored by default.
+            proc (ProcReader | None): The `/proc` reader to take disk counters from. If None,
+                psutil is used.
+        """
+        super().__init__()
+        if devices is None and SYS_BLOCK.is_dir():
+            devices = [
+                path.name
+                for path in SYS_BLOCK.iterdir()
+                if not path.name.startswith(exclude_prefixes)
+            ]
+
+        self.devices = devices
+        self.exclude_prefixes = exclude_prefixes
+        self.proc = proc
+        self._device_metrics: list[DiskIODeviceMetricModel] = []
+        # Rates of the first sample are computed against the counters at start
+        self._previous, self._previous_time = self._read_counters()
+
+    def _read_counters(self) -> tuple[dict[str, Any], float]:
+        if self.proc is not None:
+            snapshot = self.proc.read()
+            counters, now = snapshot.disks, snapshot.time
+        else:
+            # None when the kernel doesn't expose disk statistics, e.g. in some containers
+            counters, now = psutil.disk_io_counters(perdisk=True) or {}, time.monotonic()
+
+        if self.devices is not None:
+            return {name: counters[name] for name in self.devices if name in counters}, now
+
+        return {
+            name: value
+            for name, value in counters.items()
+            if not name.startswith(self.exclude_prefixes)
+        }, now
+
+    def collect_metrics(self) -> None:
+        counters, now = self._read_counters()
+        elapsed = now - self._previous_time
+
+        self._device_metrics = []
+        for name, current in counters.items():
+            previous = self._previous.get(name)
+            if previous is None:
+                # The device appeared after the previous sample
+                continue
+
+            device = DiskIODeviceMetricModel(
+                device=name,
+                read_bytes_per_second=counter_rate(
+                    current.read_bytes, previous.read_bytes, elapsed
+                ),
+                write_bytes_per_second=counter_rate(
+                    current.write_bytes, previous.write_bytes, elapsed
+                ),
+                read_iops=counter_rate(current.read_count, previous.read_count, elapsed),
+                write_iops=counter_rate(current.write_count, previous.write_count, elapsed),
+            )
+            # Only available on Linux and FreeBSD, in milliseconds
+            if hasattr(current, "busy_time"):
+                device.busy_percentage = min(
+                    counter_rate(current.busy_time, previous.busy_time, elapsed) / 10, 100.0
+                )
+
+            self._device_metrics.append(device)
+            for key, value in device.model_dump(exclude={"device"}).items():
+                if value is not None:
+                    self._metrics[f"disk_io_{name}_{key}"] = value
+
+        self._previous, self._previous_time = counters, now
+
+    def to_model(self, system: int) -> DiskIOMetricModel:
+        return DiskIOMetricModel(devices=self._device_metrics, system=system)
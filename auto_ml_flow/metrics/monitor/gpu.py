@@ -0,0 +1,59 @@
+from auto_ml_flow.client.v1.models.metrics import GPUDeviceMetricModel, GPUMetricModel
+from auto_ml_flow.metrics.gpu import NVMLDevices, get_nvml_devices
+from auto_ml_flow.metrics.monitor.base import BaseMetricsMonitor, bytes_to_megabytes
+
+
+class GPUMonitor(BaseMetricsMonitor):
+    """Per-device GPU metrics from NVML. Does nothing on hosts without GPU."""
+
+    stats_name = "gpu_stats"
+
+    def __init__(self, devices: NVMLDevices | None = None) -> None:
+        """
+        Initialize the GPU monitor.
+
+        Args:
+            devices (NVMLDevices | None): The NVML devices to sample. Defaults to the devices
+                shared by the whole process.
+        """
+        super().__init__()
+        self.devices = devices or get_nvml_devices()
+        self._device_metrics: list[GPUDeviceMetricModel] = []
+
+    @property
+    def available(self) -> bool:
+        return self.devices.available
+
+    def collect_metrics(self) -> None:
+        nvml, read = self.devices.nvml, self.devices.read
+        self._device_metrics = []
+        if nvml is None:
+            return
+
+        for index, (handle, name) in enumerate(
+            zip(self.devices.handles, self.devices.names, strict=True)
+        ):
+            utilization = read(nvml.nvmlDeviceGetUtilizationRates, handle)
+            memory = read(nvml.nvmlDeviceGetMemoryInfo, handle)
+            power = read(nvml.nvmlDeviceGetPowerUsage, handle)
+            device = GPUDeviceMetricModel(
+                index=index,
+                name=name,
+                utilization_percentage=utilization.gpu if utilization is not None else None,
+                memory_used_megabytes=bytes_to_megabytes(memory.used) if memory else None,
+                memory_total_megabytes=bytes_to_megabytes(memory.total) if memory else None,
+                # NVML reports power in milliwatts
+                power_watts=power / 1000 if power is not None else None,
+                temperature_celsius=read(
+                    nvml.nvmlDeviceGetTemperature, handle, nvml.NVML_TEMPERATURE_GPU
+                ),
+                sm_clock_mhz=read(nvml.nvmlDeviceGetClockInfo, handle, nvml.NVML_CLOCK_SM),
+            )
+            self._device_metrics.append(device)
+
+            for key, value in device.model_dump(exclude={"index", "name"}).items():
+                if value is not None:
+                    self._metrics[f"gpu{index}_{key}"] = value
+
+    def to_model(self, system: int) -> GPUMetricModel:
+        return GPUMetricModel(devices=self._device_metrics, system=system)
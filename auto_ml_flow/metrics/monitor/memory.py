@@ -1,23 +1,44 @@
 import psutil
 
-from auto_ml_flow.client.v1 import AutoMLFlowClient
 from auto_ml_flow.client.v1.models.metrics import MemoryMetricModel
+from auto_ml_flow.metrics.cgroup import Cgroup
 from auto_ml_flow.metrics.monitor.base import BaseMetricsMonitor, bytes_to_megabytes
+from auto_ml_flow.metrics.procfs import ProcReader
 
 
 class MemoryMonitor(BaseMetricsMonitor):
+    stats_name = "memory_stats"
+
+    def __init__(self, proc: ProcReader | None = None, cgroup: Cgroup | None = None) -> None:
+        """
+        Initialize the memory monitor.
+
+        Args:
+            proc (ProcReader | None): The `/proc` reader to take memory usage from. If None,
+                psutil is used.
+            cgroup (Cgroup | None): The cgroup to take memory usage and limit from, if it has
+                a memory limit. Otherwise usage of the whole host is reported.
+        """
+        super().__init__()
+        self.proc = proc
+        self.cgroup = cgroup
+
     def collect_metrics(self) -> None:
-        system_memory = psutil.virtual_memory()
-        self._metrics["system_memory_usage_megabytes"] = bytes_to_megabytes(system_memory.used)
-        self._metrics["system_memory_usage_percentage"] = (
-            system_memory.used / system_memory.total * 100
-        )
+        system_memory = psutil.virtual_memory() if self.proc is None else self.proc.read().memory
+        used, total = system_memory.used, system_memory.total
 
-    def log_metrics(self, system: int, client: AutoMLFlowClient) -> None:
-        memory_stats = MemoryMetricModel(
+        memory_max = self.cgroup.memory_max if self.cgroup is not None else None
+        if self.cgroup is not None and memory_max is not None:
+            cgroup_used = self.cgroup.memory_usage()
+            if cgroup_used is not None:
+                used, total = cgroup_used, min(total, memory_max)
+
+        self._metrics["system_memory_usage_megabytes"] = bytes_to_megabytes(used)
+        self._metrics["system_memory_usage_percentage"] = used / total * 100
+
+    def to_model(self, system: int) -> MemoryMetricModel:
+        return MemoryMetricModel(
             usage_megabytes=self.metrics["system_memory_usage_megabytes"],
             usage_percentage=self.metrics["system_memory_usage_percentage"],
             system=system,
         )
-
-        client.systems.metrics.memory_stats.create(memory_stats)
@@ -1,37 +1,57 @@
 import psutil
 
-from auto_ml_flow.client.v1 import AutoMLFlowClient
 from auto_ml_flow.client.v1.models.metrics import NetworkMetricModel
 from auto_ml_flow.metrics.monitor.base import BaseMetricsMonitor, bytes_to_megabytes
+from auto_ml_flow.metrics.procfs import NetCounters, ProcReader
 
 
 class NetworkMonitor(BaseMetricsMonitor):
-    def __init__(self) -> None:
+    stats_name = "network_stats"
+
+    def __init__(self, proc: ProcReader | None = None) -> None:
+        """
+        Initialize the network monitor.
+
+        Args:
+            proc (ProcReader | None): The `/proc` reader to take network counters from. If
+                None, psutil is used.
+        """
         super().__init__()
+        self.proc = proc
         self._set_initial_metrics()
 
+    def _read_counters(self) -> NetCounters:
+        if self.proc is None:
+            return psutil.net_io_counters()
+
+        # Totals of all interfaces, like `psutil.net_io_counters()`
+        interfaces = self.proc.read().interfaces.values()
+
+        return NetCounters._make(
+            sum(getattr(counters, field) for counters in interfaces)
+            for field in NetCounters._fields
+        )
+
     def _set_initial_metrics(self) -> None:
         # Set initial network usage metrics. `psutil.net_io_counters()` counts the stats since the
         # system boot, so to set network usage metrics as 0 when we start logging, we need to keep
         # the initial network usage metrics.
-        network_usage = psutil.net_io_counters()
+        network_usage = self._read_counters()
         self._initial_receive_megabytes = bytes_to_megabytes(network_usage.bytes_recv)
         self._initial_transmit_megabytes = bytes_to_megabytes(network_usage.bytes_sent)
 
     def collect_metrics(self) -> None:
-        network_usage = psutil.net_io_counters()
+        network_usage = self._read_counters()
         self._metrics["network_receive_megabytes"] = (
-            network_usage.bytes_recv / 1e6 - self._initial_receive_megabytes
+            bytes_to_megabytes(network_usage.bytes_recv) - self._initial_receive_megabytes
         )
         self._metrics["network_transmit_megabytes"] = (
-            network_usage.bytes_sent / 1e6 - self._initial_transmit_megabytes
+            bytes_to_megabytes(network_usage.bytes_sent) - self._initial_transmit_megabytes
         )
 
-    def log_metrics(self, system: int, client: AutoMLFlowClient) -> None:
-        network_stats = NetworkMetricModel(
+    def to_model(self, system: int) -> NetworkMetricModel:
+        return NetworkMetricModel(
             receive_megabytes=self.metrics["network_receive_megabytes"],
             transmit_megabytes=self.metrics["network_transmit_megabytes"],
             system=system,
         )
-
-        client.systems.metrics.network_stats.create(network_stats)
@@ -0,0 +1,89 @@
+import time
+from collections.abc import Collection
+from typing import Any
+
+import psutil
+
+from auto_ml_flow.client.v1.models.metrics import (
+    NetworkIOInterfaceMetricModel,
+    NetworkIOMetricModel,
+)
+from auto_ml_flow.metrics.monitor.base import BaseMetricsMonitor, counter_rate
+from auto_ml_flow.metrics.procfs import ProcReader
+
+
+class NetworkIOMonitor(BaseMetricsMonitor):
+    """Throughput of every network interface, as rates between two samples."""
+
+    stats_name = "network_io_stats"
+
+    def __init__(
+        self,
+        interfaces: Collection[str] | None = None,
+        exclude: Collection[str] = ("lo",),
+        proc: ProcReader | None = None,
+    ) -> None:
+        """
+        Initialize the network I/O monitor.
+
+        Args:
+            interfaces (Collection[str] | None): The names of the interfaces to monitor.
+                Defaults to all interfaces.
+            exclude (Collection[str]): The interfaces which are not monitored by default.
+            proc (ProcReader | None): The `/proc` reader to take interface counters from. If
+                None, psutil is used.
+        """
+        super().__init__()
+        self.interfaces = interfaces
+        self.exclude = exclude
+        self.proc = proc
+        self._interface_metrics: list[NetworkIOInterfaceMetricModel] = []
+        # Rates of the first sample are computed against the counters at start
+        self._previous, self._previous_time = self._read_counters()
+
+    def _read_counters(self) -> tuple[dict[str, Any], float]:
+        if self.proc is not None:
+            snapshot = self.proc.read()
+            counters, now = snapshot.interfaces, snapshot.time
+        else:
+            counters, now = psutil.net_io_counters(pernic=True), time.monotonic()
+
+        if self.interfaces is not None:
+            return {name: counters[name] for name in self.interfaces if name in counters}, now
+
+        return {name: value for name, value in counters.items() if name not in self.exclude}, now
+
+    def collect_metrics(self) -> None:
+        counters, now = self._read_counters()
+        elapsed = now - self._previous_time
+
+        self._interface_metrics = []
+        for name, current in counters.items():
+            previous = self._previous.get(name)
+            if previous is None:
+                # The interface appeared after the previous sample
+                continue
+
+            interface = NetworkIOInterfaceMetricModel(
+                interface=name,
+                receive_bytes_per_second=counter_rate(
+                    current.bytes_recv, previous.bytes_recv, elapsed
+                ),
+                transmit_bytes_per_second=counter_rate(
+                    current.bytes_sent, previous.bytes_sent, elapsed
+                ),
+                receive_packets_per_second=counter_rate(
+                    current.packets_recv, previous.packets_recv, elapsed
+                ),
+                transmit_packets_per_second=counter_rate(
+                    current.packets_sent, previous.packets_sent, elapsed
+                ),
+            )
+            self._interface_metrics.append(interface)
+            for key, value in interface.model_dump(exclude={"interface"}).items():
+                self._metrics[f"network_io_{name}_{key}"] = value
+
+        self._previous, self._previous_time = counters, now
+
+    def to_model(self, system: int) -> NetworkIOMetricModel:
+        return NetworkIOMetricModel(interfaces=self._interface_metrics, system=system)
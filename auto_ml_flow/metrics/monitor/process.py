@@ -0,0 +1,147 @@
+import os
+import time
+from collections import Counter
+from collections.abc import Collection
+
+import psutil
+
+from auto_ml_flow.client.v1.models.metrics import ProcessMetricModel
+from auto_ml_flow.metrics.monitor.base import BaseMetricsMonitor, bytes_to_megabytes
+
+
+class ProcessMonitor(BaseMetricsMonitor):
+    """Resources used by the current process and all of its children."""
+
+    stats_name = "process_stats"
+
+    def __init__(
+        self,
+        pid: int | None = None,
+        uss: bool = False,
+        children_interval: float = 1.0,
+        exclude: Collection[int] = (),
+    ) -> None:
+        """
+        Initialize the process monitor.
+
+        Args:
+            pid (int | None): The root process of the tree. Defaults to the current process.
+            uss (bool): Also collect unique set size. It reads the full memory map of every
+                process, so it is much slower than the other metrics.
+            children_interval (float): The interval (in seconds) at which the list of child
+                processes is refreshed. Looking up children scans all processes of the host,
+                so it is not done on every sample.
+            exclude (Collection[int]): The child processes which are not monitored, e.g. the
+                monitor's own sampling process.
+        """
+        super().__init__()
+        self.uss = uss
+        self.children_interval = children_interval
+        self.exclude = set(exclude)
+        self._root = psutil.Process(pid or os.getpid())
+        self._processes: dict[int, psutil.Process] = {self._root.pid: self._root}
+        self._children_refreshed_at = 0.0
+        self._previous_cpu_time: float | None = None
+        self._previous_time = 0.0
+
+    def _refresh_children(self) -> None:
+        now = time.monotonic()
+        if now - self._children_refreshed_at < self.children_interval:
+            return
+
+        self._children_refreshed_at = now
+        try:
+            children = self._root.children(recursive=True)
+        except psutil.NoSuchProcess:
+            children = []
+
+        # Keep known process objects, so psutil caches stay warm between samples
+        processes = {self._root.pid: self._root}
+        for child in children:
+            if child.pid in self.exclude:
+                continue
+
+            processes[child.pid] = self._processes.get(child.pid, child)
+
+        self._processes = processes
+
+    def _sample(self, process: psutil.Process) -> dict[str, float]:
+        with process.oneshot():
+            memory = process.memory_full_info() if self.uss else process.memory_info()
+            cpu_times = process.cpu_times()
+            sample = {
+                "rss": memory.rss,
+                "user": cpu_times.user,
+                "system": cpu_times.system,
+                "threads": process.num_threads(),
+            }
+
+            if self.uss:
+                sample["uss"] = memory.uss
+
+            # Not available on every platform
+            if hasattr(process, "num_fds"):
+                sample["fds"] = process.num_fds()
+
+            if hasattr(process, "io_counters"):
+                io_counters = process.io_counters()
+                sample["read"] = io_counters.read_bytes
+                sample["write"] = io_counters.write_bytes
+
+        return sample
+
+    def collect_metrics(self) -> None:
+        self._refresh_children()
+
+        totals: Counter[str] = Counter()
+        alive = 0
+        for pid, process in list(self._processes.items()):
+            try:
+                totals.update(self._sample(process))
+            except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                self._processes.pop(pid, None)
+                continue
+            except psutil.AccessDenied:
+                continue
+
+            alive += 1
+
+        now = time.monotonic()
+        cpu_time = totals["user"] + totals["system"]
+        cores_used = 0.0
+        if self._previous_cpu_time is not None and now > self._previous_time:
+            # CPU time of exited children is lost, so the delta is clamped at zero
+            cores_used = max(cpu_time - self._previous_cpu_time, 0) / (now - self._previous_time)
+        self._previous_cpu_time, self._previous_time = cpu_time, now
+
+        self._metrics["process_rss_megabytes"] = bytes_to_megabytes(totals["rss"])
+        self._metrics["process_cpu_user_seconds"] = totals["user"]
+        self._metrics["process_cpu_system_seconds"] = totals["system"]
+        self._metrics["process_cpu_cores_used"] = cores_used
+        self._metrics["process_num_processes"] = alive
+        self._metrics["process_num_threads"] = totals["threads"]
+
+        if "uss" in totals:
+            self._metrics["process_uss_megabytes"] = bytes_to_megabytes(totals["uss"])
+
+        if "fds" in totals:
+            self._metrics["process_num_fds"] = totals["fds"]
+
+        if "read" in totals:
+            self._metrics["process_read_megabytes"] = bytes_to_megabytes(totals["read"])
+            self._metrics["process_write_megabytes"] = bytes_to_megabytes(totals["write"])
+
+    def to_model(self, system: int) -> ProcessMetricModel:
+        return ProcessMetricModel(
+            rss_megabytes=self.metrics["process_rss_megabytes"],
+            uss_megabytes=self.metrics.get("process_uss_megabytes"),
+            cpu_user_seconds=self.metrics["process_cpu_user_seconds"],
+            cpu_system_seconds=self.metrics["process_cpu_system_seconds"],
+            cpu_cores_used=self.metrics["process_cpu_cores_used"],
+            num_processes=int(self.metrics["process_num_processes"]),
+            num_threads=int(self.metrics["process_num_threads"]),
+            num_fds=self.metrics.get("process_num_fds"),
+            read_megabytes=self.metrics.get("process_read_megabytes"),
+            write_megabytes=self.metrics.get("process_write_megabytes"),
+            system=system,
+        )
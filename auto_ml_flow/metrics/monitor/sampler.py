@@ -0,0 +1,155 @@
+"""
+Sampling process of `SharedMemorySystemMetricsMonitor`, writing samples to shared memory.
+
+Imported by the spawned sampling process, so it depends only on NumPy, the logger and the
+scheduler; psutil comes with the monitors.
+"""
+
+import time
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING
+
+import numpy as np
+from loguru import logger
+
+from auto_ml_flow.metrics.monitor.scheduler import FixedRateScheduler, StopEvent
+
+if TYPE_CHECKING:
+    from auto_ml_flow.metrics.monitor.base import BaseMetricsMonitor
+
+# Header of the buffer: the number of rows written so far
+HEADER_SIZE = np.dtype(np.int64).itemsize
+
+
+class SharedRingBuffer:
+    """
+    Ring buffer of samples in shared memory, with a single writer and a single reader.
+
+    Every row holds the timestamp of the sample followed by one column per metric. The writer
+    fills a row first and only then bumps the row counter in the header, so the reader never
+    sees a row which is half written.
+    """
+
+    def __init__(self, shm: SharedMemory, capacity: int, columns: int) -> None:
+        self.shm = shm
+        self.capacity = capacity
+        self.columns = columns
+        self._count = np.ndarray((1,), dtype=np.int64, buffer=shm.buf)
+        self._rows = np.ndarray(
+            (capacity, columns + 1), dtype=np.float64, buffer=shm.buf, offset=HEADER_SIZE
+        )
+        self._read = 0
+
+    @classmethod
+    def create(cls, capacity: int, columns: int) -> "SharedRingBuffer":
+        size = HEADER_SIZE + capacity * (columns + 1) * np.dtype(np.float64).itemsize
+        buffer = cls(SharedMemory(create=True, size=size), capacity, columns)
+        buffer._count[0] = 0
+
+        return buffer
+
+    @classmethod
+    def attach(cls, name: str, capacity: int, columns: int) -> "SharedRingBuffer":
+        return cls(SharedMemory(name=name), capacity, columns)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def write(self, timestamp: float, row: np.ndarray) -> None:
+        count = int(self._count[0])
+        slot = self._rows[count % self.capacity]
+        slot[0] = timestamp
+        slot[1:] = row
+        self._count[0] = count + 1
+
+    def read(self) -> tuple[np.ndarray, np.ndarray, int]:
+        """
+        Read the rows written since the previous call.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, int]: The timestamps and the rows of the new samples,
+                and the number of samples which were overwritten before they were read.
+        """
+        count = int(self._count[0])
+        start = max(self._read, count - self.capacity)
+        rows = self._rows[np.arange(start, count) % self.capacity]
+
+        # The writer may have wrapped around and overwritten the oldest rows while copying
+        valid = max(int(self._count[0]) - self.capacity, start)
+        rows = rows[valid - start :]
+        lost = valid - self._read
+        self._read = count
+
+        return rows[:, 0], rows[:, 1:], lost
+
+    def close(self) -> None:
+        # Views must be released before the memory can be closed
+        del self._count, self._rows
+        self.shm.close()
+
+
+def sample(
+    *,
+    buffer_name: str,
+    capacity: int,
+    columns: int,
+    interval: float,
+    max_interval: float | None,
+    monitors_factory: Callable[[], list["BaseMetricsMonitor"]],
+    names_conn: Connection,
+    stop_event: StopEvent,
+) -> None:
+    """
+    Entry point of the sampling process.
+
+    The process is spawned, so it imports this module and the monitors factory, and not
+    the rest of the tracker.
+    """
+    buffer = SharedRingBuffer.attach(buffer_name, capacity, columns)
+    monitors = monitors_factory()
+    scheduler = FixedRateScheduler(interval, max_interval=max_interval)
+    names: dict[str, int] = {}
+    # Metrics beyond the limit of columns, which are not sampled
+    skipped: set[str] = set()
+    row = np.empty(columns)
+
+    while not scheduler.wait(stop_event):
+        readings: dict[str, float] = {}
+        for monitor in monitors:
+            monitor.collect_metrics()
+            readings.update(monitor.metrics)
+
+        new_names = [name for name in readings if name not in names and name not in skipped]
+        if new_names:
+            added = new_names[: columns - len(names)]
+            for name in added:
+                names[name] = len(names)
+
+            if len(added) < len(new_names):
+                if not skipped:
+                    logger.warning(f"Only the first {columns} system metrics are sampled.")
+                skipped.update(new_names[len(added) :])
+
+            if added:
+                # Names are sent before the first row which uses them
+                names_conn.send(list(names))
+
+        row.fill(np.nan)
+        for name, value in readings.items():
+            column = names.get(name)
+            if column is not None:
+                row[column] = value
+
+        buffer.write(time.time(), row)
+        scheduler.observe(list(readings.values()))
+
+    jitter = scheduler.jitter_stats
+    logger.debug(
+        f"System metrics sampling jitter: mean {jitter['mean'] * 1000:.2f} ms, "
+        f"max {jitter['max'] * 1000:.2f} ms, missed ticks {jitter['missed_ticks']:.0f}"
+    )
+    names_conn.close()
+    buffer.close()
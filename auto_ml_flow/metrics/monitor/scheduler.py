@@ -0,0 +1,115 @@
+"""Fixed-rate scheduler of system metrics sampling."""
+
+import time
+from collections.abc import Sequence
+from typing import Protocol
+
+
+class StopEvent(Protocol):
+    """Event of `threading` or `multiprocessing` which stops the sampling."""
+
+    def is_set(self) -> bool: ...
+
+    def wait(self, timeout: float | None = None) -> bool: ...
+
+
+class FixedRateScheduler:
+    def __init__(
+        self,
+        interval: float,
+        max_interval: float | None = None,
+        tolerance: float = 0.05,
+        stable_ticks: int = 3,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Ticks are planned from the start time, not from the end of the previous sample, so the
+        sampling period doesn't drift when sampling is slow.
+
+        Args:
+            interval (float): The interval (in seconds) between ticks.
+            max_interval (float | None): The maximum interval (in seconds) the scheduler backs
+                off to while the observed readings are stable. If None, the rate is fixed.
+            tolerance (float): The relative change of a reading that is still considered
+                stable.
+            stable_ticks (int): The number of stable ticks in a row after which the interval
+                is doubled.
+        """
+        self.interval = interval
+        self.max_interval = max_interval or interval
+        self.tolerance = tolerance
+        self.stable_ticks = stable_ticks
+        self.current_interval = interval
+        self.missed_ticks = 0
+        self._next_tick: float | None = None
+        self._previous: list[float] | None = None
+        self._stable_count = 0
+        self._jitter_count = 0
+        self._jitter_sum = 0.0
+        self._jitter_max = 0.0
+
+    def wait(self, stop_event: StopEvent) -> bool:
+        """
+        Wait until the next tick.
+
+        The first call returns at once. A tick which is overdue because the previous sample
+        took too long is fired late, at once. Ticks before it which were missed entirely are
+        skipped instead of being fired in a burst.
+
+        Returns:
+            bool: True if `stop_event` was set while waiting.
+        """
+        now = time.monotonic()
+        if self._next_tick is None:
+            self._next_tick = now
+            return stop_event.is_set()
+
+        self._next_tick += self.current_interval
+        if self._next_tick < now:
+            # Only the last overdue tick is fired, the ones before it are missed
+            missed = int((now - self._next_tick) // self.current_interval)
+            self.missed_ticks += missed
+            self._next_tick += missed * self.current_interval
+
+        if stop_event.wait(max(self._next_tick - now, 0.0)):
+            return True
+
+        jitter = time.monotonic() - self._next_tick
+        self._jitter_count += 1
+        self._jitter_sum += jitter
+        self._jitter_max = max(self._jitter_max, jitter)
+
+        return False
+
+    def observe(self, readings: Sequence[float]) -> None:
+        """Adapt the interval to the readings of the last tick."""
+        if self.max_interval <= self.interval:
+            return
+
+        previous, self._previous = self._previous, list(readings)
+        if (
+            previous is not None
+            and len(previous) == len(readings)
+            and all(
+                abs(current - last) <= self.tolerance * max(abs(last), 1.0)
+                for current, last in zip(readings, previous, strict=True)
+            )
+        ):
+            self._stable_count += 1
+            if self._stable_count >= self.stable_ticks:
+                self._stable_count = 0
+                self.current_interval = min(self.current_interval * 2, self.max_interval)
+        else:
+            # Readings changed, so go back to full resolution
+            self._stable_count = 0
+            self.current_interval = self.interval
+
+    @property
+    def jitter_stats(self) -> dict[str, float]:
+        """Mean and max delay (in seconds) of ticks behind their schedule."""
+        return {
+            "mean": self._jitter_sum / self._jitter_count if self._jitter_count else 0.0,
+            "max": self._jitter_max,
+            "missed_ticks": self.missed_ticks,
+        }
@@ -0,0 +1,172 @@
+"""System metrics sampling in a separate process, passing samples through shared memory."""
+
+import multiprocessing
+import threading
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from auto_ml_flow.client.v1 import AutoMLFlowClient
+from auto_ml_flow.metrics.monitor import SystemMetricsMonitor, default_monitors
+from auto_ml_flow.metrics.monitor.base import BaseMetricsMonitor
+from auto_ml_flow.metrics.monitor.sampler import SharedRingBuffer, sample
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+    from multiprocessing.synchronize import Event
+
+
+class SharedMemorySystemMetricsMonitor(SystemMetricsMonitor):
+    def __init__(
+        self,
+        system: int,
+        client: AutoMLFlowClient,
+        interval: float = 10,
+        flush_interval: float | None = 10,
+        max_interval: float | None = None,
+        monitors: Callable[[], list[BaseMetricsMonitor]] = default_monitors,
+        capacity: int = 4096,
+        columns: int = 512,
+    ) -> None:
+        """
+        Initialize the system metrics monitor sampling in a separate process.
+
+        psutil calls and reading conversion run in the sampling process, so they don't take
+        the GIL from the training code. Samples are passed back through a ring buffer in
+        shared memory, and the training process only aggregates and uploads them every
+        `flush_interval`. The sampling process is spawned, so the main module of the calling
+        script must guard its entry point with `if __name__ == "__main__":`.
+
+        Args:
+            interval (float): The interval (in seconds) at which to collect metrics.
+            flush_interval (float | None): The interval (in seconds) at which the aggregates of
+                the samples are uploaded. Required, raw samples are never uploaded.
+            max_interval (float | None): If set, sampling backs off up to this interval (in
+                seconds) while readings are stable, and returns to `interval` when they change.
+            monitors (Callable[[], list[BaseMetricsMonitor]]): The function creating the
+                monitors in the sampling process. It must be picklable, e.g. a function of a
+                module or a `functools.partial` of one.
+            capacity (int): The number of samples the ring buffer holds. Samples which are not
+                read before the buffer wraps around are lost.
+            columns (int): The maximum number of metrics sampled.
+        """
+        super().__init__(
+            system,
+            client,
+            interval=interval,
+            flush_interval=flush_interval,
+            max_interval=max_interval,
+            aggregate=True,
+            monitors=[],
+        )
+        self.monitors_factory = monitors
+        self.capacity = capacity
+        self.columns = columns
+        self._buffer_reader: SharedRingBuffer | None = None
+        self._names_conn: Connection | None = None
+        self._names: list[str] = []
+        self._sampler: BaseProcess | None = None
+        self._stop_event: Event | None = None
+        self._read_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the sampling process and the upload thread."""
+        if self._sampler is not None:
+            logger.warning("System metrics monitoring is already running.")
+            return
+
+        logger.info("Starting system metrics monitoring in a separate process...")
+
+        # Forking a process with running threads is not safe
+        context = multiprocessing.get_context("spawn")
+        self._buffer_reader = SharedRingBuffer.create(self.capacity, self.columns)
+        self._names_conn, names_sender = context.Pipe(duplex=False)
+        self._stop_event = context.Event()
+        self._sampler = context.Process(
+            target=sample,
+            kwargs={
+                "buffer_name": self._buffer_reader.name,
+                "capacity": self.capacity,
+                "columns": self.columns,
+                "interval": self.interval,
+                "max_interval": self.scheduler.max_interval,
+                "monitors_factory": self.monitors_factory,
+                "names_conn": names_sender,
+                "stop_event": self._stop_event,
+            },
+            name="auto-ml-flow-monitor",
+            daemon=True,
+        )
+        self._sampler.start()
+        # The sampling process holds its own end of the pipe now
+        names_sender.close()
+
+        self._shutdown_event.clear()
+        self._uploader = threading.Thread(target=self._upload)
+        self._uploader.start()
+
+    def read_samples(self) -> None:
+        """Move the samples from the shared buffer into the aggregator."""
+        if self._buffer_reader is None or self._names_conn is None or self.aggregator is None:
+            return
+
+        with self._read_lock:
+            # Rows first: names are sent before the rows using them, so the names received
+            # next cover every row read
+            timestamps, rows, lost = self._buffer_reader.read()
+            try:
+                while self._names_conn.poll():
+                    self._names = self._names_conn.recv()
+            except (EOFError, OSError):
+                # The sampling process has exited, all names were received before
+                pass
+
+        if lost:
+            logger.warning(f"{lost} system metrics samples were overwritten before upload.")
+
+        if len(rows):
+            start = datetime.fromtimestamp(timestamps[0], UTC)
+            self.aggregator.extend(self._names, rows, start)
+
+    def flush(self, summary: bool = False) -> None:
+        self.read_samples()
+        super().flush(summary=summary)
+
+    def finish(self, timeout: float = 5) -> None:
+        """
+        Stop the sampling process and upload the remaining samples.
+
+        Args:
+            timeout (float): The maximum time (in seconds) to wait for the sampling process to
+                exit before it is terminated.
+        """
+        if self._sampler is None or self._uploader is None or self._stop_event is None:
+            logger.warning("System metrics monitoring is not running.")
+            return
+
+        self._stop_event.set()
+        self._sampler.join(timeout)
+        if self._sampler.is_alive():
+            logger.warning("System metrics sampling process didn't stop in time, terminating.")
+            self._sampler.terminate()
+            self._sampler.join()
+        elif self._sampler.exitcode:
+            logger.error(f"System metrics sampling process failed with {self._sampler.exitcode}.")
+
+        self._shutdown_event.set()
+        self._uploader.join()
+        self._sampler = None
+        self._uploader = None
+        self.flush(summary=True)
+
+        if self._buffer_reader is not None:
+            self._buffer_reader.close()
+            self._buffer_reader.shm.unlink()
+            self._buffer_reader = None
+
+        if self._names_conn is not None:
+            self._names_conn.close()
+            self._names_conn = None
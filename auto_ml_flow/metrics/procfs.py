@@ -0,0 +1,201 @@
+"""Linux metrics read straight from `/proc`, shared by all monitors of a process."""
+
+import os
+import sys
+import threading
+import time
+from functools import cache
+from pathlib import Path
+from typing import NamedTuple
+
+from loguru import logger
+
+PROC = Path("/proc")
+FILES = ("stat", "meminfo", "net/dev", "diskstats", "loadavg")
+# `/proc/diskstats` always counts in 512 byte sectors, whatever the device sector size is
+SECTOR_SIZE = 512
+
+
+class CPUTimes(NamedTuple):
+    busy: float
+    total: float
+
+
+class MemoryInfo(NamedTuple):
+    total: int
+    available: int
+    swap_total: int
+    swap_free: int
+
+    @property
+    def used(self) -> int:
+        return self.total - self.available
+
+
+class DiskCounters(NamedTuple):
+    # Same fields as `psutil.disk_io_counters`
+    read_count: int
+    write_count: int
+    read_bytes: int
+    write_bytes: int
+    busy_time: int
+
+
+class NetCounters(NamedTuple):
+    # Same fields as `psutil.net_io_counters`
+    bytes_recv: int
+    packets_recv: int
+    bytes_sent: int
+    packets_sent: int
+
+
+class ProcSnapshot(NamedTuple):
+    time: float
+    cpu: CPUTimes
+    memory: MemoryInfo
+    disks: dict[str, DiskCounters]
+    interfaces: dict[str, NetCounters]
+    load_avg: tuple[float, float, float]
+
+
+def _parse_stat(data: bytes) -> CPUTimes:
+    # The first line sums all CPUs: user nice system idle iowait irq softirq steal guest ...
+    fields = data[: data.index(b"\n")].split()[1:9]
+    times = [int(field) for field in fields]
+    # Guest time is already counted in user time, so it is left out, like psutil does
+    total = sum(times)
+    idle = times[3] + times[4]
+
+    return CPUTimes(busy=total - idle, total=total)
+
+
+def _parse_meminfo(data: bytes) -> MemoryInfo:
+    values = {}
+    for line in data.splitlines():
+        name, _, rest = line.partition(b":")
+        values[name] = int(rest.split()[0]) * 1024
+
+    total = values[b"MemTotal"]
+    free = values[b"MemFree"]
+    # MemAvailable is missing on kernels older than 3.14
+    available = values.get(b"MemAvailable") or (
+        free + values.get(b"Buffers", 0) + values.get(b"Cached", 0)
+    )
+
+    return MemoryInfo(
+        total=total,
+        available=min(available, total),
+        swap_total=values.get(b"SwapTotal", 0),
+        swap_free=values.get(b"SwapFree", 0),
+    )
+
+
+def _parse_net_dev(data: bytes) -> dict[str, NetCounters]:
+    interfaces = {}
+    # The first two lines are the header
+    for line in data.splitlines()[2:]:
+        name, _, rest = line.partition(b":")
+        fields = rest.split()
+        interfaces[name.strip().decode()] = NetCounters(
+            bytes_recv=int(fields[0]),
+            packets_recv=int(fields[1]),
+            bytes_sent=int(fields[8]),
+            packets_sent=int(fields[9]),
+        )
+
+    return interfaces
+
+
+def _parse_diskstats(data: bytes) -> dict[str, DiskCounters]:
+    disks = {}
+    for line in data.splitlines():
+        fields = line.split()
+        disks[fields[2].decode()] = DiskCounters(
+            read_count=int(fields[3]),
+            read_bytes=int(fields[5]) * SECTOR_SIZE,
+            write_count=int(fields[7]),
+            write_bytes=int(fields[9]) * SECTOR_SIZE,
+            busy_time=int(fields[12]),
+        )
+
+    return disks
+
+
+def _parse_loadavg(data: bytes) -> tuple[float, float, float]:
+    fields = data.split()
+
+    return float(fields[0]), float(fields[1]), float(fields[2])
+
+
+class ProcReader:
+    """Reader of `/proc` files which keeps them open and reads them into reused buffers."""
+
+    def __init__(self, root: Path = PROC, buffer_size: int = 64 * 1024) -> None:
+        """
+        Open the `/proc` files.
+
+        Args:
+            root (Path): The mount point of procfs.
+            buffer_size (int): The initial size (in bytes) of the read buffer of every file.
+                Buffers grow when a file doesn't fit.
+        """
+        self._fds = {name: os.open(root / name, os.O_RDONLY) for name in FILES}
+        self._buffers = {name: bytearray(buffer_size) for name in FILES}
+        self._snapshot: ProcSnapshot | None = None
+        self._lock = threading.Lock()
+
+    def _read(self, name: str) -> bytes:
+        fd, buffer = self._fds[name], self._buffers[name]
+        while True:
+            # Reading from offset 0 makes the kernel generate the file content again
+            size = os.preadv(fd, [buffer], 0)
+            if size < len(buffer):
+                return bytes(memoryview(buffer)[:size])
+
+            buffer = self._buffers[name] = bytearray(len(buffer) * 2)
+
+    def read(self, max_age: float = 0.05) -> ProcSnapshot:
+        """
+        Read all files at once.
+
+        Args:
+            max_age (float): The time (in seconds) a snapshot is reused for. All monitors of a
+                tick call this method, and only the first of them reads the files.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._snapshot is not None and now - self._snapshot.time < max_age:
+                return self._snapshot
+
+            self._snapshot = ProcSnapshot(
+                time=now,
+                cpu=_parse_stat(self._read("stat")),
+                memory=_parse_meminfo(self._read("meminfo")),
+                interfaces=_parse_net_dev(self._read("net/dev")),
+                disks=_parse_diskstats(self._read("diskstats")),
+                load_avg=_parse_loadavg(self._read("loadavg")),
+            )
+
+            return self._snapshot
+
+    def close(self) -> None:
+        for fd in self._fds.values():
+            os.close(fd)
+
+        self._fds.clear()
+
+
+@cache
+def get_proc_reader() -> ProcReader | None:
+    """`/proc` reader shared by all monitors of the process. None if procfs is not available."""
+    if not sys.platform.startswith("linux"):
+        return None
+
+    try:
+        reader = ProcReader()
+        reader.read()
+    except (OSError, ValueError, IndexError, KeyError) as e:
+        logger.debug(f"Reading /proc is not available, falling back to psutil: {e!r}")
+        return None
+
+    return reader
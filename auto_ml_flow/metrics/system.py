@@ -1,31 +1,140 @@
 import os
+import socket
+import tempfile
+from pathlib import Path
 
 import psutil
+from loguru import logger
+from pydantic import BaseModel, ValidationError
 
 from auto_ml_flow.client.v1.models.systems import SystemInfoModel
+from auto_ml_flow.metrics.cgroup import get_cgroup
 from auto_ml_flow.metrics.cpu import get_cpu_name
+from auto_ml_flow.metrics.gpu import get_gpu_name
 from auto_ml_flow.metrics.monitor.base import bytes_to_megabytes
+from auto_ml_flow.metrics.procfs import get_proc_reader
 
+BOOT_ID = Path("/proc/sys/kernel/random/boot_id")
+
+
+class StaticSystemInfo(BaseModel):
+    """Part of the system info which doesn't change until the host reboots."""
+
+    key: str
+    cpu_name: str
+    gpu_name: str | None = None
+
+
+def get_cache_dir() -> Path:
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "auto_ml_flow"
+
+
+def get_host_key() -> str:
+    """Key of the host and its boot, the static system info is valid for."""
+    try:
+        boot_id = BOOT_ID.read_text().strip()
+    except OSError:
+        # Not Linux, the boot time identifies the boot as well
+        boot_id = str(psutil.boot_time())
+
+    return f"{socket.gethostname()}/{boot_id}"
+
+
+def get_static_system_info(cache_dir: Path | None = None) -> StaticSystemInfo:
+    """
+    Get the static system info, cached on disk for the current boot of the host.
+
+    Looking up the CPU brand can take a second, so it is done once per boot instead of on
+    every run.
+
+    Args:
+        cache_dir (Path | None): The directory of the cache file. Defaults to
+            `$XDG_CACHE_HOME/auto_ml_flow`.
+    """
+    key = get_host_key()
+    path = (cache_dir or get_cache_dir()) / "system.json"
+    try:
+        cached = StaticSystemInfo.model_validate_json(path.read_bytes())
+    except (OSError, ValueError, ValidationError):
+        cached = None
+
+    if cached is not None and cached.key == key:
+        return cached
+
+    info = StaticSystemInfo(key=key, cpu_name=get_cpu_name(), gpu_name=get_gpu_name())
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Runs started at once may write the cache together, so the file is replaced atomically
+        with tempfile.NamedTemporaryFile("w", dir=path.parent, delete=False) as file:
+            file.write(info.model_dump_json())
+
+        Path(file.name).replace(path)
+    except OSError as e:
+        logger.debug(f"Failed to cache system info: {e!r}")
+
+    return info
+
+
+def get_system(use_cache: bool = True) -> SystemInfoModel:
+    """
+    Get the system info of the host.
+
+    Args:
+        use_cache (bool): Take the static system info from the on-disk cache. Otherwise it
+            is looked up again.
+    """
+    if use_cache:
+        static_info = get_static_system_info()
+        cpu_name, gpu_name = static_info.cpu_name, static_info.gpu_name
+    else:
+        cpu_name, gpu_name = get_cpu_name(), get_gpu_name()
+
+    proc = get_proc_reader()
+    if proc is not None:
+        # Load average and memory come from a single read of `/proc`
+        snapshot = proc.read()
+        load_avg_last_min, load_avg_last_5_min, load_avg_last_15_min = snapshot.load_avg
+        memory = snapshot.memory
+        ram_total, ram_free = memory.total, memory.available
+        swap_total, swap_free = memory.swap_total, memory.swap_free
+    else:
+        load_avg_last_min, load_avg_last_5_min, load_avg_last_15_min = os.getloadavg()
+        swap = psutil.swap_memory()
+        virtual_memory = psutil.virtual_memory()
+        ram_total, ram_free = virtual_memory.total, virtual_memory.available
+        swap_total, swap_free = swap.total, swap.free
+
+    cgroup = get_cgroup()
+    cpu_limit = None
+    if cgroup is not None:
+        # Inside a container the limits, not the host resources, are available to training
+        cpu_limit = cgroup.cpu_limit
+        memory_max, memory_usage = cgroup.memory_max, cgroup.memory_usage()
+        if memory_max is not None and memory_usage is not None:
+            ram_total = min(ram_total, memory_max)
+            ram_free = min(ram_free, max(memory_max - memory_usage, 0))
+
+        swap_max, swap_usage = cgroup.swap_max, cgroup.swap_usage()
+        if swap_max is not None and swap_usage is not None:
+            swap_total = min(swap_total, swap_max)
+            swap_free = min(swap_free, max(swap_max - swap_usage, 0))
 
-def get_system() -> SystemInfoModel:
-    cpu_name = get_cpu_name()
-    load_avg_last_min, load_avg_last_5_min, load_avg_last_15_min = os.getloadavg()
-    swap = psutil.swap_memory()
-    virtual_memory = psutil.virtual_memory()
     ram, ram_available = (
-        bytes_to_megabytes(virtual_memory.total, to_int=True),
-        bytes_to_megabytes(virtual_memory.available, to_int=True),
+        bytes_to_megabytes(ram_total, to_int=True),
+        bytes_to_megabytes(ram_free, to_int=True),
     )
-    swap_total, swap_available = (
-        bytes_to_megabytes(swap.total, to_int=True),
-        bytes_to_megabytes(swap.free, to_int=True),
+    swap, swap_available = (
+        bytes_to_megabytes(swap_total, to_int=True),
+        bytes_to_megabytes(swap_free, to_int=True),
     )
 
     return SystemInfoModel(
         cpu_name=cpu_name,
+        cpu_limit=cpu_limit,
+        gpu_name=gpu_name,
         ram=ram,
         ram_available=ram_available,
-        swap=swap_total,
+        swap=swap,
         swap_available=swap_available,
         load_avg_last_min=load_avg_last_min,
         load_avg_last_5_min=load_avg_last_5_min,
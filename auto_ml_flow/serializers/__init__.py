@@ -0,0 +1,73 @@
+"""Serializers of datasets logged to runs, chosen by the type of the dataset."""
+
+from typing import Any
+
+from auto_ml_flow.client.v1.consts import DatasetFormat
+from auto_ml_flow.serializers.arrow import ArrowSerializer, ParquetSerializer
+from auto_ml_flow.serializers.base import DatasetSerializer, iter_written, to_dataframe
+from auto_ml_flow.serializers.npy import NpySerializer
+from auto_ml_flow.serializers.pickled import PickleSerializer
+
+__all__ = [
+    "ArrowSerializer",
+    "DatasetSerializer",
+    "NpySerializer",
+    "ParquetSerializer",
+    "PickleSerializer",
+    "get_serializer",
+    "iter_written",
+    "register_serializer",
+    "to_dataframe",
+]
+
+SERIALIZERS: dict[DatasetFormat, DatasetSerializer] = {
+    serializer.format: serializer
+    for serializer in (
+        PickleSerializer(),
+        NpySerializer(),
+        ArrowSerializer(),
+        ParquetSerializer(),
+    )
+}
+# Formats tried in order when none is chosen: arrays as they are, then columnar DataFrames
+DEFAULT_FORMATS = (DatasetFormat.NPY, DatasetFormat.ARROW, DatasetFormat.PICKLE)
+
+
+def register_serializer(serializer: DatasetSerializer) -> None:
+    """
+    Use the serializer for its format, e.g. Arrow with compression.
+
+    Args:
+        serializer (DatasetSerializer): The serializer replacing the one of its format.
+    """
+    SERIALIZERS[serializer.format] = serializer
+
+
+def get_serializer(
+    data: Any,  # noqa: ANN401
+    dataset_format: DatasetFormat | str | None = None,
+) -> DatasetSerializer:
+    """
+    Get the serializer of the dataset.
+
+    Args:
+        data (Any): The dataset.
+        dataset_format (DatasetFormat | str | None): The format to serialize the dataset in.
+            Defaults to `.npy` for arrays, Arrow for DataFrames if pyarrow is installed, and
+            pickle otherwise.
+    """
+    if dataset_format is not None:
+        serializer = SERIALIZERS[DatasetFormat(dataset_format)]
+        if not serializer.supports(data):
+            name = type(data).__name__
+            raise ValueError(
+                f"Dataset of type {name} can't be serialized as {serializer.format.value}"
+            )
+
+        return serializer
+
+    return next(
+        SERIALIZERS[dataset_format]
+        for dataset_format in DEFAULT_FORMATS
+        if SERIALIZERS[dataset_format].supports(data)
+    )
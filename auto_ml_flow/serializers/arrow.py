@@ -0,0 +1,119 @@
+from collections.abc import Iterator
+from functools import cache
+from types import ModuleType
+from typing import IO, Any, Literal
+
+import numpy as np
+import pandas as pd
+
+from auto_ml_flow.client.v1.consts import DatasetFormat
+from auto_ml_flow.serializers.base import DatasetSerializer, iter_written, to_dataframe
+
+Compression = Literal["zstd", "lz4"]
+
+# The number of rows converted to Arrow at once, so the DataFrame is never copied as a whole
+BATCH_ROWS = 65_536
+
+
+@cache
+def _import_pyarrow() -> ModuleType | None:
+    try:
+        import pyarrow  # noqa: PLC0415
+    except ImportError:
+        return None
+
+    return pyarrow
+
+
+class ArrowSerializer(DatasetSerializer):
+    """
+    DataFrame in the Arrow IPC file format, readable without pyarrow's pandas conversion.
+
+    Without compression the file can be memory-mapped by `pyarrow.memory_map`, and its
+    columns are read without copy. Requires pyarrow.
+    """
+
+    format = DatasetFormat.ARROW
+    extension = "arrow"
+    content_type = "application/vnd.apache.arrow.file"
+
+    def __init__(
+        self, compression: Compression | None = None, batch_rows: int = BATCH_ROWS
+    ) -> None:
+        """
+        Initialize the serializer.
+
+        Args:
+            compression (Compression | None): The compression of the record batches.
+            batch_rows (int): The number of rows of the record batches.
+        """
+        self.compression = compression
+        self.batch_rows = batch_rows
+
+    def supports(self, data: Any) -> bool:  # noqa: ANN401
+        return _import_pyarrow() is not None and isinstance(
+            data, (pd.DataFrame, np.ndarray, str, bytes)
+        )
+
+    def _batches(self, df: pd.DataFrame) -> Iterator[Any]:
+        pa = _import_pyarrow()
+        if pa is None:
+            raise ImportError(f"pyarrow is required to serialize datasets as {self.format}")
+
+        # A default index is not stored, as pickled DataFrames get it back on load anyway
+        preserve_index = not isinstance(df.index, pd.RangeIndex)
+        schema = None
+        for start in range(0, max(len(df), 1), self.batch_rows):
+            batch = pa.RecordBatch.from_pandas(
+                df.iloc[start : start + self.batch_rows],
+                schema=schema,
+                preserve_index=preserve_index,
+            )
+            # The schema is inferred from the first batch, so all batches have the same
+            schema = batch.schema
+            yield batch
+
+    def _write(self, df: pd.DataFrame, file: IO[bytes]) -> None:
+        pa = _import_pyarrow()
+        batches = self._batches(df)
+        first = next(batches)
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)  # type: ignore[union-attr]
+        with pa.ipc.new_file(file, first.schema, options=options) as writer:  # type: ignore[union-attr]
+            writer.write_batch(first)
+            for batch in batches:
+                writer.write_batch(batch)
+
+    def chunks(self, data: Any) -> Iterator[bytes]:  # noqa: ANN401
+        df = to_dataframe(data)
+
+        return iter_written(lambda file: self._write(df, file))
+
+
+class ParquetSerializer(ArrowSerializer):
+    """DataFrame in the Parquet format, one row group per batch. Requires pyarrow."""
+
+    format = DatasetFormat.PARQUET
+    extension = "parquet"
+    content_type = "application/vnd.apache.parquet"
+
+    def __init__(
+        self, compression: Compression | None = "zstd", batch_rows: int = BATCH_ROWS
+    ) -> None:
+        """
+        Initialize the serializer.
+
+        Args:
+            compression (Compression | None): The compression of the column chunks.
+            batch_rows (int): The number of rows of the row groups.
+        """
+        super().__init__(compression, batch_rows)
+
+    def _write(self, df: pd.DataFrame, file: IO[bytes]) -> None:
+        import pyarrow.parquet as pq  # noqa: PLC0415
+
+        batches = self._batches(df)
+        first = next(batches)
+        with pq.ParquetWriter(file, first.schema, compression=self.compression or "none") as writer:
+            writer.write_batch(first)
+            for batch in batches:
+                writer.write_batch(batch)
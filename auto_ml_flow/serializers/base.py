@@ -0,0 +1,150 @@
+import contextlib
+import queue
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from io import BytesIO
+from typing import IO, Any
+
+import numpy as np
+import pandas as pd
+
+from auto_ml_flow.client.v1.consts import DatasetFormat
+
+CHUNK_SIZE = 1 << 20
+# The number of chunks serialized ahead of the upload
+MAX_PENDING_CHUNKS = 4
+
+Chunk = bytes | memoryview
+
+
+def to_dataframe(data: Any) -> pd.DataFrame:  # noqa: ANN401
+    """Convert a DataFrame, an array, or CSV content or path to a DataFrame."""
+    if isinstance(data, pd.DataFrame):
+        return data
+
+    if isinstance(data, np.ndarray):
+        return pd.DataFrame(data)
+
+    if isinstance(data, (str, bytes)):
+        try:
+            return pd.read_csv(data if isinstance(data, str) else BytesIO(data))
+        except Exception as e:
+            raise ValueError(f"Failed to convert file to DataFrame: {e}") from e
+
+    raise ValueError("Unsupported file type")
+
+
+class DatasetSerializer(ABC):
+    """Serializer of datasets, writing them in chunks while they are uploaded."""
+
+    format: DatasetFormat
+    extension: str
+    content_type: str = "application/octet-stream"
+
+    @abstractmethod
+    def supports(self, data: Any) -> bool:  # noqa: ANN401
+        """Whether the dataset can be serialized, e.g. its type and optional dependencies."""
+
+    @abstractmethod
+    def chunks(self, data: Any) -> Iterator[Chunk]:  # noqa: ANN401
+        """Serialize the dataset, chunk by chunk, as they are consumed."""
+
+
+class _CancelledError(Exception): ...
+
+
+class _ChunkWriter:
+    """File object passing what is written to the upload, in chunks of a fixed size."""
+
+    def __init__(self, chunk_size: int) -> None:
+        self.chunk_size = chunk_size
+        self.chunks: queue.Queue[bytes | BaseException | None] = queue.Queue(MAX_PENDING_CHUNKS)
+        self.cancelled = threading.Event()
+        self.closed = False
+        self._buffer = bytearray()
+        self._position = 0
+
+    def put(self, item: bytes | BaseException | None) -> None:
+        while True:
+            if self.cancelled.is_set():
+                raise _CancelledError
+
+            try:
+                self.chunks.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+
+            return
+
+    def write(self, data: Chunk) -> int:
+        # Large arrays are written at once as views of their memory, so they are sliced
+        # instead of being copied to the buffer
+        view = memoryview(data).cast("B")
+        size = len(view)
+        while view:
+            taken = self.chunk_size - len(self._buffer)
+            self._buffer += view[:taken]
+            view = view[taken:]
+            if len(self._buffer) >= self.chunk_size:
+                self.put(bytes(self._buffer))
+                self._buffer.clear()
+
+        self._position += size
+
+        return size
+
+    def tell(self) -> int:
+        return self._position
+
+    def writable(self) -> bool:
+        return True
+
+    def flush(self) -> None: ...
+
+    def close(self) -> None:
+        if self._buffer:
+            self.put(bytes(self._buffer))
+            self._buffer.clear()
+
+        self.closed = True
+
+
+def iter_written(
+    write: Callable[[IO[bytes]], None], chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Run a function writing to a file, and yield what it writes in chunks, as they are consumed.
+
+    The function runs in a thread which waits while `MAX_PENDING_CHUNKS` chunks are not
+    consumed, so the memory used doesn't depend on the size of what is written.
+
+    Args:
+        write (Callable[[IO[bytes]], None]): The function writing to the file it's passed.
+        chunk_size (int): The size (in bytes) of the chunks.
+    """
+    writer = _ChunkWriter(chunk_size)
+
+    def run() -> None:
+        try:
+            write(writer)  # type: ignore[arg-type]
+            writer.close()
+            writer.put(None)
+        except _CancelledError:
+            return
+        except BaseException as e:  # noqa: BLE001
+            with contextlib.suppress(_CancelledError):
+                writer.put(e)
+
+    thread = threading.Thread(target=run, name="auto_ml_flow_serializer", daemon=True)
+    thread.start()
+    try:
+        while (chunk := writer.chunks.get()) is not None:
+            if isinstance(chunk, BaseException):
+                raise chunk
+
+            yield chunk
+    finally:
+        # The upload may stop before the end, e.g. when the connection is lost
+        writer.cancelled.set()
+        thread.join()
@@ -0,0 +1,189 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import CancelledError
+from functools import cache
+from pathlib import Path
+from typing import Any, Protocol
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from auto_ml_flow.serializers.base import CHUNK_SIZE, Chunk, to_dataframe
+from auto_ml_flow.serializers.npy import NpySerializer
+
+
+class _Hash(Protocol):
+    def update(self, data: Chunk, /) -> object: ...
+
+    def hexdigest(self) -> str: ...
+
+
+def _new_hash() -> tuple[str, _Hash]:
+    try:
+        import blake3  # noqa: PLC0415
+
+        return "blake3", blake3.blake3(max_threads=blake3.blake3.AUTO)
+    except ImportError:
+        return "blake2b", hashlib.blake2b(digest_size=32)
+
+
+def _hash_chunks(chunks: Iterator[Chunk], cancelled: Callable[[], bool] | None = None) -> str:
+    """The digest, prefixed with the name of the algorithm, e.g. `blake2b:...`."""
+    name, digest = _new_hash()
+    for chunk in chunks:
+        if cancelled is not None and cancelled():
+            raise CancelledError("Hashing of the dataset was cancelled")
+
+        digest.update(chunk)
+
+    return f"{name}:{digest.hexdigest()}"
+
+
+def _file_chunks(path: Path) -> Iterator[bytes]:
+    with path.open("rb") as file:
+        while chunk := file.read(CHUNK_SIZE):
+            yield chunk
+
+
+def _series_chunks(series: pd.Series | pd.Index) -> Iterator[Chunk]:
+    values = series.to_numpy()
+    if values.dtype.kind in "biufcmM":
+        values = np.ascontiguousarray(values)
+    else:
+        # Strings, categories, objects and datetimes with a timezone are hashed value by value
+        # by pandas
+        values = pd.util.hash_pandas_object(series, index=False).to_numpy()
+
+    # Viewed as bytes first, as buffers of datetimes can't be cast
+    yield values.reshape(-1).view(np.uint8).data
+
+
+def _dataframe_chunks(df: pd.DataFrame) -> Iterator[Chunk]:
+    yield repr([(str(name), str(dtype)) for name, dtype in df.dtypes.items()]).encode()
+    if not isinstance(df.index, pd.RangeIndex):
+        yield from _series_chunks(df.index)
+
+    # Column by column, so only one column is copied at once
+    for i in range(df.shape[1]):
+        yield from _series_chunks(df.iloc[:, i])
+
+
+class HashCacheEntry(BaseModel):
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+_ENTRIES = TypeAdapter(dict[str, HashCacheEntry])
+
+
+class HashCache:
+    """
+    Digests of dataset files on disk, so unchanged files are not hashed again.
+
+    Entries are keyed by the resolved path, and are valid while the modification time and
+    the size of the file are the same.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            path (Path | None): The file the cache is kept in. Defaults to
+                `$XDG_CACHE_HOME/auto_ml_flow/dataset-hashes.json`.
+        """
+        self.path = path or get_cache_dir() / "dataset-hashes.json"
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, HashCacheEntry]:
+        try:
+            content = self.path.read_bytes()
+        except OSError:
+            return {}
+
+        try:
+            return _ENTRIES.validate_json(content)
+        except ValidationError:
+            return {}
+
+    def get(self, path: Path) -> str | None:
+        stat = path.stat()
+        entry = self._load().get(str(path.resolve()))
+        if entry is None or (entry.mtime_ns, entry.size) != (stat.st_mtime_ns, stat.st_size):
+            return None
+
+        return entry.digest
+
+    def set(self, path: Path, digest: str) -> None:
+        stat = path.stat()
+        with self._lock:
+            entries = self._load()
+            entries[str(path.resolve())] = HashCacheEntry(
+                mtime_ns=stat.st_mtime_ns, size=stat.st_size, digest=digest
+            )
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Replaced atomically, as trackers of the host share the cache. An entry written
+            # by another process at the same time may be lost, and is computed again
+            with tempfile.NamedTemporaryFile("wb", dir=self.path.parent, delete=False) as file:
+                file.write(_ENTRIES.dump_json(entries))
+
+            Path(file.name).replace(self.path)
+
+
+def get_cache_dir() -> Path:
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "auto_ml_flow"
+
+
+@cache
+def get_hash_cache() -> HashCache:
+    """Hash cache shared by all datasets of the process."""
+    return HashCache()
+
+
+def hash_dataset(
+    data: Any,  # noqa: ANN401
+    hash_cache: HashCache | None = None,
+    *,
+    cancelled: Callable[[], bool] | None = None,
+) -> str:
+    """
+    Hash the content of the dataset, chunk by chunk.
+
+    Arrays are hashed from their buffer, with their dtype and shape, and DataFrames column
+    by column, with their column names and dtypes. The digest doesn't depend on the format
+    the dataset is uploaded in, so lookups by hash must check the format too.
+
+    Args:
+        data (Any): The dataset: a DataFrame, an array, or CSV content or path.
+        hash_cache (HashCache | None): The cache of the digests of files. Without it, files
+            are hashed every time.
+        cancelled (Callable[[], bool] | None): Checked before every chunk; once it returns
+            True, hashing stops.
+
+    Raises:
+        CancelledError: If hashing was cancelled.
+    """
+    if isinstance(data, str) and os.path.isfile(data):  # noqa: PTH113
+        path = Path(data)
+        if hash_cache is not None and (digest := hash_cache.get(path)) is not None:
+            return digest
+
+        digest = _hash_chunks(_file_chunks(path), cancelled)
+        if hash_cache is not None:
+            hash_cache.set(path, digest)
+
+        return digest
+
+    if isinstance(data, bytes):
+        return _hash_chunks(iter((data,)), cancelled)
+
+    npy = NpySerializer()
+    if npy.supports(data):
+        return _hash_chunks(npy.chunks(data), cancelled)
+
+    return _hash_chunks(_dataframe_chunks(to_dataframe(data)), cancelled)
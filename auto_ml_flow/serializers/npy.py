@@ -0,0 +1,61 @@
+from collections.abc import Iterator
+from io import BytesIO
+from typing import Any
+
+import numpy as np
+
+from auto_ml_flow.client.v1.consts import DatasetFormat
+from auto_ml_flow.serializers.base import CHUNK_SIZE, Chunk, DatasetSerializer
+
+
+def _bytes_of(data: np.ndarray) -> memoryview:
+    """The buffer of a C-contiguous array, without copy."""
+    # Viewed as bytes first, as buffers of some dtypes, e.g. datetimes, can't be cast
+    return data.reshape(-1).view(np.uint8).data
+
+
+class NpySerializer(DatasetSerializer):
+    """
+    Array in the `.npy` format, the header followed by the raw buffer of the array.
+
+    The buffer of a contiguous array is sent from the memory of the array, without copy, and
+    the file can be memory-mapped by `numpy.load(..., mmap_mode="r")`.
+    """
+
+    format = DatasetFormat.NPY
+    extension = "npy"
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE) -> None:
+        self.chunk_size = chunk_size
+
+    def supports(self, data: Any) -> bool:  # noqa: ANN401
+        # Arrays of Python objects would have to be pickled
+        return isinstance(data, np.ndarray) and not data.dtype.hasobject
+
+    def chunks(self, data: np.ndarray) -> Iterator[Chunk]:
+        header = np.lib.format.header_data_from_array_1_0(data)
+        file = BytesIO()
+        try:
+            np.lib.format.write_array_header_1_0(file, header)
+        except ValueError:
+            # The header of arrays with many fields doesn't fit the version 1.0
+            file = BytesIO()
+            np.lib.format.write_array_header_2_0(file, header)
+
+        yield file.getvalue()
+
+        if data.size == 0:
+            return
+
+        if data.flags.c_contiguous or header["fortran_order"]:
+            # The transpose of a Fortran-ordered array is C-ordered, with the same buffer
+            buffer = _bytes_of(data.T if header["fortran_order"] else data)
+            for start in range(0, len(buffer), self.chunk_size):
+                yield buffer[start : start + self.chunk_size]
+
+            return
+
+        # A view with strides is copied by blocks of rows
+        rows = max(self.chunk_size // max(data[:1].nbytes, 1), 1)
+        for start in range(0, len(data), rows):
+            yield _bytes_of(np.ascontiguousarray(data[start : start + rows]))
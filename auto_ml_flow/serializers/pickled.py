@@ -0,0 +1,27 @@
+import pickle
+from collections.abc import Iterator
+from typing import Any
+
+from auto_ml_flow.client.v1.consts import DatasetFormat
+from auto_ml_flow.serializers.base import DatasetSerializer, iter_written, to_dataframe
+
+
+class PickleSerializer(DatasetSerializer):
+    """
+    Pickled DataFrame, the format of servers which don't read the others.
+
+    Pickles can only be read by Python, and loading one runs code, so the columnar formats
+    are preferred where they apply.
+    """
+
+    format = DatasetFormat.PICKLE
+    extension = "pkl"
+
+    def supports(self, data: Any) -> bool:  # noqa: ANN401, ARG002
+        return True
+
+    def chunks(self, data: Any) -> Iterator[bytes]:  # noqa: ANN401
+        df = to_dataframe(data)
+
+        # With protocol 5, numpy blocks of the DataFrame are written from their own memory
+        return iter_written(lambda file: pickle.dump(df, file, protocol=5))
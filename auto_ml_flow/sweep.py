@@ -0,0 +1,77 @@
+"""Hyperparameter sweeps whose trials run as tracked runs in a process pool."""
+
+import itertools
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any, NamedTuple
+
+from loguru import logger
+
+from auto_ml_flow.client.exceptions import ClientError
+from auto_ml_flow.client.v1 import AutoMLFlowClient
+from auto_ml_flow.client.v1.models.predict import MetaAlgoPredictions
+from auto_ml_flow.client.v1.models.systems import SystemInfoModel
+from auto_ml_flow.handlers.predict import get_training_time_features, predict_training_time
+
+Params = dict[str, Any]
+# Returns the value of the objective, or several named results
+Objective = Callable[[Params], float | Mapping[str, float]]
+# Returns the number of features and samples the trial trains on
+DatasetSize = Callable[[Params], tuple[int, int]]
+
+
+class Trial(NamedTuple):
+    number: int
+    params: Params
+    dataset_size: tuple[int, int] | None = None
+    predicted_time: MetaAlgoPredictions | None = None
+
+
+class TrialResult(NamedTuple):
+    number: int
+    params: Params
+    # None if the trial failed before its run was created
+    run_id: int | None
+    results: dict[str, float]
+    error: str | None = None
+
+
+def grid(search_space: Mapping[str, Sequence[Any]]) -> list[Params]:
+    """All combinations of the values of every parameter."""
+    names = list(search_space)
+
+    return [
+        dict(zip(names, values, strict=True))
+        for values in itertools.product(*search_space.values())
+    ]
+
+
+def schedule(
+    trials: list[Trial], system_info: SystemInfoModel, client: AutoMLFlowClient
+) -> list[Trial]:
+    """
+    Order trials by their predicted training time, the longest first.
+
+    Starting the longest trials first keeps all workers busy until the end of the sweep,
+    instead of waiting for one long trial started last. Trials without dataset size, or with
+    a failed prediction, keep their order after the predicted ones.
+    """
+    predictions: dict[tuple[int, int], MetaAlgoPredictions | None] = {}
+    for size in {trial.dataset_size for trial in trials if trial.dataset_size is not None}:
+        features = get_training_time_features(system_info, *size)
+        try:
+            predictions[size] = predict_training_time(features, client)
+        except ClientError as e:
+            logger.warning(f"Failed to predict training time of trials: {e!r}")
+            predictions[size] = None
+
+    trials = [
+        trial._replace(predicted_time=predictions[trial.dataset_size])
+        if trial.dataset_size is not None
+        else trial
+        for trial in trials
+    ]
+
+    return sorted(
+        trials,
+        key=lambda trial: -trial.predicted_time.duration if trial.predicted_time else 0,
+    )
@@ -0,0 +1,85 @@
+"""
+Size and serialization time of datasets in every format, against pickling to a temporary file.
+
+Run with `python benchmarks/dataset_formats.py [rows]`. Arrow and Parquet need pyarrow.
+"""
+
+import os
+import pickle
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from auto_ml_flow.serializers import (
+    ArrowSerializer,
+    DatasetSerializer,
+    NpySerializer,
+    ParquetSerializer,
+    PickleSerializer,
+)
+
+
+def pickle_to_temp_file(df: pd.DataFrame) -> int:
+    """The previous path: the DataFrame pickled to a temporary file, then read to be sent."""
+    with tempfile.NamedTemporaryFile(suffix=".pkl") as file:
+        pickle.dump(df, file)
+        file.flush()
+        file.seek(0)
+
+        return sum(len(chunk) for chunk in iter(lambda: file.read(1 << 20), b""))
+
+
+def stream(serializer: DatasetSerializer, data: object) -> int:
+    return sum(len(chunk) for chunk in serializer.chunks(data))
+
+
+def measure(serialize: Callable[[], int]) -> tuple[float, float]:
+    """Size (in MB) and time (in seconds) of the serialization."""
+    start = time.perf_counter()
+    size = serialize()
+
+    return size / 1e6, time.perf_counter() - start
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = np.random.default_rng(0)
+    array = rng.random((rows, 20), dtype=np.float32)
+    df = pd.DataFrame(
+        {
+            "feature": rng.random(rows),
+            "count": rng.integers(0, 100, rows),
+            "label": rng.choice(["cat", "dog", "bird"], rows),
+        }
+    )
+
+    cases: list[tuple[str, Callable[[], int]]] = [
+        ("array, pickle to temp file", lambda: pickle_to_temp_file(pd.DataFrame(array))),
+        ("array, pickle", lambda: stream(PickleSerializer(), array)),
+        ("array, npy", lambda: stream(NpySerializer(), array)),
+        ("DataFrame, pickle to temp file", lambda: pickle_to_temp_file(df)),
+        ("DataFrame, pickle", lambda: stream(PickleSerializer(), df)),
+    ]
+    if ArrowSerializer().supports(df):
+        cases += [
+            ("DataFrame, arrow", lambda: stream(ArrowSerializer(), df)),
+            ("DataFrame, arrow zstd", lambda: stream(ArrowSerializer(compression="zstd"), df)),
+            ("DataFrame, parquet", lambda: stream(ParquetSerializer(compression=None), df)),
+            ("DataFrame, parquet zstd", lambda: stream(ParquetSerializer(), df)),
+        ]
+    else:
+        logger.warning("pyarrow is not installed, Arrow and Parquet are skipped.")
+
+    logger.info(f"{rows} rows, {os.cpu_count()} CPUs")
+    for name, serialize in cases:
+        size, duration = measure(serialize)
+        logger.info(f"{name:>32}: {size:8.1f} MB, {duration:6.3f} s")
+
+
+if __name__ == "__main__":
+    main()
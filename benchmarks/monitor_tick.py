@@ -0,0 +1,46 @@
+"""
+Per-tick cost of system metrics collection, `/proc` reader against psutil.
+
+Run with `python benchmarks/monitor_tick.py [ticks]`.
+"""
+
+import sys
+import time
+
+from loguru import logger
+
+from auto_ml_flow.metrics.monitor import default_monitors
+from auto_ml_flow.metrics.monitor.base import BaseMetricsMonitor
+from auto_ml_flow.metrics.procfs import get_proc_reader
+
+
+def tick_cost(monitors: list[BaseMetricsMonitor], ticks: int) -> tuple[float, float]:
+    """Mean wall and CPU time (in microseconds) of one tick of all monitors."""
+    wall, cpu = time.perf_counter(), time.thread_time()
+    for _ in range(ticks):
+        for monitor in monitors:
+            monitor.collect_metrics()
+
+        # Ticks are further apart than the snapshot age in real monitoring
+        time.sleep(0.06)
+
+    sleep = 0.06 * ticks
+
+    return (
+        (time.perf_counter() - wall - sleep) / ticks * 1e6,
+        (time.thread_time() - cpu) / ticks * 1e6,
+    )
+
+
+def main() -> None:
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    if get_proc_reader() is None:
+        sys.exit("/proc is not available on this platform.")
+
+    for name, use_procfs in (("psutil", False), ("/proc", True)):
+        wall, cpu = tick_cost(default_monitors(use_procfs=use_procfs), ticks)
+        logger.info(f"{name:>8}: {wall:8.1f} us wall, {cpu:8.1f} us CPU per tick")
+
+
+if __name__ == "__main__":
+    main()
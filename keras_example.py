@@ -45,9 +45,13 @@ def main():
 
     with AutoMLFlow.start_run("Keras_MNIST"):
         # Log hyperparameters
-        AutoMLFlow.log_metric("learning_rate", args.learning_rate)
-        AutoMLFlow.log_metric("batch_size", args.batch_size)
-        AutoMLFlow.log_metric("epochs", args.epochs)
+        AutoMLFlow.log_metrics(
+            {
+                "learning_rate": args.learning_rate,
+                "batch_size": args.batch_size,
+                "epochs": args.epochs,
+            }
+        )
 
         # Define model
         model = Sequential(
@@ -72,14 +76,12 @@ def main():
         )
 
         # Log training history
-        for metric in history.history:
-            for value in history.history[metric]:
-                AutoMLFlow.log_metric(metric, value)
+        for metric, values in history.history.items():
+            AutoMLFlow.log_metric_series(metric, values)
 
         # Evaluate model
         loss, acc = model.evaluate(X_test, y_test)
-        AutoMLFlow.log_metric("test_accuracy", acc)
-        AutoMLFlow.log_metric("test_loss", loss)
+        AutoMLFlow.log_metrics({"test_accuracy": acc, "test_loss": loss})
 
         # Log evaluation results
         y_proba = model.predict(X_test)
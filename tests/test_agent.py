@@ -0,0 +1,157 @@
+import json
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+import requests
+import requests_mock
+
+from auto_ml_flow import AutoMLFlow
+from auto_ml_flow.active_run import ActiveRun
+from auto_ml_flow.agent import (
+    RelayAgent,
+    RelaySession,
+    Reply,
+    _authkey_path,
+    _Coalescer,
+    _connect,
+    _make_private_dir,
+    start_agent,
+)
+from auto_ml_flow.client.v1 import AutoMLFlowClient
+from auto_ml_flow.client.v1.models.runs import RunModel
+
+URL = "http://tracking.test/"
+
+
+@pytest.fixture
+def agent(tmp_path: Path) -> Iterator[RelayAgent]:
+    agent = RelayAgent(URL, tmp_path / "agent" / "relay.sock", idle_timeout=0.5)
+    thread = threading.Thread(target=agent.serve, daemon=True)
+    thread.start()
+    # Returns once the agent accepts connections
+    start_agent(URL, agent.address)
+
+    yield agent
+
+    thread.join(10)
+
+
+def test_private_dir_is_created_with_owner_only_mode(tmp_path: Path) -> None:
+    path = tmp_path / "agent"
+    _make_private_dir(path)
+
+    assert path.stat().st_mode & 0o777 == 0o700
+
+
+def test_existing_dir_accessible_by_others_is_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "agent"
+    path.mkdir()
+    path.chmod(0o777)
+
+    with pytest.raises(PermissionError):
+        _make_private_dir(path)
+
+
+def test_connection_needs_the_key_of_the_agent(agent: RelayAgent) -> None:
+    key_path = _authkey_path(agent.address)
+    assert key_path.stat().st_mode & 0o777 == 0o600
+
+    conn = _connect(agent.address)
+    assert conn is not None
+    conn.send(("detach", 1))
+    assert conn.recv() == ("ok",)
+    conn.close()
+
+    key = key_path.read_bytes()
+    key_path.write_bytes(b"not the key")
+    assert _connect(agent.address) is None
+    key_path.write_bytes(key)
+
+
+def test_coalescer_survives_a_body_which_is_not_json() -> None:
+    replies = iter([(200, {}, b"<html>"), (200, {}, b'[{"id": 1}]')])
+    coalescer = _Coalescer(lambda _: next(replies))
+
+    with pytest.raises(json.JSONDecodeError):
+        coalescer.submit([{"key": "loss"}]).result(timeout=5)
+
+    assert coalescer.submit([{"key": "loss"}]).result(timeout=5)[0] == 200
+
+
+def test_rejected_merged_request_is_sent_again_per_sender() -> None:
+    in_flight = threading.Event()
+    release = threading.Event()
+    sent: list[list[Any]] = []
+
+    def send(items: list[Any]) -> Reply:
+        in_flight.set()
+        release.wait(5)
+        sent.append(items)
+        if any(item is None for item in items):
+            return 422, {}, b'{"detail": "invalid"}'
+
+        return 200, {}, json.dumps(items).encode()
+
+    coalescer = _Coalescer(send)
+    first = coalescer.submit([0])
+    in_flight.wait(5)
+    # Queued while the first request is in flight, so they are merged
+    valid = coalescer.submit([1])
+    invalid = coalescer.submit([None])
+    release.set()
+
+    assert first.result(timeout=5) == (200, {}, b"[0]")
+    assert valid.result(timeout=5) == (200, {}, b"[1]")
+    assert invalid.result(timeout=5)[0] == 422
+    assert sent == [[0], [1, None], [1], [None]]
+
+
+def test_systems_are_detached_when_their_connection_closes(agent: RelayAgent) -> None:
+    conn = _connect(agent.address)
+    assert conn is not None
+    conn.send(("attach", 7))
+    assert conn.recv() == ("ok",)
+    assert agent.monitor.systems == {7}
+
+    # The tracker dies without detaching
+    conn.close()
+    deadline = time.monotonic() + 5
+    while agent.monitor.systems and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    assert agent.monitor.systems == set()
+
+
+def test_log_dataset_through_the_agent(
+    agent: RelayAgent, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    client = AutoMLFlowClient(base_url=URL, session=RelaySession(agent.address))
+    run = RunModel.model_construct(id=1)
+    monkeypatch.setattr(AutoMLFlow, "_get_run", lambda: (client, ActiveRun(run)))
+    bodies: list[tuple[str, bytes]] = []
+
+    def create(request: requests.PreparedRequest, _: object) -> dict:
+        body = request.body
+        content = body if isinstance(body, bytes) else b"".join(body)  # type: ignore[arg-type]
+        bodies.append((request.headers["Content-Type"], content))
+        return {"id": 3, "n_samples": 4, "n_features": 2, "run": 1, "file": "run_1.npy"}
+
+    with requests_mock.Mocker() as mock:
+        lookup = mock.get(f"{URL}api/v1/datasets/", json=[])
+        mock.post(f"{URL}api/v1/datasets/uploads/", status_code=404)
+        mock.post(f"{URL}api/v1/datasets/", json=create)
+        upload = AutoMLFlow.log_dataset(2, 4, np.ones((4, 2)), background=False)
+
+    assert upload.result().id == 3
+    # The lookup goes through the agent, the streamed upload directly to the server
+    assert lookup.call_count == 1
+    ((content_type, content),) = bodies
+    boundary = content_type.removeprefix("multipart/form-data; boundary=")
+    assert content.endswith(f"--{boundary}--\r\n".encode())
+    assert np.ones((4, 2)).tobytes() in content
@@ -0,0 +1,74 @@
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from auto_ml_flow.metrics.monitor.aggregate import WindowAggregator
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def at(seconds: float) -> datetime:
+    return START + timedelta(seconds=seconds)
+
+
+def test_rotate_aggregates_the_window_and_starts_a_new_one() -> None:
+    aggregator = WindowAggregator(capacity=2)
+    for second, value in enumerate([1.0, 5.0, 3.0]):
+        aggregator.add({"cpu": value}, at(second))
+
+    (first,) = aggregator.rotate(system=1, timestamp=at(3))
+    assert (first.count, first.min, first.max, first.mean, first.last) == (3, 1, 5, 3, 3)
+    assert first.window_start == START
+    assert not first.is_summary
+
+    aggregator.add({"cpu": 7.0}, at(4))
+    (second,) = aggregator.rotate(system=1, timestamp=at(5))
+    assert (second.count, second.mean, second.window_start) == (1, 7, at(4))
+    assert aggregator.rotate(system=1, timestamp=at(6)) == []
+
+
+def test_summary_covers_rotated_windows_and_the_current_one() -> None:
+    aggregator = WindowAggregator()
+    aggregator.add({"cpu": 1.0}, at(0))
+    aggregator.add({"cpu": 2.0}, at(1))
+    aggregator.rotate(system=1, timestamp=at(2))
+    aggregator.add({"cpu": 6.0}, at(2))
+
+    (summary,) = aggregator.summary(system=1, timestamp=at(3))
+    assert summary.is_summary
+    assert (summary.count, summary.min, summary.max, summary.mean, summary.last) == (3, 1, 6, 3, 6)
+    assert (summary.p50, summary.window_start) == (2, START)
+    assert aggregator.run_stats()["cpu"]["count"] == 3
+
+
+def test_metric_added_later_is_back_filled_with_nan() -> None:
+    aggregator = WindowAggregator()
+    aggregator.add({"cpu": 1.0}, at(0))
+    aggregator.rotate(system=1, timestamp=at(1))
+    aggregator.add({"cpu": 2.0, "gpu0_power_watts": 100.0}, at(1))
+    aggregator.extend(["gpu0_power_watts"], np.array([[300.0]]), at(2))
+
+    stats = aggregator.run_stats()
+    assert aggregator.names == ["cpu", "gpu0_power_watts"]
+    assert stats["gpu0_power_watts"] == pytest.approx(
+        {"count": 2, "min": 100, "max": 300, "mean": 200, "p50": 200, "p95": 290, "last": 300}
+    )
+    # The last reading of the CPU is kept, though the last sample has none
+    assert (stats["cpu"]["count"], stats["cpu"]["last"]) == (2, 2)
+
+
+def test_run_stats_keep_a_bounded_reservoir() -> None:
+    aggregator = WindowAggregator(reservoir_size=256, seed=0)
+    values = np.arange(10_000, dtype=float)
+    for window in np.split(values, 100):
+        aggregator.extend(["cpu"], window[:, None], START)
+        aggregator.rotate(system=1, timestamp=START)
+
+    stats = aggregator.run_stats()["cpu"]
+    assert aggregator._run.reservoir.shape == (256, 1)
+    assert (stats["count"], stats["min"], stats["max"], stats["last"]) == (10_000, 0, 9999, 9999)
+    assert stats["mean"] == pytest.approx(4999.5)
+    # Estimated from the reservoir, within a few percent of the range
+    assert stats["p50"] == pytest.approx(5000, abs=800)
+    assert stats["p95"] == pytest.approx(9500, abs=400)
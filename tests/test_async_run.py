@@ -0,0 +1,157 @@
+import asyncio
+import json
+from collections.abc import Iterator
+from urllib.parse import parse_qsl
+
+import httpx
+import pytest
+import requests_mock
+
+from auto_ml_flow import AutoMLFlow
+from auto_ml_flow.client.v1 import aio
+from auto_ml_flow.client.v1.aio import AsyncAutoMLFlowClient
+from auto_ml_flow.metrics.monitor import AsyncSystemMetricsMonitor
+from auto_ml_flow.metrics.monitor.cpu import CPUMonitor
+
+URL = "http://tracking.test/"
+TIMESTAMPS = {"created_at": "2024-01-01T00:00:00", "updated_at": "2024-01-01T00:00:00"}
+RUN = {"id": 1, "duration": None, "experiment": 1, "traceback": None, **TIMESTAMPS}
+SYSTEM = {
+    "id": 1,
+    "cpu_name": "cpu",
+    "ram": 1,
+    "ram_available": 1,
+    "swap": 1,
+    "swap_available": 1,
+    "load_avg_last_min": 0,
+    "load_avg_last_5_min": 0,
+    "load_avg_last_15_min": 0,
+}
+
+
+def handle(request: httpx.Request) -> httpx.Response:
+    """Stand-in of the tracking server, echoing what it's sent."""
+    path = request.url.path
+    if path == "/api/v1/runs/" or request.method == "PATCH":
+        return httpx.Response(200, json=RUN)
+
+    if path == "/api/v1/systems/":
+        return httpx.Response(200, json=SYSTEM)
+
+    if request.headers.get("Content-Type") == "application/json":
+        return httpx.Response(200, json=json.loads(request.content))
+
+    return httpx.Response(200, json=dict(parse_qsl(request.content.decode()), **TIMESTAMPS))
+
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> Iterator[requests_mock.Mocker]:
+    AutoMLFlow.set_tracking_url(URL)
+    monkeypatch.setattr(
+        aio,
+        "create_async_session",
+        lambda _: httpx.AsyncClient(transport=httpx.MockTransport(handle)),
+    )
+    with requests_mock.Mocker() as mock:
+        mock.get(f"{URL}api/v1/experiments/e/", json={"id": 1, "name": "e", **TIMESTAMPS})
+        yield mock
+
+
+def test_async_run_after_start_experiment(server: requests_mock.Mocker) -> None:
+    AutoMLFlow.start_experiment("e")
+
+    async def train() -> int:
+        async with AutoMLFlow.astart_run("run") as run:
+            return run.id
+
+    assert asyncio.run(train()) == 1
+    assert server.call_count == 1
+
+
+@pytest.mark.usefixtures("server")
+def test_async_client_per_event_loop() -> None:
+    AutoMLFlow.start_experiment("e")
+
+    async def train() -> AsyncAutoMLFlowClient:
+        async with AutoMLFlow.astart_run("run"):
+            client, _ = AutoMLFlow._get_arun()
+            await AutoMLFlow.alog_metric("loss", 0.5)
+            assert client is AutoMLFlow._get_aclient()
+            return client
+
+    # Connections of a client can't be used from another loop, so every loop gets its own
+    assert asyncio.run(train()) is not asyncio.run(train())
+
+
+@pytest.mark.usefixtures("server")
+def test_async_run_is_left_when_monitoring_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    AutoMLFlow.start_experiment("e")
+
+    async def broken_monitor(*_: object, **__: object) -> None:
+        raise RuntimeError
+
+    monkeypatch.setattr(AutoMLFlow, "_astart_monitor", broken_monitor)
+
+    async def train() -> None:
+        async with AutoMLFlow.astart_run("run"):
+            assert AutoMLFlow.current_run() is not None
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(train())
+
+    assert AutoMLFlow.current_run() is None
+    assert AutoMLFlow._runs == {}
+
+
+def test_async_monitor_uploads_batches() -> None:
+    batches = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        batches.append(json.loads(request.content))
+        return httpx.Response(200, json={})
+
+    async def monitor() -> None:
+        session = httpx.AsyncClient(transport=httpx.MockTransport(record))
+        client = AsyncAutoMLFlowClient(URL, session=session)
+        monitor = AsyncSystemMetricsMonitor(
+            1, client, interval=0.05, flush_interval=0.2, monitors=[CPUMonitor()]
+        )
+        monitor.start()
+        await asyncio.sleep(0.5)
+        await monitor.finish()
+
+    asyncio.run(monitor())
+
+    assert len(batches) >= 2
+    assert sum(len(batch["cpu_stats"]) for batch in batches) >= 5
+
+
+def test_async_monitor_finish_waits_for_the_upload_in_progress() -> None:
+    started: list[int] = []
+    uploaded: list[int] = []
+
+    async def monitor() -> None:
+        in_flight = asyncio.Event()
+
+        async def slow(request: httpx.Request) -> httpx.Response:
+            size = len(json.loads(request.content)["cpu_stats"])
+            started.append(size)
+            in_flight.set()
+            await asyncio.sleep(0.3)
+            uploaded.append(size)
+            return httpx.Response(200, json={})
+
+        session = httpx.AsyncClient(transport=httpx.MockTransport(slow))
+        client = AsyncAutoMLFlowClient(URL, session=session)
+        monitor = AsyncSystemMetricsMonitor(
+            1, client, interval=0.05, flush_interval=0.1, monitors=[CPUMonitor()]
+        )
+        monitor.start()
+        await in_flight.wait()
+        # Lands while the first batch is being uploaded
+        await monitor.finish()
+
+    asyncio.run(monitor())
+
+    assert started[0]
+    assert uploaded == started
@@ -0,0 +1,72 @@
+import time
+
+import requests
+import requests_mock
+
+from auto_ml_flow.background import BackgroundLogger
+from auto_ml_flow.client.v1 import AutoMLFlowClient
+from auto_ml_flow.client.v1.models.run_metrics import CreateRunMetricPayload
+
+URL = "http://tracking.test/"
+METRICS_BATCH = f"{URL}api/v1/run-metrics/batch/"
+
+
+def metric(step: int) -> CreateRunMetricPayload:
+    return CreateRunMetricPayload(key="loss", value=0.5, run=1, step=step)
+
+
+def created(request: requests.PreparedRequest, _: object) -> list[dict]:
+    return [
+        dict(record, created_at="2024-01-01T00:00:00", updated_at="2024-01-01T00:00:00")
+        for record in request.json()
+    ]
+
+
+def test_worker_survives_unexpected_errors() -> None:
+    client = AutoMLFlowClient(base_url=URL)
+    with requests_mock.Mocker() as mock:
+        mock.post(
+            METRICS_BATCH,
+            [
+                {"status_code": 422, "json": {"detail": "invalid"}},
+                {"exc": requests.exceptions.ReadTimeout},
+                {"json": created},
+            ],
+        )
+        background = BackgroundLogger(client)
+        background.start()
+        for step in range(3):
+            background.log(metric(step))
+            # One batch per record
+            time.sleep(0.2)
+
+        background.finish()
+
+        assert mock.call_count == 3
+        assert mock.last_request.json() == [{"key": "loss", "value": 0.5, "run": 1, "step": 2}]
+
+
+def test_log_drops_oldest_records_when_queue_is_full() -> None:
+    background = BackgroundLogger(AutoMLFlowClient(base_url=URL), max_queue_size=2)
+
+    # Never started, as if the worker died: `log` must not block
+    for step in range(5):
+        background.log(metric(step))
+
+    assert background.dropped == 3
+    assert [background._queue.get_nowait().step for _ in range(2)] == [3, 4]
+
+
+def test_finish_returns_at_once_when_worker_is_dead() -> None:
+    background = BackgroundLogger(AutoMLFlowClient(base_url=URL))
+    background.start()
+    background._discard_event.set()
+    background._queue.put(None)
+    background._process.join()
+    background.log(metric(0))
+
+    start = time.monotonic()
+    background.finish(timeout=5)
+
+    assert time.monotonic() - start < 1
+    assert background._process is None
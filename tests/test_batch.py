@@ -0,0 +1,86 @@
+import asyncio
+from urllib.parse import parse_qsl
+
+import httpx
+import requests
+import requests_mock
+
+from auto_ml_flow.client.v1 import AutoMLFlowClient
+from auto_ml_flow.client.v1.aio import AsyncAutoMLFlowClient
+from auto_ml_flow.client.v1.models.run_metrics import (
+    CreateRunMetricPayload,
+    CreateRunParamPayload,
+    CreateRunResultPayload,
+)
+from auto_ml_flow.metrics.monitor import SystemMetricsMonitor
+from auto_ml_flow.metrics.monitor.cpu import CPUMonitor
+
+URL = "http://tracking.test/"
+TIMESTAMPS = {"created_at": "2024-01-01T00:00:00", "updated_at": "2024-01-01T00:00:00"}
+
+
+def created(request: requests.PreparedRequest, _: object) -> dict:
+    return dict(parse_qsl(request.text), **TIMESTAMPS)
+
+
+def test_batch_falls_back_to_single_creates() -> None:
+    client = AutoMLFlowClient(base_url=URL)
+    metrics = [CreateRunMetricPayload(key="loss", value=0.5, run=1, step=step) for step in (0, 1)]
+    with requests_mock.Mocker() as mock:
+        batch = mock.post(f"{URL}api/v1/run-metrics/batch/", status_code=405, text="<html>")
+        single = mock.post(f"{URL}api/v1/run-metrics/", json=created)
+
+        assert [m.step for m in client.runs.metrics.create_batch(metrics)] == [0, 1]
+        client.runs.metrics.create_batch(metrics)
+
+    # The batch endpoint isn't tried again once the server answered it has none
+    assert batch.call_count == 1
+    assert single.call_count == 4
+
+
+def test_params_batch_excludes_none() -> None:
+    client = AutoMLFlowClient(base_url=URL)
+    with requests_mock.Mocker() as mock:
+        batch = mock.post(
+            f"{URL}api/v1/run-params/batch/",
+            json=lambda request, _: [dict(record, **TIMESTAMPS) for record in request.json()],
+        )
+        client.runs.params.create_batch([CreateRunParamPayload(key="lr", value=0.1, run=1)])
+
+    assert batch.last_request.json() == [{"key": "lr", "value": 0.1, "run": 1}]
+
+
+def test_async_batch_falls_back_to_single_creates() -> None:
+    def handle(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/batch/"):
+            return httpx.Response(404, json={"detail": "Not found."})
+
+        return httpx.Response(201, json=dict(parse_qsl(request.content.decode()), **TIMESTAMPS))
+
+    async def create() -> list[str]:
+        session = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+        client = AsyncAutoMLFlowClient(URL, session=session)
+        results = [CreateRunResultPayload(key="acc", value=0.9, run=1)]
+        created = await client.runs.results.create_batch(results)
+        await session.aclose()
+        return [result.key for result in created]
+
+    assert asyncio.run(create()) == ["acc"]
+
+
+def test_system_metrics_flush_uploads_one_batch() -> None:
+    client = AutoMLFlowClient(base_url=URL)
+    monitor = SystemMetricsMonitor(1, client, flush_interval=10, monitors=[CPUMonitor()])
+    with requests_mock.Mocker() as mock:
+        single = mock.post(requests_mock.ANY, status_code=201)
+        batch = mock.post(f"{URL}api/v1/system-metrics/batch/", status_code=201)
+        for _ in range(3):
+            monitor.collect_metrics()
+        monitor.flush()
+        # Nothing was sampled since
+        monitor.flush()
+
+    assert (batch.call_count, single.call_count) == (1, 0)
+    payload = batch.last_request.json()
+    assert len(payload["cpu_stats"]) == 3
+    assert {sample["system"] for sample in payload["cpu_stats"]} == {1}
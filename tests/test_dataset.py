@@ -0,0 +1,50 @@
+from datetime import UTC, datetime
+
+import requests_mock
+
+from auto_ml_flow.client.v1 import AutoMLFlowClient
+from auto_ml_flow.client.v1.consts import DatasetFormat
+from auto_ml_flow.client.v1.models.runs import RunModel
+from auto_ml_flow.handlers.dataset import link_existing_dataset
+from auto_ml_flow.serializers.npy import NpySerializer
+
+URL = "http://tracking.test/"
+HASH = "blake2b:00"
+RUN = RunModel(
+    id=2,
+    created_at=datetime(2024, 1, 1, tzinfo=UTC),
+    updated_at=datetime(2024, 1, 1, tzinfo=UTC),
+    duration=None,
+    experiment=1,
+    traceback=None,
+)
+
+
+def dataset(id_: int, format_: DatasetFormat) -> dict:
+    return {
+        "id": id_,
+        "n_samples": 10,
+        "n_features": 2,
+        "run": 1,
+        "format": format_,
+        "hash": HASH,
+        "file": f"run_1.{format_.value}",
+    }
+
+
+def test_link_requires_the_same_format() -> None:
+    client = AutoMLFlowClient(base_url=URL)
+    with requests_mock.Mocker() as mock:
+        mock.get(f"{URL}api/v1/datasets/", json=[dataset(1, DatasetFormat.PICKLE)])
+        assert link_existing_dataset(RUN, HASH, client, serializer=NpySerializer()) is None
+
+        mock.get(
+            f"{URL}api/v1/datasets/",
+            json=[dataset(1, DatasetFormat.PICKLE), dataset(3, DatasetFormat.NPY)],
+        )
+        link = mock.post(f"{URL}api/v1/datasets/3/runs/", json=dataset(3, DatasetFormat.NPY))
+        linked = link_existing_dataset(RUN, HASH, client, serializer=NpySerializer())
+
+    assert linked is not None
+    assert linked.id == 3
+    assert link.call_count == 1
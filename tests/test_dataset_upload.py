@@ -0,0 +1,33 @@
+import itertools
+from concurrent.futures import CancelledError
+
+import numpy as np
+import pytest
+
+from auto_ml_flow.client.v1.models.datasets import DatasetModel
+from auto_ml_flow.dataset_upload import DatasetUpload
+from auto_ml_flow.serializers.hashing import hash_dataset
+
+
+def upload_with(upload: DatasetUpload) -> None:
+    chunks = upload.track(lambda: iter([b"data"]))
+    upload.run(lambda: DatasetModel.model_construct(size=len(b"".join(chunks()))))
+
+
+def test_uploads_of_a_run_report_at_distinct_steps() -> None:
+    reported: list[int] = []
+    steps = itertools.count()
+    upload_with(DatasetUpload(report=lambda _, step: reported.append(step), steps=steps))
+    upload_with(DatasetUpload(report=lambda _, step: reported.append(step), steps=steps))
+
+    # Not both at step 0, where the progress of the second would overwrite the first
+    assert reported == [0, 1]
+
+
+def test_cancel_stops_hashing() -> None:
+    upload = DatasetUpload()
+    upload.cancel()
+
+    assert upload.cancel_requested()
+    with pytest.raises(CancelledError):
+        hash_dataset(np.zeros((4, 2)), cancelled=upload.cancel_requested)
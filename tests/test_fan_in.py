@@ -0,0 +1,70 @@
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from auto_ml_flow import AutoMLFlow
+from auto_ml_flow.background import RunRecord
+from auto_ml_flow.client.v1 import AutoMLFlowClient
+from auto_ml_flow.fan_in import TOKEN_ENV, WorkerFanIn, WorkerLogger
+
+URL = "http://tracking.test/"
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.records: list[RunRecord] = []
+
+    def start(self) -> None: ...
+
+    def log(self, record: RunRecord) -> None:
+        self.records.append(record)
+
+    def finish(self, _: float) -> None: ...
+
+
+def wait_for(condition: object, timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:  # type: ignore[operator]
+        time.sleep(0.01)
+
+
+def test_reduce_over_connected_workers() -> None:
+    fan_in = WorkerFanIn(1, AutoMLFlowClient(base_url=URL), reduce="mean")
+    recorder = fan_in._background = Recorder()  # type: ignore[assignment]
+    token = fan_in.start().encode()
+
+    first, second = WorkerLogger(token), WorkerLogger(token)
+    wait_for(lambda: len(fan_in._workers) == 2)
+    first.log_metric("loss", 1, step=0)
+    second.log_metric("loss", 3, step=0)
+    first.close()
+    second.flush()
+    wait_for(lambda: len(fan_in._workers) == 1)
+
+    # The worker left, so the value of the other one is not kept waiting until the end
+    second.log_metric("loss", 5, step=1)
+    second.flush()
+    wait_for(lambda: len(recorder.records) == 2)
+    assert [(r.step, r.value) for r in recorder.records] == [(0, 2), (1, 5)]
+
+    second.close()
+    fan_in.close()
+
+
+def test_token_environment_with_several_runs(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = AutoMLFlowClient(base_url=URL)
+    runs = iter([SimpleNamespace(id=1), SimpleNamespace(id=2)])
+    monkeypatch.setattr(AutoMLFlow, "_get_run", lambda: (client, next(runs)))
+    monkeypatch.setenv(TOKEN_ENV, "outer")
+
+    with AutoMLFlow.serve_workers() as first:
+        assert os.environ[TOKEN_ENV] == first
+        with AutoMLFlow.serve_workers():
+            # Workers inheriting the environment can't tell which run is theirs
+            assert TOKEN_ENV not in os.environ
+
+        assert os.environ[TOKEN_ENV] == first
+
+    assert os.environ[TOKEN_ENV] == "outer"
@@ -0,0 +1,85 @@
+# ruff: noqa: N802
+from types import SimpleNamespace
+
+import pytest
+
+from auto_ml_flow.metrics.gpu import NVMLDevices, get_gpu_name
+from auto_ml_flow.metrics.monitor.gpu import GPUMonitor
+
+
+class NVMLError(Exception): ...
+
+
+class FakeNVML:
+    """NVML bindings of a host with the given GPUs, the second without power readings."""
+
+    NVML_TEMPERATURE_GPU = 0
+    NVML_CLOCK_SM = 1
+
+    def __init__(self, names: list[str | bytes]) -> None:
+        self.names = names
+
+    def nvmlInit(self) -> None: ...
+
+    def nvmlDeviceGetCount(self) -> int:
+        return len(self.names)
+
+    def nvmlDeviceGetHandleByIndex(self, index: int) -> int:
+        return index
+
+    def nvmlDeviceGetName(self, handle: int) -> str | bytes:
+        return self.names[handle]
+
+    def nvmlDeviceGetUtilizationRates(self, handle: int) -> SimpleNamespace:
+        return SimpleNamespace(gpu=50 + handle)
+
+    def nvmlDeviceGetMemoryInfo(self, _: int) -> SimpleNamespace:
+        return SimpleNamespace(used=2 * 1024**3, total=16 * 1024**3)
+
+    def nvmlDeviceGetPowerUsage(self, handle: int) -> int:
+        if handle == 1:
+            raise NVMLError("Not Supported")
+
+        return 150_000
+
+    def nvmlDeviceGetTemperature(self, _: int, sensor: int) -> int:
+        assert sensor == self.NVML_TEMPERATURE_GPU
+        return 60
+
+    def nvmlDeviceGetClockInfo(self, _: int, clock: int) -> int:
+        assert clock == self.NVML_CLOCK_SM
+        return 1400
+
+
+def test_gpu_monitor_reads_every_device() -> None:
+    devices = NVMLDevices(FakeNVML(["A100", b"A100"]))  # type: ignore[arg-type]
+    monitor = GPUMonitor(devices)
+    monitor.collect_metrics()
+
+    assert monitor.available
+    assert monitor.metrics["gpu0_power_watts"] == 150
+    assert monitor.metrics["gpu1_utilization_percentage"] == 51
+    assert monitor.metrics["gpu1_sm_clock_mhz"] == 1400
+    # Unsupported readings are left out, not reported as zero
+    assert "gpu1_power_watts" not in monitor.metrics
+    assert [device.name for device in monitor.to_model(system=1).devices] == ["A100", "A100"]
+
+
+@pytest.mark.parametrize(
+    ("names", "expected"),
+    [([], None), (["T4"], "T4"), (["A100", "A100"], "A100 x 2"), (["A100", "T4"], "A100, T4")],
+)
+def test_gpu_name(names: list[str | bytes], expected: str | None) -> None:
+    assert get_gpu_name(NVMLDevices(FakeNVML(names))) == expected  # type: ignore[arg-type]
+
+
+def test_gpu_monitor_without_nvml() -> None:
+    class NoDriverNVML(FakeNVML):
+        def nvmlInit(self) -> None:
+            raise NVMLError("Driver Not Loaded")
+
+    monitor = GPUMonitor(NVMLDevices(NoDriverNVML(["A100"])))  # type: ignore[arg-type]
+    monitor.collect_metrics()
+
+    assert not monitor.available
+    assert monitor.metrics == {}
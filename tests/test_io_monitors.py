@@ -0,0 +1,80 @@
+from types import SimpleNamespace
+
+import pytest
+
+from auto_ml_flow.metrics.monitor.base import counter_rate
+from auto_ml_flow.metrics.monitor.disk_io import DiskIOMonitor
+from auto_ml_flow.metrics.monitor.network_io import NetworkIOMonitor
+from auto_ml_flow.metrics.procfs import DiskCounters, NetCounters
+
+
+class FakeProc:
+    """`/proc` reader returning the given snapshots, one per read, 2 seconds apart."""
+
+    def __init__(self, *snapshots: dict) -> None:
+        self.snapshots = [
+            SimpleNamespace(time=2.0 * i, **snapshot) for i, snapshot in enumerate(snapshots)
+        ]
+
+    def read(self) -> SimpleNamespace:
+        return self.snapshots.pop(0)
+
+
+def disk(read_bytes: int, busy_time: int = 0) -> DiskCounters:
+    return DiskCounters(
+        read_count=read_bytes // 512,
+        write_count=0,
+        read_bytes=read_bytes,
+        write_bytes=0,
+        busy_time=busy_time,
+    )
+
+
+def net(bytes_recv: int) -> NetCounters:
+    return NetCounters(bytes_recv=bytes_recv, packets_recv=0, bytes_sent=0, packets_sent=0)
+
+
+@pytest.mark.parametrize(
+    ("current", "previous", "elapsed", "rate"),
+    [(300, 100, 2, 100), (100, 100, 2, 0), (5, 2**32 - 1, 2, 0), (300, 100, 0, 0)],
+)
+def test_counter_rate(current: float, previous: float, elapsed: float, rate: float) -> None:
+    assert counter_rate(current, previous, elapsed) == rate
+
+
+def test_disk_io_rates_from_the_start_and_after_a_reset() -> None:
+    proc = FakeProc(
+        {"disks": {"sda": disk(1024)}},
+        {"disks": {"sda": disk(5120, busy_time=1000)}},
+        # The counters were reset, e.g. the device was re-attached
+        {"disks": {"sda": disk(512, busy_time=100)}},
+    )
+    monitor = DiskIOMonitor(devices=["sda"], proc=proc)  # type: ignore[arg-type]
+
+    # The first sample is measured against the counters read at start
+    monitor.collect_metrics()
+    assert monitor.metrics["disk_io_sda_read_bytes_per_second"] == 2048
+    assert monitor.metrics["disk_io_sda_read_iops"] == 4
+    assert monitor.metrics["disk_io_sda_busy_percentage"] == 50
+
+    monitor.collect_metrics()
+    assert monitor.metrics["disk_io_sda_read_bytes_per_second"] == 0
+    assert monitor.metrics["disk_io_sda_busy_percentage"] == 0
+
+
+def test_network_io_skips_an_interface_until_it_has_two_samples() -> None:
+    proc = FakeProc(
+        {"interfaces": {"eth0": net(0)}},
+        {"interfaces": {"eth0": net(2000), "wg0": net(10**9)}},
+        {"interfaces": {"eth0": net(4000), "wg0": net(10**9 + 600)}},
+    )
+    monitor = NetworkIOMonitor(proc=proc)  # type: ignore[arg-type]
+
+    monitor.collect_metrics()
+    assert [interface.interface for interface in monitor.to_model(1).interfaces] == ["eth0"]
+    assert "network_io_wg0_receive_bytes_per_second" not in monitor.metrics
+
+    monitor.collect_metrics()
+    assert monitor.metrics["network_io_eth0_receive_bytes_per_second"] == 1000
+    # Not the total received before the interface was seen
+    assert monitor.metrics["network_io_wg0_receive_bytes_per_second"] == 300
@@ -0,0 +1,34 @@
+from pathlib import Path
+
+import pytest
+
+from auto_ml_flow.client.v1.models.systems import SystemInfoModel
+from auto_ml_flow.handlers import predict
+from auto_ml_flow.metrics.cgroup import Cgroup
+
+SYSTEM_INFO = SystemInfoModel(
+    cpu_name="cpu",
+    ram=1,
+    ram_available=1,
+    swap=1,
+    swap_available=1,
+    load_avg_last_min=0,
+    load_avg_last_5_min=0,
+    load_avg_last_15_min=0,
+)
+
+
+def test_features_are_measured_against_cgroup_limits(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "cpu.max").write_text("100000 100000\n")
+    (tmp_path / "cpu.stat").write_text("usage_usec 1000\n")
+    (tmp_path / "memory.max").write_text(f"{1 << 30}\n")
+    (tmp_path / "memory.current").write_text(f"{512 << 20}\n")
+    (tmp_path / "memory.stat").write_text("inactive_file 0\n")
+    monkeypatch.setattr(predict, "get_cgroup", lambda: Cgroup(tmp_path, root=tmp_path))
+
+    features = predict.get_training_time_features(SYSTEM_INFO, n_features=4, n_samples=100)
+
+    assert features.avg_memory_usage_megabytes == 512
+    assert features.avg_memory_usage_percentage == 50
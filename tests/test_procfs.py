@@ -0,0 +1,132 @@
+from pathlib import Path
+
+import pytest
+
+from auto_ml_flow.metrics.procfs import (
+    FILES,
+    CPUTimes,
+    DiskCounters,
+    MemoryInfo,
+    NetCounters,
+    ProcReader,
+    _parse_diskstats,
+    _parse_loadavg,
+    _parse_meminfo,
+    _parse_net_dev,
+    _parse_stat,
+)
+
+# Largest value of a 64-bit counter, right before it wraps
+MAX_COUNTER = 2**64 - 1
+
+STAT = b"""\
+cpu  100 20 30 400 50 6 7 8 90 10
+cpu0 50 10 15 200 25 3 3 4 45 5
+intr 123456 0 0
+ctxt 987654
+"""
+MEMINFO = b"""\
+MemTotal:       16000000 kB
+MemFree:         2000000 kB
+MemAvailable:    8000000 kB
+Buffers:          500000 kB
+Cached:          3000000 kB
+SwapTotal:       4000000 kB
+SwapFree:        3000000 kB
+HugePages_Total:       0
+Hugepagesize:       2048 kB
+"""
+NET_DEV = (
+    b"Inter-|   Receive                                                |  Transmit\n"
+    b" face |bytes    packets errs drop fifo frame compressed multicast|"
+    b"bytes    packets errs drop fifo colls carrier compressed\n"
+    + f"""\
+    lo: 5000 50 0 0 0 0 0 0 5000 50 0 0 0 0 0 0
+br-0a1b2c3d4e5f: 1000 10 0 0 0 0 0 0 2000 20 0 0 0 0 0 0
+wlp0s20f3:{MAX_COUNTER} 30 0 0 0 0 0 0 4000 40 0 0 0 0 0 0
+""".encode()
+)
+DISKSTATS = f"""\
+   7       0 loop0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0
+ 259       1 nvme0n1p1 100 0 2000 50 200 0 4000 80 0 300 130 0 0 0 0 0 0
+ 253       0 dm-0 1 0 8 0 2 0 16 0 0 5 0
+ 104       0 cciss/c0d0 10 0 {MAX_COUNTER} 0 20 0 40 0 0 7 0 0 0 0
+""".encode()
+LOADAVG = b"0.52 1.25 2.50 3/1200 45678\n"
+
+
+def test_parse_stat_leaves_guest_time_out() -> None:
+    # user nice system idle iowait irq softirq steal, without guest and guest_nice
+    assert _parse_stat(STAT) == CPUTimes(busy=171, total=621)
+
+
+def test_parse_meminfo() -> None:
+    assert _parse_meminfo(MEMINFO) == MemoryInfo(
+        total=16_000_000 * 1024,
+        available=8_000_000 * 1024,
+        swap_total=4_000_000 * 1024,
+        swap_free=3_000_000 * 1024,
+    )
+
+
+def test_parse_meminfo_without_mem_available() -> None:
+    old_kernel = b"\n".join(line for line in MEMINFO.splitlines() if b"MemAvailable" not in line)
+
+    # Free memory and caches, on kernels older than 3.14
+    assert _parse_meminfo(old_kernel).available == 5_500_000 * 1024
+
+
+def test_parse_net_dev() -> None:
+    interfaces = _parse_net_dev(NET_DEV)
+
+    assert list(interfaces) == ["lo", "br-0a1b2c3d4e5f", "wlp0s20f3"]
+    assert interfaces["br-0a1b2c3d4e5f"] == NetCounters(
+        bytes_recv=1000, packets_recv=10, bytes_sent=2000, packets_sent=20
+    )
+    # Counters too wide for the column leave no space after the colon
+    assert interfaces["wlp0s20f3"].bytes_recv == MAX_COUNTER
+
+
+def test_parse_diskstats() -> None:
+    disks = _parse_diskstats(DISKSTATS)
+
+    assert list(disks) == ["loop0", "nvme0n1p1", "dm-0", "cciss/c0d0"]
+    assert disks["nvme0n1p1"] == DiskCounters(
+        read_count=100,
+        write_count=200,
+        read_bytes=2000 * 512,
+        write_bytes=4000 * 512,
+        busy_time=300,
+    )
+    # Kernels older than 4.18 have no discard fields
+    assert disks["dm-0"].busy_time == 5
+    assert disks["cciss/c0d0"].read_bytes == MAX_COUNTER * 512
+
+
+def test_parse_loadavg() -> None:
+    assert _parse_loadavg(LOADAVG) == (0.52, 1.25, 2.5)
+
+
+@pytest.fixture
+def proc(tmp_path: Path) -> Path:
+    (tmp_path / "net").mkdir()
+    for name, content in zip(FILES, (STAT, MEMINFO, NET_DEV, DISKSTATS, LOADAVG), strict=True):
+        (tmp_path / name).write_bytes(content)
+
+    return tmp_path
+
+
+def test_reader_reads_files_again_and_grows_buffers(proc: Path) -> None:
+    reader = ProcReader(proc, buffer_size=16)
+    first = reader.read()
+    assert first.interfaces["lo"].bytes_recv == 5000
+    assert reader.read() is first
+
+    # The counter wrapped around, which is reported as it is, and left to the monitors
+    (proc / "net/dev").write_bytes(NET_DEV.replace(str(MAX_COUNTER).encode(), b"12"))
+    second = reader.read(max_age=0)
+    reader.close()
+
+    assert second is not first
+    assert second.interfaces["wlp0s20f3"].bytes_recv == 12
+    assert second.disks == first.disks
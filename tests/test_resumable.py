@@ -0,0 +1,104 @@
+import re
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+import requests
+import requests_mock
+
+from auto_ml_flow.client.resumable import ResumableUpload, get_checksum
+from auto_ml_flow.client.v1.api.uploads import DatasetUploadsClient
+from auto_ml_flow.client.v1.models.datasets import CreateDatasetPayload
+
+URL = "http://tracking.test/"
+UPLOADS = f"{URL}api/v1/datasets/uploads/"
+CONTENT = b"0123456789ab"
+DATASET = CreateDatasetPayload(n_samples=3, n_features=1, run=1, hash="blake2b:00")
+
+
+class UploadServer:
+    """Stand-in for the uploads API of the server, keeping uploads in memory."""
+
+    def __init__(self, mock: requests_mock.Mocker) -> None:
+        self.parts: dict[str, dict[int, bytes]] = {}
+        self.sent: list[int] = []
+        # Numbers of parts whose next copy arrives corrupted
+        self.corrupt: set[int] = set()
+        self.committed: list[dict] = []
+        mock.post(UPLOADS, json=self.create)
+        mock.get(re.compile(rf"{UPLOADS}(\w+)/$"), json=self.retrieve)
+        mock.put(re.compile(rf"{UPLOADS}(\w+)/parts/(\d+)/$"), json=self.put_part)
+        mock.post(re.compile(rf"{UPLOADS}(\w+)/commit/$"), json=self.commit)
+
+    def upload(self, id_: str) -> dict:
+        parts = [
+            {"number": number, "size": len(content), "checksum": get_checksum(content)}
+            for number, content in sorted(self.parts[id_].items())
+        ]
+        return {"id": id_, "file_name": "run_1.npy", "part_size": 4, "parts": parts}
+
+    def create(self, _: requests.PreparedRequest, __: object) -> dict:
+        id_ = f"u{len(self.parts)}"
+        self.parts[id_] = {}
+        return self.upload(id_)
+
+    def retrieve(self, request: requests.PreparedRequest, _: object) -> dict:
+        return self.upload(request.path_url.split("/")[-2])
+
+    def put_part(self, request: requests.PreparedRequest, _: object) -> dict:
+        segments = request.path_url.split("/")
+        id_, number = segments[-4], int(segments[-2])
+        content = bytes(request.body)
+        self.sent.append(number)
+        if number in self.corrupt:
+            self.corrupt.discard(number)
+            content = content[::-1]
+
+        self.parts[id_][number] = content
+        return {"number": number, "size": len(content), "checksum": get_checksum(content)}
+
+    def commit(self, request: requests.PreparedRequest, _: object) -> dict:
+        self.committed.append(request.json())
+        return {**request.json(), "id": 1, "file": "run_1.npy"}
+
+
+def chunks(fail_after: int | None = None) -> Iterator[bytes]:
+    for start in range(0, len(CONTENT), 4):
+        if fail_after is not None and start >= fail_after:
+            raise ConnectionResetError
+
+        yield CONTENT[start : start + 4]
+
+
+def test_interrupted_upload_resumes(tmp_path: Path) -> None:
+    with requests_mock.Mocker() as mock:
+        server = UploadServer(mock)
+        upload = ResumableUpload(
+            DatasetUploadsClient(URL), part_size=4, max_workers=1, tokens_dir=tmp_path
+        )
+        with pytest.raises(ConnectionResetError):
+            upload.upload(DATASET, "run_1.npy", lambda: chunks(fail_after=8))
+
+        assert sorted(server.sent) == [1, 2]
+
+        dataset = upload.upload(DATASET, "run_1.npy", chunks)
+
+    # Only the part the server didn't receive is sent again, to the same upload
+    assert dataset is not None
+    assert sorted(server.sent) == [1, 2, 3]
+    assert list(server.parts) == ["u0"]
+    assert b"".join(server.parts["u0"][number] for number in (1, 2, 3)) == CONTENT
+    assert [part["number"] for part in server.committed[0]["parts"]] == [1, 2, 3]
+    assert not list(tmp_path.iterdir())
+
+
+def test_corrupted_part_is_sent_again(tmp_path: Path) -> None:
+    with requests_mock.Mocker() as mock:
+        server = UploadServer(mock)
+        server.corrupt.add(2)
+        upload = ResumableUpload(DatasetUploadsClient(URL), part_size=4, tokens_dir=tmp_path)
+        dataset = upload.upload(DATASET, "run_1.npy", chunks)
+
+    assert dataset is not None
+    assert sorted(server.sent) == [1, 2, 2, 3]
+    assert server.parts["u0"][2] == CONTENT[4:8]
@@ -0,0 +1,111 @@
+import itertools
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from urllib.parse import parse_qsl
+
+import pytest
+import requests
+import requests_mock
+
+import auto_ml_flow
+from auto_ml_flow import AutoMLFlow
+
+URL = "http://tracking.test/"
+TIMESTAMPS = {"created_at": "2024-01-01T00:00:00", "updated_at": "2024-01-01T00:00:00"}
+
+
+class Server:
+    """Stand-in of the tracking server, numbering runs and keeping the metrics they get."""
+
+    def __init__(self, mock: requests_mock.Mocker) -> None:
+        self.ids = itertools.count(1)
+        self.metrics: list[tuple[int, str]] = []
+        self.lock = threading.Lock()
+        mock.get(f"{URL}api/v1/experiments/e/", json={"id": 1, "name": "e", **TIMESTAMPS})
+        mock.post(f"{URL}api/v1/runs/", json=self.create_run)
+        mock.patch(requests_mock.ANY, json=self.update_run)
+        mock.post(f"{URL}api/v1/run-metrics/", json=self.create_metric)
+
+    @staticmethod
+    def run(id_: int) -> dict:
+        return {"id": id_, "duration": None, "experiment": 1, "traceback": None, **TIMESTAMPS}
+
+    def create_run(self, _: requests.PreparedRequest, __: object) -> dict:
+        with self.lock:
+            return self.run(next(self.ids))
+
+    def update_run(self, request: requests.PreparedRequest, _: object) -> dict:
+        return self.run(int(request.path_url.split("/")[-2]))
+
+    def create_metric(self, request: requests.PreparedRequest, _: object) -> dict:
+        form = dict(parse_qsl(request.body))  # type: ignore[arg-type]
+        with self.lock:
+            self.metrics.append((int(form["run"]), form["key"]))
+
+        return {**form, **TIMESTAMPS}
+
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> Iterator[Server]:
+    AutoMLFlow.set_tracking_url(URL)
+    monkeypatch.setattr(auto_ml_flow, "get_system", lambda: None)
+    monitor = SimpleNamespace(finish=lambda: None)
+    monkeypatch.setattr(AutoMLFlow, "_start_monitor", lambda *_: monitor)
+    with requests_mock.Mocker() as mock:
+        server = Server(mock)
+        AutoMLFlow.start_experiment("e")
+        yield server
+
+
+def test_parallel_runs_in_a_thread_pool(server: Server) -> None:
+    barrier = threading.Barrier(4)
+
+    def trial(i: int) -> int:
+        with AutoMLFlow.start_run(f"trial {i}") as run:
+            # All runs are in progress at once
+            barrier.wait(5)
+            AutoMLFlow.log_metric(f"loss {i}", i)
+            assert AutoMLFlow.current_run() == run
+            return run.id
+
+    with ThreadPoolExecutor(4) as pool:
+        ids = list(pool.map(trial, range(4)))
+
+    assert sorted(ids) == [1, 2, 3, 4]
+    assert sorted(server.metrics) == sorted((id_, f"loss {i}") for i, id_ in enumerate(ids))
+    assert AutoMLFlow.current_run() is None
+
+
+@pytest.mark.usefixtures("server")
+def test_nested_run_restores_the_outer_run() -> None:
+    with AutoMLFlow.start_run("outer") as outer:
+        with AutoMLFlow.start_run("inner") as inner:
+            assert AutoMLFlow.current_run() == inner
+
+        assert AutoMLFlow.current_run() == outer
+
+    assert AutoMLFlow.current_run() is None
+
+
+@pytest.mark.usefixtures("server")
+def test_child_thread_logs_to_the_single_run() -> None:
+    found = []
+
+    def child() -> None:
+        found.append(AutoMLFlow.current_run())
+
+    with AutoMLFlow.start_run("run") as run:
+        thread = threading.Thread(target=child)
+        thread.start()
+        thread.join()
+        assert found == [run]
+
+        # With two runs in progress, a thread without a run of its own can't tell which
+        with AutoMLFlow.start_run("other"):
+            thread = threading.Thread(target=child)
+            thread.start()
+            thread.join()
+
+    assert found == [run, None]
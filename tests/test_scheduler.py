@@ -0,0 +1,98 @@
+import pytest
+
+from auto_ml_flow.metrics.monitor import scheduler as scheduler_module
+from auto_ml_flow.metrics.monitor.scheduler import FixedRateScheduler
+
+
+class FakeClock:
+    """Monotonic clock which only moves when waited on, or when work is done."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.stopped = False
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def is_set(self) -> bool:
+        return self.stopped
+
+    def wait(self, timeout: float | None = None) -> bool:
+        self.now += timeout or 0
+        return self.stopped
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(scheduler_module.time, "monotonic", clock.monotonic)
+    return clock
+
+
+def run(scheduler: FixedRateScheduler, clock: FakeClock, work: list[float]) -> list[float]:
+    """Times of the ticks, each followed by a sample taking the given time."""
+    ticks = []
+    for duration in work:
+        assert not scheduler.wait(clock)
+        ticks.append(clock.now - 100)
+        clock.now += duration
+
+    return ticks
+
+
+def test_ticks_keep_to_the_schedule_of_the_start(clock: FakeClock) -> None:
+    scheduler = FixedRateScheduler(1)
+
+    # Slow samples don't push back the next ticks
+    assert run(scheduler, clock, [0.3, 0.9, 0.1, 0]) == [0, 1, 2, 3]
+    assert scheduler.jitter_stats == {"mean": 0, "max": 0, "missed_ticks": 0}
+
+
+def test_late_tick_is_fired_at_once(clock: FakeClock) -> None:
+    scheduler = FixedRateScheduler(1)
+
+    assert run(scheduler, clock, [1.5, 0, 0]) == [0, 1.5, 2]
+    assert scheduler.jitter_stats == {"mean": 0.25, "max": 0.5, "missed_ticks": 0}
+
+
+def test_ticks_missed_entirely_are_skipped(clock: FakeClock) -> None:
+    scheduler = FixedRateScheduler(1)
+
+    # Ticks 1 and 2 are missed, tick 3 is fired late, and tick 4 is on time
+    assert run(scheduler, clock, [3.25, 0, 0]) == [0, 3.25, 4]
+    assert scheduler.jitter_stats["missed_ticks"] == 2
+    assert scheduler.jitter_stats["max"] == 0.25
+
+
+def test_wait_returns_when_stopped(clock: FakeClock) -> None:
+    scheduler = FixedRateScheduler(1)
+    clock.stopped = True
+
+    assert scheduler.wait(clock)
+
+
+def test_interval_backs_off_while_stable_and_resets_on_change() -> None:
+    scheduler = FixedRateScheduler(1, max_interval=4, stable_ticks=2)
+    for _ in range(3):
+        scheduler.observe([50.0])
+    assert scheduler.current_interval == 2
+
+    for _ in range(2):
+        scheduler.observe([50.5])
+    assert scheduler.current_interval == 4
+
+    # Within the tolerance, and capped at the maximum
+    for _ in range(2):
+        scheduler.observe([51.0])
+    assert scheduler.current_interval == 4
+
+    scheduler.observe([90.0])
+    assert scheduler.current_interval == 1
+
+
+def test_fixed_rate_without_max_interval() -> None:
+    scheduler = FixedRateScheduler(1)
+    for _ in range(10):
+        scheduler.observe([50.0])
+
+    assert scheduler.current_interval == 1
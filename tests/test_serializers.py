@@ -0,0 +1,51 @@
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from auto_ml_flow.serializers import NpySerializer
+from auto_ml_flow.serializers.hashing import hash_dataset
+
+ARRAYS = {
+    "float": np.arange(12, dtype=np.float32).reshape(3, 4),
+    "datetime": np.array(["2024-01-01", "2024-06-30"], dtype="datetime64[D]"),
+    "timedelta": np.array([1, 2, 3], dtype="timedelta64[s]"),
+    "empty rows": np.empty((0, 3)),
+    "empty columns": np.empty((3, 0)),
+    "scalar": np.array(1.5),
+    "fortran": np.asfortranarray(np.arange(12).reshape(3, 4)),
+    "strided": np.arange(24).reshape(6, 4)[::2],
+    "structured": np.array([(1, 2.0)], dtype=[("a", "i4"), ("b", "f8")]),
+}
+
+
+@pytest.mark.parametrize("array", ARRAYS.values(), ids=ARRAYS.keys())
+def test_npy_round_trip(array: np.ndarray) -> None:
+    serializer = NpySerializer(chunk_size=8)
+    assert serializer.supports(array)
+
+    content = b"".join(bytes(chunk) for chunk in serializer.chunks(array))
+    loaded = np.load(BytesIO(content))
+
+    assert loaded.dtype == array.dtype
+    np.testing.assert_array_equal(loaded, array)
+
+
+@pytest.mark.parametrize("array", ARRAYS.values(), ids=ARRAYS.keys())
+def test_hash_of_arrays(array: np.ndarray) -> None:
+    assert hash_dataset(array) == hash_dataset(array.copy(order="K"))
+
+
+def test_hash_of_dataframe_with_datetimes() -> None:
+    df = pd.DataFrame(
+        {
+            "time": pd.date_range("2024-01-01", periods=3),
+            "time_utc": pd.date_range("2024-01-01", periods=3, tz="UTC"),
+            "elapsed": pd.to_timedelta([1, 2, 3], unit="s"),
+            "value": [1.0, 2.0, 3.0],
+        }
+    )
+
+    assert hash_dataset(df) == hash_dataset(df.copy())
+    assert hash_dataset(df) != hash_dataset(df.iloc[:0])
@@ -0,0 +1,119 @@
+import contextlib
+import threading
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from multiprocessing import Pipe
+
+import numpy as np
+import pytest
+from loguru import logger
+from pydantic import BaseModel
+
+from auto_ml_flow.client.v1 import AutoMLFlowClient
+from auto_ml_flow.metrics.monitor.base import BaseMetricsMonitor
+from auto_ml_flow.metrics.monitor.sampler import SharedRingBuffer, sample
+from auto_ml_flow.metrics.monitor.shared import SharedMemorySystemMetricsMonitor
+
+URL = "http://tracking.test/"
+
+
+@pytest.fixture
+def buffer() -> Iterator[SharedRingBuffer]:
+    buffer = SharedRingBuffer.create(capacity=4, columns=2)
+    yield buffer
+    buffer.close()
+    buffer.shm.unlink()
+
+
+def test_ring_buffer_counts_rows_overwritten_before_read(buffer: SharedRingBuffer) -> None:
+    for i in range(3):
+        buffer.write(i, np.array([i, i * 10]))
+
+    timestamps, rows, lost = buffer.read()
+    assert (timestamps.tolist(), rows[:, 1].tolist(), lost) == ([0, 1, 2], [0, 10, 20], 0)
+
+    # Wraps around twice, so only the last rows are left
+    for i in range(3, 12):
+        buffer.write(i, np.array([i, i * 10]))
+
+    timestamps, rows, lost = buffer.read()
+    assert (timestamps.tolist(), rows[:, 0].tolist(), lost) == ([8, 9, 10, 11], [8, 9, 10, 11], 5)
+    assert buffer.read()[1].shape == (0, 2)
+
+
+class GrowingMonitor(BaseMetricsMonitor):
+    """Monitor reading one more metric every tick, stopping the sampling after six."""
+
+    stats_name = "cpu_stats"
+
+    def __init__(self, stop_event: threading.Event) -> None:
+        super().__init__()
+        self.stop_event = stop_event
+        self.ticks = 0
+
+    def collect_metrics(self) -> None:
+        self.ticks += 1
+        self._metrics = {f"m{i}": float(self.ticks) for i in range(min(self.ticks, 4))}
+        if self.ticks == 6:
+            self.stop_event.set()
+
+    def to_model(self, system: int) -> BaseModel:
+        raise NotImplementedError
+
+
+def test_sampler_sends_names_and_warns_once_at_the_column_limit(
+    buffer: SharedRingBuffer,
+) -> None:
+    warnings: list[str] = []
+    handler = logger.add(warnings.append, level="WARNING")
+    stop_event = threading.Event()
+    receiver, sender = Pipe(duplex=False)
+    try:
+        sample(
+            buffer_name=buffer.name,
+            capacity=buffer.capacity,
+            columns=buffer.columns,
+            interval=0.001,
+            max_interval=None,
+            monitors_factory=lambda: [GrowingMonitor(stop_event)],
+            names_conn=sender,
+            stop_event=stop_event,
+        )
+    finally:
+        logger.remove(handler)
+
+    names = []
+    # The sampler closes its end when it stops
+    with contextlib.suppress(EOFError):
+        while receiver.poll():
+            names.append(receiver.recv())
+
+    assert names == [["m0"], ["m0", "m1"]]
+    assert len(warnings) == 1
+    _, rows, lost = buffer.read()
+    assert lost == 2
+    assert rows.tolist() == [[3, 3], [4, 4], [5, 5], [6, 6]]
+
+
+def test_rows_written_after_new_names_keep_their_columns(buffer: SharedRingBuffer) -> None:
+    monitor = SharedMemorySystemMetricsMonitor(
+        1, AutoMLFlowClient(base_url=URL), flush_interval=10, columns=2
+    )
+    receiver, sender = Pipe(duplex=False)
+    monitor._buffer_reader, monitor._names_conn = buffer, receiver
+    sender.send(["m0"])
+    buffer.write(datetime.now(UTC).timestamp(), np.array([1.0, np.nan]))
+    read = buffer.read
+
+    def sampled_meanwhile() -> tuple[np.ndarray, np.ndarray, int]:
+        # The sampler finds a new metric while the reader is in the middle of a read
+        sender.send(["m0", "m1"])
+        buffer.write(datetime.now(UTC).timestamp(), np.array([2.0, 20.0]))
+        return read()
+
+    buffer.read = sampled_meanwhile  # type: ignore[method-assign]
+    monitor.read_samples()
+
+    assert monitor.aggregator is not None
+    stats = monitor.aggregator.run_stats()
+    assert (stats["m0"]["count"], stats["m1"]["count"], stats["m1"]["last"]) == (2, 1, 20)
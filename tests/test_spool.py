@@ -0,0 +1,50 @@
+from pathlib import Path
+
+import requests
+import requests_mock
+
+from auto_ml_flow.client.spool import Replayer, SpooledRequest
+
+URL = "http://tracking.test/"
+
+
+def line(request: SpooledRequest) -> bytes:
+    return request.model_dump_json().encode() + b"\n"
+
+
+def test_replay_skips_corrupted_lines_and_answers_without_id(tmp_path: Path) -> None:
+    path = tmp_path / "spool.wal"
+    path.write_bytes(
+        b'{"key": "1", "meth\x00\n'
+        + line(
+            SpooledRequest(
+                key="2", method="POST", path="/api/v1/runs/", form={"experiment": 1}, placeholder=-1
+            )
+        )
+        + line(
+            SpooledRequest(
+                key="3",
+                method="POST",
+                path="/api/v1/run-metrics/",
+                form={"key": "loss", "value": 0.5, "run": -1},
+            )
+        )
+        + line(
+            SpooledRequest(
+                key="4", method="POST", path="/api/v1/systems/", json_body={"name": "host"}
+            )
+        )
+    )
+
+    with requests_mock.Mocker() as mock:
+        runs = mock.post(f"{URL}api/v1/runs/", status_code=201, text="<html>Created</html>")
+        metrics = mock.post(f"{URL}api/v1/run-metrics/", status_code=201, json={})
+        systems = mock.post(f"{URL}api/v1/systems/", status_code=201, json={"id": 7})
+
+        replayer = Replayer(path, URL, requests.Session())
+        assert replayer.replay()
+
+    # The metric refers to the run which got no id, so it's skipped; the rest goes on
+    assert (runs.call_count, metrics.call_count, systems.call_count) == (1, 0, 1)
+    assert replayer.state.offset == path.stat().st_size
+    assert Replayer(path, URL, requests.Session()).state.offset == path.stat().st_size
@@ -0,0 +1,53 @@
+from concurrent.futures import BrokenExecutor, Future
+from typing import Any, Self
+
+import pytest
+
+import auto_ml_flow
+from auto_ml_flow import AutoMLFlow
+from auto_ml_flow.background import BackgroundLogger
+from auto_ml_flow.client.v1.models.experiments import ExperimentModel
+
+
+class BrokenPool:
+    """Pool whose processes die before running any trial."""
+
+    kwargs: dict[str, Any] = {}
+
+    def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
+        BrokenPool.kwargs = kwargs
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None: ...
+
+    def submit(self, *_: object) -> Future:
+        future: Future = Future()
+        future.set_exception(BrokenExecutor("A process died"))
+
+        return future
+
+
+def objective(params: dict[str, Any]) -> float:
+    return params["x"]
+
+
+def test_broken_pool_finishes_the_background_logger(monkeypatch: pytest.MonkeyPatch) -> None:
+    finished = []
+    monkeypatch.setattr(auto_ml_flow, "ProcessPoolExecutor", BrokenPool)
+    monkeypatch.setattr(BackgroundLogger, "finish", lambda self, _: finished.append(self))
+    AutoMLFlow.set_tracking_url("http://tracking.test/", pool_size=3)
+    monkeypatch.setattr(AutoMLFlow, "_experiment", ExperimentModel.model_construct(id=1))
+
+    with pytest.raises(BrokenExecutor):
+        AutoMLFlow.sweep(objective, {"x": [1, 2]})
+
+    assert len(finished) == 1
+    # Workers track the same way as the calling process
+    assert BrokenPool.kwargs["initargs"][0] == {
+        "url": "http://tracking.test/",
+        "pool_size": 3,
+        "agent": False,
+        "spool": False,
+    }
@@ -0,0 +1,38 @@
+from pathlib import Path
+
+import pytest
+
+from auto_ml_flow.metrics import system
+
+STATIC_FIELDS = {"cpu_name", "gpu_name", "cpu_limit", "ram", "swap"}
+
+
+def test_cached_system_matches_uncached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    uncached = system.get_system(use_cache=False)
+    # Written to the cache, then read from it
+    first, second = system.get_system(), system.get_system()
+
+    assert (tmp_path / "auto_ml_flow" / "system.json").exists()
+    for cached in (first, second):
+        assert cached.model_dump(include=STATIC_FIELDS) == uncached.model_dump(
+            include=STATIC_FIELDS
+        )
+
+
+def test_cache_is_keyed_by_host_boot(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    lookups = []
+
+    def get_cpu_name() -> str:
+        lookups.append(1)
+        return "CPU"
+
+    monkeypatch.setattr(system, "get_cpu_name", get_cpu_name)
+    monkeypatch.setattr(system, "get_gpu_name", lambda: None)
+    system.get_static_system_info(tmp_path)
+    system.get_static_system_info(tmp_path)
+    assert len(lookups) == 1
+
+    monkeypatch.setattr(system, "get_host_key", lambda: "host/rebooted")
+    assert system.get_static_system_info(tmp_path).key == "host/rebooted"
+    assert len(lookups) == 2
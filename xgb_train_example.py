@@ -74,9 +74,8 @@ def main():
         }
         
         # Log model parameters
-        for key, value in params.items():
-            AutoMLFlow.log_param(key, value)
-            
+        AutoMLFlow.log_params(params)
+
         # Train the model and store evaluation results
         eval_results = {}
         model = xgb.train(
@@ -87,8 +86,9 @@ def main():
         )
 
         # Log evaluation metrics at each step
-        for loss in eval_results["test"]["mlogloss"]:
-            AutoMLFlow.log_metric("log_loss", float(loss))
+        AutoMLFlow.log_metric_series(
+            "log_loss", [float(loss) for loss in eval_results["test"]["mlogloss"]]
+        )
 
         # Make predictions and evaluate the model
         y_proba = model.predict(dtest)
@@ -97,8 +97,7 @@ def main():
         acc = accuracy_score(y_test, y_pred)
 
         # Log final evaluation metrics and dataset details
-        AutoMLFlow.log_result("log_loss", loss)
-        AutoMLFlow.log_result("accuracy", acc)
+        AutoMLFlow.log_results({"log_loss": loss, "accuracy": acc})
 
 if __name__ == "__main__":
     main()